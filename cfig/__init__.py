@@ -4,3 +4,15 @@ from .config import *
 from .errors import *
 # noinspection PyUnresolvedReferences
 from .customtyping import *
+# noinspection PyUnresolvedReferences
+from .converters import *
+# noinspection PyUnresolvedReferences
+from .retry import *
+# noinspection PyUnresolvedReferences
+from .reload import *
+# noinspection PyUnresolvedReferences
+from .instrumentation import *
+# noinspection PyUnresolvedReferences
+from .snapshot import *
+# noinspection PyUnresolvedReferences
+from .shared import *
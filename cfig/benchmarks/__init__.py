@@ -0,0 +1,55 @@
+"""
+This package contains benchmarks measuring the performance of :mod:`cfig`.
+
+Each module contains a ``main`` function returning the results of its benchmarks as a :class:`dict` mapping their names to the number of seconds taken by a single run, or, for :mod:`cfig.benchmarks.memory`, to the number of bytes allocated, and can be run directly, for example::
+
+    $ python -m cfig.benchmarks.access
+
+All benchmarks can be run at once, emitting their results as JSON, with::
+
+    $ python -m cfig.benchmarks --output results.json
+"""
+
+import json
+import sys
+import timeit
+import typing as t
+import cfig
+import cfig.sources.env
+
+
+def measure(function: t.Callable[[], t.Any], *, number: int = 1, repeat: int = 5, setup: t.Callable[[], t.Any] = lambda: None) -> float:
+    """
+    Run ``function`` ``number`` times for ``repeat`` times, calling ``setup`` before each repetition, and return the seconds taken by a single call in the fastest repetition.
+    """
+
+    times = []
+    for _ in range(repeat):
+        setup()
+        times.append(timeit.timeit(function, number=number))
+    return min(times) / number
+
+
+def make_configuration(count: int, sources: t.Optional[list[cfig.sources.base.Source]] = None, *, prefix: str = "KEY_", compact: bool = False) -> cfig.Configuration:
+    """
+    Create a :class:`~cfig.config.Configuration` with ``count`` optional values converting their raw value to :class:`int`.
+    """
+
+    config = cfig.Configuration(sources=sources or [cfig.sources.env.EnvironmentSource(environment={})], compact=compact)
+
+    def resolver(val):
+        return int(val) if val is not None else None
+
+    for index in range(count):
+        config.optional(key=f"{prefix}{index}")(resolver)
+
+    return config
+
+
+def report(results: dict[str, t.Any], file: t.TextIO = sys.stdout) -> None:
+    """
+    Emit the given results as JSON.
+    """
+
+    json.dump(results, file, indent=4)
+    file.write("\n")
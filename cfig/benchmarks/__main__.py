@@ -0,0 +1,53 @@
+"""
+This module runs all benchmarks, emitting their results as JSON.
+"""
+
+import argparse
+import importlib
+import logging
+import platform
+import sys
+from cfig.benchmarks import report
+
+log = logging.getLogger(__name__)
+
+BENCHMARKS = (
+    "registration",
+    "memory",
+    "resolution",
+    "envfile",
+    "dotenv",
+    "access",
+    "contention",
+    "snapshot",
+    "tracing",
+    "cli",
+)
+"""
+The names of the modules containing the benchmarks to run.
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m cfig.benchmarks", description="Run the benchmarks of cfig, emitting their results as JSON.")
+    parser.add_argument("-o", "--output", type=argparse.FileType("w"), default=sys.stdout, help="file to write the results to")
+    parser.add_argument("benchmarks", nargs="*", default=BENCHMARKS, help="names of the benchmarks to run")
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.benchmarks:
+        module = importlib.import_module(f"cfig.benchmarks.{name}")
+        try:
+            results.update(module.main())
+        except ImportError as e:
+            log.warning("Skipping benchmark %r, as a dependency is missing: %s", name, e)
+
+    report({
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "results": results,
+    }, file=args.output)
+
+
+if __name__ == "__main__":
+    main()
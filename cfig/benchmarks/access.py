@@ -0,0 +1,48 @@
+"""
+This module benchmarks the access to values through proxies and through the namespace returned by :meth:`cfig.config.Configuration.freeze`.
+"""
+
+import timeit
+import cfig
+import cfig.sources.env
+from cfig.benchmarks import report
+
+
+def setup() -> cfig.Configuration:
+    """
+    Create a :class:`~cfig.config.Configuration` with a single optional value, and resolve it.
+    """
+
+    config = cfig.Configuration(sources=[cfig.sources.env.EnvironmentSource(environment={"EXAMPLE_NUMBER": "4"})])
+
+    @config.optional()
+    def EXAMPLE_NUMBER(val):
+        return int(val)
+
+    config.proxies.resolve()
+    return config
+
+
+def main(number: int = 1_000_000) -> dict[str, float]:
+    """
+    Access an attribute of the value ``number`` times in a tight loop in each way.
+
+    The ``installed`` way represents a value installed in a module by :meth:`cfig.config.Configuration.freeze`.
+    """
+
+    config = setup()
+    proxy = config.proxies["EXAMPLE_NUMBER"]
+    frozen = config.freeze()
+
+    namespace = {"proxy": proxy, "frozen": frozen, "installed": frozen.EXAMPLE_NUMBER}
+    results = {
+        "access.proxy": timeit.timeit("proxy.real", globals=namespace, number=number),
+        "access.frozen": timeit.timeit("frozen.EXAMPLE_NUMBER.real", globals=namespace, number=number),
+        "access.installed": timeit.timeit("installed.real", globals=namespace, number=number),
+    }
+
+    return {name: seconds / number for name, seconds in results.items()}
+
+
+if __name__ == "__main__":
+    report(main())
@@ -0,0 +1,31 @@
+"""
+This module benchmarks the rendering of the command line interface of a :class:`cfig.config.Configuration`.
+
+Requires the ``cli`` extra.
+"""
+
+import cfig.sources.env
+from cfig.benchmarks import measure, make_configuration, report
+
+
+def main(counts: tuple[int, ...] = (100, 1_000)) -> dict[str, float]:
+    """
+    Render the command line interface of configurations with the given counts of values, half of which are invalid.
+    """
+
+    import click.testing
+
+    runner = click.testing.CliRunner()
+    results = {}
+
+    for count in counts:
+        environment = {f"KEY_{index}": str(index) if index % 2 else "invalid" for index in range(count)}
+        config = make_configuration(count, sources=[cfig.sources.env.EnvironmentSource(environment=environment)])
+        root = config._click_root()
+        results[f"cli.{count}"] = measure(lambda: runner.invoke(root, []), setup=config.proxies.unresolve, repeat=3)
+
+    return results
+
+
+if __name__ == "__main__":
+    report(main())
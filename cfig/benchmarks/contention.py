@@ -0,0 +1,48 @@
+"""
+This module benchmarks many threads accessing the same unresolved proxy at once, whose resolver is run only once while the other threads wait for it.
+"""
+
+import hashlib
+import threading
+import cfig
+import cfig.sources.env
+from cfig.benchmarks import measure, report
+
+
+def main(counts: tuple[int, ...] = (1, 16, 256), rounds: int = 10_000) -> dict[str, float]:
+    """
+    Access a proxy from the given counts of threads at once, with a resolver hashing its raw value ``rounds`` times to simulate an expensive computation.
+    """
+
+    results = {}
+
+    config = cfig.Configuration(sources=[cfig.sources.env.EnvironmentSource(environment={"KEY": "value"})])
+
+    @config.required(key="KEY")
+    def resolver(val):
+        digest = val.encode()
+        for _ in range(rounds):
+            digest = hashlib.sha256(digest).digest()
+        return digest.hex()
+
+    for count in counts:
+        def access_concurrently():
+            barrier = threading.Barrier(count)
+
+            def access():
+                barrier.wait()
+                str(resolver)
+
+            threads = [threading.Thread(target=access) for _ in range(count)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        results[f"contention.first_access.{count}"] = measure(access_concurrently, setup=config.proxies.unresolve)
+
+    return results
+
+
+if __name__ == "__main__":
+    report(main())
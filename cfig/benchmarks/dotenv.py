@@ -0,0 +1,54 @@
+"""
+This module benchmarks the resolution of many values retrieved from a ``.env`` file via :class:`cfig.sources.dotenv.DotenvSource`.
+"""
+
+import pathlib
+import tempfile
+import cfig.sources.dotenv
+import cfig.sources.env
+from cfig.benchmarks import measure, make_configuration, report
+
+
+def main(counts: tuple[int, ...] = (1_000, 10_000)) -> dict[str, float]:
+    """
+    Resolve all values of configurations with the given counts of values, stored in a ``.env`` file.
+
+    The ``export`` results measure the alternative of parsing the file in advance and exporting its values to the environment, as a shell would do.
+    """
+
+    results = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory) / ".env"
+
+        for count in counts:
+            path.write_text("".join(f'export KEY_{index}="{index}"\n' for index in range(count)))
+
+            source = cfig.sources.dotenv.DotenvSource(path, environment={})
+            config = make_configuration(count, sources=[source])
+
+            def setup():
+                config.proxies.unresolve()
+                # Force the file to be parsed again, as it would at startup
+                source._signature = None
+
+            results[f"dotenv.cold.{count}"] = measure(config.proxies.resolve, setup=setup)
+            results[f"dotenv.warm.{count}"] = measure(config.proxies.resolve, setup=config.proxies.unresolve)
+
+            environment = {}
+            exported = make_configuration(count, sources=[cfig.sources.env.EnvironmentSource(environment=environment)])
+
+            def export():
+                environment.clear()
+                for line in path.read_text().splitlines():
+                    key, value = line.removeprefix("export ").split("=", 1)
+                    environment[key] = value.strip('"')
+                exported.proxies.resolve()
+
+            results[f"dotenv.export.{count}"] = measure(export, setup=exported.proxies.unresolve)
+
+    return results
+
+
+if __name__ == "__main__":
+    report(main())
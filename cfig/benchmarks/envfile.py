@@ -0,0 +1,35 @@
+"""
+This module benchmarks the resolution of many values retrieved from files via :class:`cfig.sources.envfile.EnvironmentFileSource`.
+"""
+
+import pathlib
+import tempfile
+import cfig.sources.envfile
+from cfig.benchmarks import measure, make_configuration, report
+
+
+def main(counts: tuple[int, ...] = (100, 1_000)) -> dict[str, float]:
+    """
+    Resolve all values of configurations with the given counts of values, each one stored in a separate file.
+    """
+
+    results = {}
+
+    with tempfile.TemporaryDirectory() as directory:
+        directory = pathlib.Path(directory)
+
+        for count in counts:
+            environment = {}
+            for index in range(count):
+                path = directory / f"key_{index}"
+                path.write_text(str(index))
+                environment[f"KEY_{index}_FILE"] = str(path)
+
+            config = make_configuration(count, sources=[cfig.sources.envfile.EnvironmentFileSource(environment=environment)])
+            results[f"envfile.cold.{count}"] = measure(config.proxies.resolve, setup=config.proxies.unresolve)
+
+    return results
+
+
+if __name__ == "__main__":
+    report(main())
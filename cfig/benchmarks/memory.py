@@ -0,0 +1,43 @@
+"""
+This module measures via :mod:`tracemalloc` the memory taken by each value of a :class:`cfig.config.Configuration`, with and without :attr:`~cfig.config.Configuration.compact` storage.
+"""
+
+import gc
+import tracemalloc
+from cfig.benchmarks import make_configuration, report
+
+
+def allocated(count: int, *, compact: bool) -> float:
+    """
+    Define ``count`` values via :func:`cfig.benchmarks.make_configuration`, and return the number of bytes still allocated afterwards for each of them, keys included.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before, _peak = tracemalloc.get_traced_memory()
+        config = make_configuration(count, compact=compact)
+        after, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del config
+    return (after - before) / count
+
+
+def main(counts: tuple[int, ...] = (1_000, 10_000, 100_000)) -> dict[str, float]:
+    """
+    Measure the bytes taken by each value of configurations with the given counts of values, for both storage modes.
+    """
+
+    results = {}
+
+    for count in counts:
+        results[f"memory.default.{count}"] = allocated(count, compact=False)
+        results[f"memory.compact.{count}"] = allocated(count, compact=True)
+
+    return results
+
+
+if __name__ == "__main__":
+    report(main())
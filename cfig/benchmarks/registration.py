@@ -0,0 +1,39 @@
+"""
+This module benchmarks the definition of many values in a :class:`cfig.config.Configuration`.
+"""
+
+import cfig
+import cfig.sources.env
+from cfig.benchmarks import measure, make_configuration, report
+
+
+def register_many(count: int) -> cfig.Configuration:
+    """
+    Define ``count`` optional values converting their raw value to :class:`int` in a single batch, via :meth:`cfig.config.Configuration.register_many`.
+    """
+
+    config = cfig.Configuration(sources=[cfig.sources.env.EnvironmentSource(environment={})])
+
+    def resolver(val):
+        return int(val) if val is not None else None
+
+    config.register_many({f"KEY_{index}": (resolver, False, None) for index in range(count)})
+    return config
+
+
+def main(counts: tuple[int, ...] = (1_000, 10_000, 50_000, 100_000)) -> dict[str, float]:
+    """
+    Define ``count`` values via :meth:`cfig.config.Configuration.optional` and via :meth:`cfig.config.Configuration.register_many`, for each of the given counts.
+    """
+
+    results = {}
+
+    for count in counts:
+        results[f"registration.decorator.{count}"] = measure(lambda: make_configuration(count), repeat=3)
+        results[f"registration.bulk.{count}"] = measure(lambda: register_many(count), repeat=3)
+
+    return results
+
+
+if __name__ == "__main__":
+    report(main())
@@ -0,0 +1,58 @@
+"""
+This module benchmarks the resolution of many values retrieved from multiple sources.
+"""
+
+import cfig.sources.env
+from cfig.benchmarks import measure, make_configuration, report
+
+
+def setup(count: int, sources: int) -> cfig.Configuration:
+    """
+    Create a :class:`~cfig.config.Configuration` with ``count`` values, retrieving them from ``sources`` environment sources, where only the last one contains the values.
+    """
+
+    environment = {f"KEY_{index}": str(index) for index in range(count)}
+    return make_configuration(count, sources=[
+        *(cfig.sources.env.EnvironmentSource(prefix=f"LAYER_{layer}_", environment=environment) for layer in range(sources - 1)),
+        cfig.sources.env.EnvironmentSource(environment=environment),
+    ])
+
+
+def setup_fields(count: int, sources: int) -> cfig.Configuration:
+    """
+    Like :func:`.setup`, but define the values via :meth:`~cfig.config.Configuration.field` instead of decorating a resolver.
+    """
+
+    environment = {f"KEY_{index}": str(index) for index in range(count)}
+    config = cfig.Configuration(sources=[
+        *(cfig.sources.env.EnvironmentSource(prefix=f"LAYER_{layer}_", environment=environment) for layer in range(sources - 1)),
+        cfig.sources.env.EnvironmentSource(environment=environment),
+    ])
+
+    for index in range(count):
+        config.field(f"KEY_{index}", int, default=None)
+
+    return config
+
+
+def main(counts: tuple[int, ...] = (100, 1_000, 10_000), sources: int = 3) -> dict[str, float]:
+    """
+    Resolve all values of configurations with the given counts of values, both when they are not resolved yet (cold) and when they already are (warm).
+    """
+
+    results = {}
+
+    for count in counts:
+        config = setup(count, sources)
+        results[f"resolution.cold.{count}"] = measure(config.proxies.resolve, setup=config.proxies.unresolve)
+        results[f"resolution.cold.parallel.{count}"] = measure(lambda: config.proxies.resolve(parallel=True), setup=config.proxies.unresolve)
+        results[f"resolution.warm.{count}"] = measure(config.proxies.resolve)
+
+        config = setup_fields(count, sources)
+        results[f"resolution.cold.fields.{count}"] = measure(config.proxies.resolve, setup=config.proxies.unresolve)
+
+    return results
+
+
+if __name__ == "__main__":
+    report(main())
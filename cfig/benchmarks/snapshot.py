@@ -0,0 +1,48 @@
+"""
+This module benchmarks restoring the values of a configuration from a :class:`cfig.snapshot.Snapshot`, compared to resolving them.
+"""
+
+import hashlib
+import pathlib
+import tempfile
+import cfig
+import cfig.sources.env
+from cfig.benchmarks import measure, report
+
+
+def main(counts: tuple[int, ...] = (100, 1_000), rounds: int = 1_000) -> dict[str, float]:
+    """
+    Resolve all values of configurations with the given counts of values, whose resolvers hash their raw value ``rounds`` times to simulate an expensive computation, and restore them from a snapshot file.
+    """
+
+    results = {}
+
+    def resolver(val):
+        digest = val.encode()
+        for _ in range(rounds):
+            digest = hashlib.sha256(digest).digest()
+        return digest.hex()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory) / "config.snapshot"
+
+        for count in counts:
+            environment = {f"KEY_{index}": str(index) for index in range(count)}
+            config = cfig.Configuration(sources=[cfig.sources.env.EnvironmentSource(environment=environment)])
+            for index in range(count):
+                config.required(key=f"KEY_{index}")(resolver)
+
+            results[f"snapshot.resolve.{count}"] = measure(config.proxies.resolve, setup=config.proxies.unresolve)
+            results[f"snapshot.save.{count}"] = measure(lambda: cfig.Snapshot.take(config).save(path), setup=config.proxies.unresolve)
+
+            def restore():
+                if not cfig.Snapshot.load(path).apply(config):
+                    raise RuntimeError("Snapshot was not applied.")
+
+            results[f"snapshot.restore.{count}"] = measure(restore, setup=config.proxies.unresolve)
+
+    return results
+
+
+if __name__ == "__main__":
+    report(main())
@@ -0,0 +1,46 @@
+"""
+This module benchmarks the overhead of the debug logging performed while retrieving values.
+"""
+
+import logging
+import cfig.sources.env
+from cfig.benchmarks import measure, make_configuration, report
+
+
+def main(count: int = 1_000, sources: int = 6) -> dict[str, float]:
+    """
+    Retrieve ``count`` values, which are only present in the last of ``sources`` sources, with debug logging disabled and enabled, returning the time spent per value.
+    """
+
+    environment = {f"KEY_{index}": str(index) for index in range(count)}
+    config = make_configuration(count, sources=[
+        *(cfig.sources.env.EnvironmentSource(prefix=f"LAYER_{layer}_", environment=environment) for layer in range(sources - 1)),
+        cfig.sources.env.EnvironmentSource(environment=environment),
+    ])
+    keys = list(config.proxies.keys())
+
+    def lookup():
+        for key in keys:
+            config._retrieve_value_optional(key)
+
+    log = logging.getLogger("cfig")
+    handler = logging.NullHandler()
+    previous_level = log.level
+
+    results = {}
+    try:
+        log.setLevel(logging.WARNING)
+        results["tracing.lookup.disabled"] = measure(lookup) / count
+
+        log.addHandler(handler)
+        log.setLevel(logging.DEBUG)
+        results["tracing.lookup.enabled"] = measure(lookup) / count
+    finally:
+        log.removeHandler(handler)
+        log.setLevel(previous_level)
+
+    return results
+
+
+if __name__ == "__main__":
+    report(main())
@@ -2,19 +2,38 @@
 This module defines the :class:`Configuration` class.
 """
 
+import asyncio
+import importlib
+import inspect
+import keyword
 import lazy_object_proxy
+import types
 import typing as t
 import logging
 import collections
+import collections.abc
+import sys
+import contextlib
+import concurrent.futures
 import textwrap
+import threading
+import time
 from . import errors
 from . import customtyping as ct
+from .instrumentation import Timing, Hook
+from .converters import Converter
+from .retry import Retry
 from cfig.sources.base import Source
 from cfig.sources.env import EnvironmentSource
 from cfig.sources.envfile import EnvironmentFileSource
+from cfig.sources.httpkv import HttpKVSource
+from cfig.sources.layered import LayeredSources
 
 log = logging.getLogger(__name__)
 
+# Debug messages emitted once per key or per source are formatted lazily, and guarded by `if __debug__:`,
+# so that they are compiled out entirely when running Python with the -O flag.
+
 
 class Configuration:
     """
@@ -34,72 +53,971 @@ class Configuration:
         An extended :class:`dict` with methods to perform some actions on the contained proxies.
         """
 
-        def resolve(self) -> dict[str, t.Any]:
+        def resolve(self, *, parallel: bool = False, max_workers: t.Optional[int] = None, max_processes: t.Optional[int] = None) -> dict[str, t.Any]:
             """
             Resolve all values of the proxies inside this dictionary.
 
+            Proxies are resolved in waves, so that each proxy is resolved after all the proxies it depends on; if a dependency fails to resolve, the proxies depending on it fail with :exc:`.errors.FailedDependencyError` without being resolved.
+
+            :param parallel: If :data:`True`, resolve the proxies of each wave concurrently in a :class:`~concurrent.futures.ThreadPoolExecutor`, running the resolvers defined with ``executor="process"`` in a :class:`~concurrent.futures.ProcessPoolExecutor` instead.
+            :param max_workers: The maximum number of threads to use if ``parallel`` is :data:`True`; see :class:`~concurrent.futures.ThreadPoolExecutor`.
+            :param max_processes: The maximum number of processes to use if ``parallel`` is :data:`True`; see :class:`~concurrent.futures.ProcessPoolExecutor`.
             :raises .errors.BatchResolutionFailure: If it was not possible to resolve at least one value.
             :returns: A :class:`dict` containing all the resolved, unproxied, values.
             """
 
+            with self.prefetch():
+                if parallel:
+                    return self._resolve_parallel(max_workers=max_workers, max_processes=max_processes)
+                else:
+                    return self._resolve_serial()
+
+        def _resolve_serial(self) -> dict[str, t.Any]:
+            """
+            Implementation of :meth:`.resolve` for when ``parallel`` is :data:`False`.
+            """
+
             errors_dict = {}
             result_dict = {}
 
             log.debug("Resolving and caching all proxied values...")
-            for key, proxy in self.items():
-                log.debug(f"Resolving: {proxy!r}")
+            for wave in self.waves():
+                wave = self._resolve_fields(wave, errors_dict, result_dict)
+                for key in wave:
+                    if dependency := self._find_failed_dependency(key, errors_dict):
+                        errors_dict[key] = errors.FailedDependencyError(dependency)
+                        continue
+
+                    proxy = self[key]
+                    if __debug__:
+                        log.debug("Resolving: %r", key)
+                    try:
+                        value = self._resolve_proxy(proxy)
+                    except Exception as e:
+                        errors_dict[key] = e
+                    else:
+                        result_dict[key] = value
+
+            if errors_dict:
+                raise errors.BatchResolutionFailure(errors=self._sort_like_self(errors_dict))
+
+            return self._sort_like_self(result_dict)
+
+        def _resolve_parallel(self, *, max_workers: t.Optional[int], max_processes: t.Optional[int]) -> dict[str, t.Any]:
+            """
+            Implementation of :meth:`.resolve` for when ``parallel`` is :data:`True`.
+            """
+
+            errors_dict = {}
+            result_dict = {}
+
+            log.debug("Resolving and caching all proxied values with up to %r threads...", max_workers)
+            with self._process_pool(max_processes) as processes, concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cfig") as executor:
+                for wave in self.waves():
+                    wave = self._resolve_fields(wave, errors_dict, result_dict)
+                    futures = {}
+                    for key in wave:
+                        if dependency := self._find_failed_dependency(key, errors_dict):
+                            errors_dict[key] = errors.FailedDependencyError(dependency)
+                        else:
+                            futures[key] = executor.submit(self._resolve_proxy, self[key], processes)
+
+                    for key, future in futures.items():
+                        try:
+                            value = future.result()
+                        except Exception as e:
+                            errors_dict[key] = e
+                        else:
+                            result_dict[key] = value
+
+            if errors_dict:
+                raise errors.BatchResolutionFailure(errors=self._sort_like_self(errors_dict))
+
+            return self._sort_like_self(result_dict)
+
+        def resolve_failfast(self, *, parallel: bool = False, max_workers: t.Optional[int] = None, max_processes: t.Optional[int] = None) -> dict[str, t.Any]:
+            """
+            Resolve all values of the proxies inside this dictionary, failing immediately if an error occurs during a resolution, and raising the error itself.
+
+            Proxies are resolved in waves, like in :meth:`.resolve`.
+
+            :param parallel: If :data:`True`, resolve the proxies of each wave concurrently like :meth:`.resolve` does, cancelling the resolutions which haven't started yet as soon as one fails.
+            :param max_workers: The maximum number of threads to use if ``parallel`` is :data:`True`; see :class:`~concurrent.futures.ThreadPoolExecutor`.
+            :param max_processes: The maximum number of processes to use if ``parallel`` is :data:`True`; see :class:`~concurrent.futures.ProcessPoolExecutor`.
+            :raises Exception: The error occurred during the resolution.
+            :returns: A :class:`dict` containing all the resolved, unproxied, values.
+            """
+
+            with self.prefetch():
+                if parallel:
+                    return self._resolve_failfast_parallel(max_workers=max_workers, max_processes=max_processes)
+                else:
+                    return self._resolve_failfast_serial()
+
+        def _resolve_failfast_serial(self) -> dict[str, t.Any]:
+            """
+            Implementation of :meth:`.resolve_failfast` for when ``parallel`` is :data:`False`.
+            """
+
+            result_dict = {}
+
+            log.debug("Resolving and caching all proxied values in failfast mode...")
+            for wave in self.waves():
+                wave = self._resolve_fields_failfast(wave, result_dict)
+                for key in wave:
+                    proxy = self[key]
+                    if __debug__:
+                        log.debug("Resolving: %r", key)
+                    value = self._resolve_proxy(proxy)
+                    result_dict[key] = value
+
+            return self._sort_like_self(result_dict)
+
+        def _resolve_failfast_parallel(self, *, max_workers: t.Optional[int], max_processes: t.Optional[int]) -> dict[str, t.Any]:
+            """
+            Implementation of :meth:`.resolve_failfast` for when ``parallel`` is :data:`True`.
+            """
+
+            result_dict = {}
+
+            log.debug("Resolving and caching all proxied values in failfast mode with up to %r threads...", max_workers)
+            with self._process_pool(max_processes) as processes:
+                executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cfig")
                 try:
-                    value = proxy.__wrapped__
+                    for wave in self.waves():
+                        wave = self._resolve_fields_failfast(wave, result_dict)
+                        futures = {key: executor.submit(self._resolve_proxy, self[key], processes) for key in wave}
+
+                        done, _ = concurrent.futures.wait(futures.values(), return_when=concurrent.futures.FIRST_EXCEPTION)
+                        for future in futures.values():
+                            if future in done and future.exception() is not None:
+                                log.debug("A resolution failed, cancelling the outstanding ones...")
+                                raise future.exception()
+
+                        for key, future in futures.items():
+                            result_dict[key] = future.result()
+                finally:
+                    # Resolutions already running cannot be interrupted, but the pending ones can be dropped
+                    executor.shutdown(wait=True, cancel_futures=True)
+
+            return self._sort_like_self(result_dict)
+
+        async def resolve_async(self) -> dict[str, t.Any]:
+            """
+            Resolve all values of the proxies inside this dictionary from inside an event loop.
+
+            Proxies are resolved in waves, like in :meth:`.resolve`; in each wave, proxies with asynchronous resolvers are awaited concurrently via :func:`asyncio.gather`, while the others are resolved in separate threads via :func:`asyncio.to_thread`.
+
+            :raises .errors.BatchResolutionFailure: If it was not possible to resolve at least one value.
+            :returns: A :class:`dict` containing all the resolved, unproxied, values.
+            """
+
+            errors_dict = {}
+            result_dict = {}
+
+            log.debug("Resolving and caching all proxied values asynchronously...")
+            with self.prefetch():
+                for wave in self.waves():
+                    wave = self._resolve_fields(wave, errors_dict, result_dict)
+                    pending = []
+                    for key in wave:
+                        if dependency := self._find_failed_dependency(key, errors_dict):
+                            errors_dict[key] = errors.FailedDependencyError(dependency)
+                        else:
+                            pending.append(key)
+
+                    results = await asyncio.gather(*(self._resolve_proxy_async(self[key]) for key in pending), return_exceptions=True)
+
+                    for key, result in zip(pending, results):
+                        if isinstance(result, Exception):
+                            errors_dict[key] = result
+                        elif isinstance(result, BaseException):
+                            raise result
+                        else:
+                            result_dict[key] = result
+
+            if errors_dict:
+                raise errors.BatchResolutionFailure(errors=self._sort_like_self(errors_dict))
+
+            return self._sort_like_self(result_dict)
+
+        @staticmethod
+        async def _resolve_proxy_async(proxy) -> t.Any:
+            """
+            Resolve a single proxy for :meth:`.resolve_async`, caching the result in it.
+            """
+
+            if proxy.__resolved__:
+                return proxy.__wrapped__
+
+            factory = proxy.__factory__
+            if isinstance(factory, Configuration.Factory) and factory.asynchronous:
+                if __debug__:
+                    log.debug("Awaiting: %r", factory)
+                value = await factory.call_async()
+                proxy.__wrapped__ = value
+                return value
+
+            if __debug__:
+                log.debug("Resolving in a thread: %r", proxy.__factory__)
+            return await asyncio.to_thread(Configuration.ProxyDict._resolve_proxy, proxy)
+
+        @staticmethod
+        def _resolve_proxy(proxy, processes: t.Optional[concurrent.futures.Executor] = None) -> t.Any:
+            """
+            Resolve a single proxy, caching the result in it.
+
+            For proxies created by a :class:`.Configuration`, the factory is called directly, as accessing ``__wrapped__`` on a proxy whose factory raises an error may call the factory twice.
+
+            If ``processes`` is given, it is passed to the factory, so that it can run there the resolvers defined with ``executor="process"``.
+            """
+
+            if proxy.__resolved__:
+                return proxy.__wrapped__
+
+            factory = proxy.__factory__
+            if isinstance(factory, Configuration.Factory):
+                value = factory(processes)
+                proxy.__wrapped__ = value
+                return value
+
+            return proxy.__wrapped__
+
+        def _resolve_fields(self, keys: t.Iterable[str], errors_dict: dict[str, Exception], result_dict: dict[str, t.Any]) -> list[str]:
+            """
+            Resolve at once the unresolved proxies with the given keys created via :meth:`.Configuration.field`, converting the raw values of all the fields of the same type with a single call to :meth:`~cfig.converters.Converter.convert_many`.
+
+            Fields which another thread is already resolving are left to the other resolution methods, which wait for them.
+
+            Values and errors are stored in the given dictionaries, like the other resolution methods do.
+
+            :returns: The keys of the other proxies, which still have to be resolved.
+            """
+
+            remaining = []
+            groups: dict[Converter, list[tuple[str, Configuration.Field]]] = {}
+            for key in keys:
+                proxy = self[key]
+                factory = proxy.__factory__
+                if isinstance(factory, Configuration.Field) and not proxy.__resolved__ and factory.begin() is None:
+                    groups.setdefault(factory.resolver, []).append((key, factory))
+                else:
+                    remaining.append(key)
+
+            pending = {factory for fields in groups.values() for _key, factory in fields}
+            try:
+                for converter, fields in groups.items():
+                    self._convert_fields(converter, fields, pending, errors_dict, result_dict)
+            except BaseException as e:
+                # Do not leave other threads waiting for values which will never be resolved
+                for factory in pending:
+                    factory.fail(e)
+                raise
+
+            return remaining
+
+        @staticmethod
+        def _convert_fields(converter: Converter, fields: list[tuple[str, "Configuration.Field"]], pending: set["Configuration.Field"], errors_dict: dict[str, Exception], result_dict: dict[str, t.Any]) -> None:
+            """
+            Resolve the given fields, whose resolution has been started via :meth:`.Factory.begin`, with a single call to the given converter, removing them from ``pending`` as soon as their resolution is completed.
+            """
+
+            if __debug__:
+                log.debug("Resolving %s fields with %r...", len(fields), converter)
+
+            present = []
+            raws = []
+            timings = []
+            for key, factory in fields:
+                configuration = factory.configuration
+                timing = configuration._start_timing(factory.key)
+                start = time.perf_counter()
+                factory.raw, factory.source = configuration._retrieve_value_and_source(factory.key)
+                timing.source = factory.source
+                timing.retrieval = time.perf_counter() - start
+
+                if factory.raw is not None:
+                    present.append((key, factory))
+                    raws.append(factory.raw)
+                    timings.append(timing)
+                    continue
+
+                pending.discard(factory)
+                if factory.required:
+                    errors_dict[key] = timing.error = error = errors.MissingValueError(factory.key)
+                    factory.fail(error)
+                else:
+                    result_dict[key] = factory.default
+                    factory.succeed(factory.default)
+                configuration._end_timing(timing)
+
+            start = time.perf_counter()
+            values, failures = converter.convert_many(raws)
+            # The time taken by the conversion is split evenly between the converted values
+            resolution = (time.perf_counter() - start) / max(len(raws), 1)
+
+            for index, ((key, factory), timing) in enumerate(zip(present, timings)):
+                timing.resolution = resolution
+                timing.attempts += 1
+                pending.discard(factory)
+                if (error := failures.get(index)) is not None:
+                    errors_dict[key] = timing.error = error
+                    factory.fail(error)
+                else:
+                    result_dict[key] = values[index]
+                    factory.succeed(values[index])
+                factory.configuration._end_timing(timing)
+
+
+        def _resolve_fields_failfast(self, keys: t.Iterable[str], result_dict: dict[str, t.Any]) -> list[str]:
+            """
+            Like :meth:`._resolve_fields`, but raise the first error which occurred, if any.
+            """
+
+            errors_dict = {}
+            remaining = self._resolve_fields(keys, errors_dict, result_dict)
+            for error in errors_dict.values():
+                raise error
+            return remaining
+
+        def dependencies(self, key: str) -> tuple[str, ...]:
+            """
+            Get the keys of the proxies inside this dictionary the proxy with the given key depends on.
+
+            Dependencies are read from :attr:`.Configuration.dependencies`; the ones on keys not contained in this dictionary are ignored.
+            """
+
+            factory = self[key].__factory__
+            if not isinstance(factory, Configuration.Factory):
+                return ()
+
+            return tuple(dependency for dependency in factory.configuration.dependencies.get(factory.key, ()) if dependency in self)
+
+        def waves(self) -> list[list[str]]:
+            """
+            Sort the keys of this dictionary topologically, grouping in the same wave the keys that can be resolved concurrently.
+
+            Every key is placed in a later wave than all the keys it depends on; inside a wave, keys are kept in the same order as in this dictionary.
+
+            :raises .errors.DependencyCycleError: If the dependencies of the proxies form a cycle.
+            """
+
+            remaining = {key: set(self.dependencies(key)) for key in self.keys()}
+            waves = []
+
+            while remaining:
+                wave = [key for key, dependencies in remaining.items() if not dependencies]
+
+                if not wave:
+                    # Configuration.register refuses cycles, but a dict might have been filled manually
+                    raise errors.DependencyCycleError(*remaining.keys())
+
+                for key in wave:
+                    del remaining[key]
+                for dependencies in remaining.values():
+                    dependencies.difference_update(wave)
+
+                waves.append(wave)
+
+            return waves
+
+        def _find_failed_dependency(self, key: str, errors_dict: dict[str, Exception]) -> t.Optional[str]:
+            """
+            Find a dependency of the given key which failed to resolve, returning :data:`None` if none of them did.
+            """
+
+            for dependency in self.dependencies(key):
+                if dependency in errors_dict:
+                    return dependency
+            return None
+
+        @contextlib.contextmanager
+        def prefetch(self) -> t.Iterator[None]:
+            """
+            Prefetch via :meth:`.Configuration.prefetch` the values of all the unresolved proxies inside this dictionary, grouping them by :class:`.Configuration`.
+            """
+
+            keys_by_configuration: dict[Configuration, list[str]] = {}
+            for proxy in self.values():
+                factory = proxy.__factory__
+                if isinstance(factory, Configuration.Factory) and not proxy.__resolved__:
+                    keys_by_configuration.setdefault(factory.configuration, []).append(factory.key)
+
+            with contextlib.ExitStack() as stack:
+                for configuration, keys in keys_by_configuration.items():
+                    stack.enter_context(configuration.prefetch(keys))
+                yield
+
+        @contextlib.contextmanager
+        def _process_pool(self, max_processes: t.Optional[int]) -> t.Iterator[t.Optional[concurrent.futures.ProcessPoolExecutor]]:
+            """
+            Create a :class:`~concurrent.futures.ProcessPoolExecutor` for the unresolved proxies inside this dictionary whose resolvers should run in a separate process, yielding :data:`None` if there are none.
+            """
+
+            for proxy in self.values():
+                factory = proxy.__factory__
+                if isinstance(factory, Configuration.Factory) and factory.executor == "process" and not proxy.__resolved__:
+                    break
+            else:
+                yield None
+                return
+
+            log.debug("Starting up to %r processes...", max_processes)
+            with concurrent.futures.ProcessPoolExecutor(max_workers=max_processes) as processes:
+                yield processes
+
+        def _sort_like_self(self, d: dict[str, t.Any]) -> dict[str, t.Any]:
+            """
+            Sort the keys of the given dictionary in the same order as the ones of this dictionary.
+            """
+
+            return {key: d[key] for key in self.keys() if key in d}
+
+        def unresolve(self) -> None:
+            """
+            Unresolve all values of the proxies inside this dictionary.
+            """
+
+            log.debug("Unresolving all cached values...")
+            for key, item in self.items():
+                if __debug__:
+                    log.debug("Unresolving: %r", key)
+                del item.__wrapped__
+
+    class DocDict(collections.abc.MutableMapping):
+        """
+        A :class:`dict`-like mapping of configuration keys to docstrings, used as :attr:`.Configuration.docs` by compact configurations.
+
+        The docstrings of the resolvers are not stored, but read from the :class:`.Factory` of the proxies every time they are requested; only the docstrings which differ from the ones of the resolvers are stored.
+        """
+
+        __slots__ = ("proxies", "_overrides")
+
+        REMOVED = object()
+        """
+        Sentinel value stored in :attr:`._overrides` for the keys whose docstring has been deleted.
+        """
+
+        def __init__(self, proxies: "Configuration.ProxyDict"):
+            self.proxies: "Configuration.ProxyDict" = proxies
+            """
+            The proxies whose resolvers contain the docstrings.
+            """
+
+            self._overrides: dict[str, t.Any] = {}
+            """
+            Dictionary mapping configuration keys to the docstrings which differ from the ones of their resolvers, or to :attr:`.REMOVED`.
+            """
+
+        def __repr__(self):
+            return f"<{self.__class__.__qualname__} with {len(self._overrides)} overrides>"
+
+        def _default(self, key: str) -> t.Any:
+            """
+            Get the docstring of the resolver of the proxy with the given key, or :attr:`.REMOVED` if there is no such resolver.
+            """
+
+            proxy = self.proxies.get(key)
+            if proxy is None:
+                return self.REMOVED
+
+            factory = proxy.__factory__
+            if not isinstance(factory, Configuration.Factory):
+                return self.REMOVED
+
+            return factory.resolver.__doc__
+
+        def __getitem__(self, key: str) -> t.Optional[str]:
+            doc = self._overrides.get(key, self.REMOVED)
+            if doc is self.REMOVED and key not in self._overrides:
+                doc = self._default(key)
+            if doc is self.REMOVED:
+                raise KeyError(key)
+            return doc
+
+        def __setitem__(self, key: str, doc: t.Optional[str]) -> None:
+            if doc is self._default(key):
+                self._overrides.pop(key, None)
+            else:
+                self._overrides[key] = doc
+
+        def __delitem__(self, key: str) -> None:
+            if key not in self:
+                raise KeyError(key)
+            if self._default(key) is self.REMOVED:
+                del self._overrides[key]
+            else:
+                self._overrides[key] = self.REMOVED
+
+        def __iter__(self) -> t.Iterator[str]:
+            for key in self.proxies.keys():
+                if key in self:
+                    yield key
+            for key, doc in list(self._overrides.items()):
+                if key not in self.proxies and doc is not self.REMOVED:
+                    yield key
+
+        def __len__(self) -> int:
+            return sum(1 for _ in self)
+
+    class Factory:
+        """
+        The callable used by a proxy to compute its value, keeping track of how the value should be retrieved and resolved.
+        """
+
+        __slots__ = ("configuration", "key", "resolver", "required", "executor", "raw", "source", "proxy")
+
+        UNRETRIEVED = object()
+        """
+        Sentinel value of :attr:`.raw` before the value is retrieved for the first time.
+        """
+
+        def __init__(self, configuration: "Configuration", key: str, resolver: ct.ResolverAny, required: bool, executor: str = "thread"):
+            self.configuration: "Configuration" = configuration
+            """
+            The :class:`.Configuration` the value should be retrieved from.
+            """
+
+            self.key: str = key
+            """
+            The configuration key of the value.
+            """
+
+            self.resolver: ct.ResolverAny = resolver
+            """
+            The user-defined function processing the value retrieved from the sources.
+            """
+
+            self.required: bool = required
+            """
+            Whether a missing value should raise :exc:`.errors.MissingValueError` instead of being passed as :data:`None` to the resolver.
+            """
+
+            self.executor: str = executor
+            """
+            Where the resolver should be run during a parallel resolution: ``"thread"`` for a thread of the current process, or ``"process"`` for a separate process.
+            """
+
+            self.raw: t.Optional[str] = self.UNRETRIEVED
+            """
+            The raw value retrieved the last time :meth:`.retrieve` was called, used by :meth:`.Configuration.reload` to determine if the value has changed.
+            """
+
+            self.source: t.Optional[Source] = None
+            """
+            The source :attr:`.raw` was retrieved from, or :data:`None` if no source had a value for the key.
+            """
+
+            self.proxy: t.Any = None
+            """
+            The proxy using this factory, set by :meth:`.Configuration._create_proxy`, which is resolved as soon as the value is available, before other threads waiting for it are woken up.
+            """
+
+        def __repr__(self):
+            return f"<{self.__class__.__qualname__} for {self.key!r}>"
+
+        @property
+        def asynchronous(self) -> bool:
+            """
+            Whether the resolver is a coroutine function.
+            """
+
+            return inspect.iscoroutinefunction(self.resolver)
+
+        def retrieve(self) -> t.Optional[str]:
+            """
+            Retrieve the raw value from the sources of the :attr:`.configuration`, storing it in :attr:`.raw` and the source it was retrieved from in :attr:`.source`.
+
+            :raises .errors.MissingValueError: If the value is :attr:`.required`, but it is not found in any source.
+            """
+
+            if __debug__:
+                log.debug("Retrieving value with key: %r", self.key)
+            val, self.source = self.configuration._retrieve_value_and_source(self.key)
+            self.raw = val
+
+            if self.required and val is None:
+                raise errors.MissingValueError(self.key)
+
+            if __debug__:
+                log.debug("Retrieved value successfully!")
+            return val
+
+        def begin(self) -> t.Optional[concurrent.futures.Future]:
+            """
+            Start resolving the value in the current thread, unless the value has already been resolved, or another thread is already resolving it.
+
+            Every call returning :data:`None` must be followed by a call to either :meth:`.succeed` or :meth:`.fail`.
+
+            :raises .errors.DependencyCycleError: If the current thread is already resolving the value, which means that the resolver accesses its own proxy.
+            :returns: :data:`None` if the current thread should resolve the value, or a :class:`~concurrent.futures.Future` which will contain it otherwise.
+            """
+
+            configuration = self.configuration
+            with configuration._inflight_lock:
+                if (inflight := configuration._inflight.get(self)) is not None:
+                    future, thread = inflight
+                    if thread == threading.get_ident():
+                        raise errors.DependencyCycleError(self.key, self.key)
+                    # The future is created only when a thread has to wait for it
+                    if future is None:
+                        future = inflight[0] = concurrent.futures.Future()
+                    configuration.contentions += 1
+                    return future
+
+                if (proxy := self.proxy) is not None and proxy.__resolved__:
+                    future = concurrent.futures.Future()
+                    future.set_result(proxy.__wrapped__)
+                    return future
+
+                configuration._inflight[self] = [None, threading.get_ident()]
+                return None
+
+        def succeed(self, value: t.Any) -> None:
+            """
+            Complete the resolution started via :meth:`.begin` with the given value, storing it in :attr:`.proxy` and passing it to the threads waiting for it.
+            """
+
+            configuration = self.configuration
+            with configuration._inflight_lock:
+                if (proxy := self.proxy) is not None:
+                    proxy.__wrapped__ = value
+                future, _thread = configuration._inflight.pop(self)
+            if future is not None:
+                future.set_result(value)
+
+        def fail(self, error: BaseException) -> None:
+            """
+            Complete the resolution started via :meth:`.begin` with the given error, raising it in the threads waiting for the value.
+            """
+
+            configuration = self.configuration
+            with configuration._inflight_lock:
+                future, _thread = configuration._inflight.pop(self)
+            if future is not None:
+                future.set_exception(error)
+
+        def __call__(self, processes: t.Optional[concurrent.futures.Executor] = None) -> t.Any:
+            """
+            Resolve the value via :meth:`.resolve`, ensuring that the resolver runs only once even if multiple threads access the proxy for the first time at once: the threads arriving while the value is being resolved wait for it, and receive the same value or error.
+            """
+
+            if (future := self.begin()) is not None:
+                if __debug__:
+                    log.debug("Waiting for the resolution in progress of %r...", self.key)
+                return future.result()
+
+            try:
+                value = self.resolve(processes)
+            except BaseException as e:
+                self.fail(e)
+                raise
+
+            self.succeed(value)
+            return value
+
+        def resolve(self, processes: t.Optional[concurrent.futures.Executor] = None) -> t.Any:
+            """
+            Retrieve and resolve the value synchronously, measuring the time taken via the :attr:`.Configuration.hooks`.
+
+            Asynchronous resolvers are run in a new event loop via :func:`asyncio.run`.
+
+            If :attr:`.executor` is ``"process"``, and ``processes`` is given, the resolver is run there via a :class:`.ResolverReference`, passing the raw value and the result between the processes via :mod:`pickle`.
+
+            :raises .errors.SynchronousAccessError: If the resolver is asynchronous, and an event loop is already running in the current thread.
+            """
+
+            timing = self.configuration._start_timing(self.key)
+            try:
+                start = time.perf_counter()
+                val = self.retrieve()
+                timing.source = self.source
+                timing.retrieval = time.perf_counter() - start
+
+                if __debug__:
+                    log.debug("Running user-defined configurable function...")
+                start = time.perf_counter()
+                timeout = self.configuration.timeouts.get(self.key)
+                retry = self.configuration.retries.get(self.key)
+                if timeout is None and retry is None:
+                    timing.attempts += 1
+                    val = self.run(val, processes)
+                else:
+                    val = self._run_with_policies(val, processes, timing, timeout, retry)
+
+                timing.resolution = time.perf_counter() - start
+                return val
+            except Exception as e:
+                timing.error = e
+                raise
+            finally:
+                self.configuration._end_timing(timing)
+
+        def run(self, val: t.Optional[str], processes: t.Optional[concurrent.futures.Executor] = None) -> t.Any:
+            """
+            Run the resolver once on the given raw value, as described in :meth:`.resolve`.
+            """
+
+            if processes is not None and self.executor == "process":
+                if __debug__:
+                    log.debug("Running user-defined configurable function in a separate process...")
+                val = processes.submit(Configuration.ResolverReference(self.resolver), val).result()
+            else:
+                val = self.resolver(val)
+
+            if inspect.isawaitable(val):
+                try:
+                    asyncio.get_running_loop()
+                except RuntimeError:
+                    if __debug__:
+                        log.debug("Running asynchronous configurable function in a new event loop...")
+                    val = asyncio.run(val)
+                else:
+                    val.close()
+                    raise errors.SynchronousAccessError(self.key)
+
+            return val
+
+        def _run_with_policies(self, val: t.Optional[str], processes: t.Optional[concurrent.futures.Executor], timing: Timing, timeout: t.Optional[float], retry: t.Optional[Retry]) -> t.Any:
+            """
+            Run the resolver via :meth:`.run` until it succeeds, as allowed by the given :attr:`.Configuration.timeouts` and :attr:`.Configuration.retries` policies, counting the attempts in the given timing.
+            """
+
+            deadline = time.monotonic() + timeout if timeout is not None else None
+            delays = retry.delays() if retry is not None else iter(())
+
+            while True:
+                timing.attempts += 1
+                try:
+                    if deadline is None:
+                        return self.run(val, processes)
+                    return self._run_until(deadline, timeout, val, processes)
                 except Exception as e:
-                    errors_dict[key] = e
+                    if retry is None or not retry.should_retry(e):
+                        raise
+                    delay = next(delays, None)
+                    if delay is None or (deadline is not None and time.monotonic() + delay >= deadline):
+                        raise
+                    if __debug__:
+                        log.debug("Retrying the resolution of %r in %.3f seconds after %r...", self.key, delay, e)
+                    time.sleep(delay)
+
+        def _run_until(self, deadline: float, timeout: float, val: t.Optional[str], processes: t.Optional[concurrent.futures.Executor]) -> t.Any:
+            """
+            Run the resolver via :meth:`.run` in a separate daemon thread, waiting for it until the given :func:`time.monotonic` deadline.
+
+            If the deadline passes, the thread is abandoned, as it cannot be interrupted, and its result is discarded.
+
+            :raises .errors.ResolutionTimeoutError: If the resolver does not complete before the deadline.
+            """
+
+            if self.asynchronous:
+                try:
+                    asyncio.get_running_loop()
+                except RuntimeError:
+                    pass
                 else:
-                    result_dict[key] = value
+                    raise errors.SynchronousAccessError(self.key)
+
+            future = concurrent.futures.Future()
+
+            def target():
+                future.set_running_or_notify_cancel()
+                try:
+                    future.set_result(self.run(val, processes))
+                except BaseException as e:
+                    future.set_exception(e)
+
+            threading.Thread(target=target, name=f"cfig-{self.key}", daemon=True).start()
+
+            try:
+                return future.result(timeout=max(deadline - time.monotonic(), 0))
+            except concurrent.futures.TimeoutError:
+                # The resolver itself may have raised a TimeoutError, or completed right after the deadline
+                if future.done():
+                    return future.result()
+                log.warning("The resolver of %r did not complete in %s seconds.", self.key, timeout)
+                raise errors.ResolutionTimeoutError(self.key, timeout) from None
+
+        async def call_async(self) -> t.Any:
+            """
+            Resolve the value via :meth:`.resolve_async`, ensuring that the resolver runs only once like :meth:`.__call__` does.
+            """
+
+            if (future := self.begin()) is not None:
+                if __debug__:
+                    log.debug("Waiting for the resolution in progress of %r...", self.key)
+                return await asyncio.wrap_future(future)
+
+            try:
+                value = await self.resolve_async()
+            except BaseException as e:
+                self.fail(e)
+                raise
+
+            self.succeed(value)
+            return value
+
+        async def resolve_async(self) -> t.Any:
+            """
+            Retrieve and resolve the value, awaiting the resolver if it is asynchronous, and measuring the time taken like :meth:`.resolve`.
+            """
+
+            timing = self.configuration._start_timing(self.key)
+            try:
+                start = time.perf_counter()
+                val = self.retrieve()
+                timing.source = self.source
+                timing.retrieval = time.perf_counter() - start
+
+                if __debug__:
+                    log.debug("Running user-defined configurable function...")
+                start = time.perf_counter()
+                timeout = self.configuration.timeouts.get(self.key)
+                retry = self.configuration.retries.get(self.key)
+                if timeout is None and retry is None:
+                    timing.attempts += 1
+                    val = self.resolver(val)
+
+                    if inspect.isawaitable(val):
+                        if __debug__:
+                            log.debug("Awaiting asynchronous configurable function...")
+                        val = await val
+                else:
+                    val = await self._run_with_policies_async(val, timing, timeout, retry)
+
+                timing.resolution = time.perf_counter() - start
+                return val
+            except Exception as e:
+                timing.error = e
+                raise
+            finally:
+                self.configuration._end_timing(timing)
+
+        async def _run_with_policies_async(self, val: t.Optional[str], timing: Timing, timeout: t.Optional[float], retry: t.Optional[Retry]) -> t.Any:
+            """
+            Like :meth:`._run_with_policies`, but awaiting the resolver, and cancelling it when the timeout expires.
+            """
+
+            deadline = time.monotonic() + timeout if timeout is not None else None
+            delays = retry.delays() if retry is not None else iter(())
+
+            while True:
+                timing.attempts += 1
+                try:
+                    result = self.resolver(val)
+                    if not inspect.isawaitable(result):
+                        return result
+                    if deadline is None:
+                        return await result
+
+                    task = asyncio.ensure_future(result)
+                    done, _pending = await asyncio.wait({task}, timeout=max(deadline - time.monotonic(), 0))
+                    if not done:
+                        task.cancel()
+                        log.warning("The resolver of %r did not complete in %s seconds.", self.key, timeout)
+                        raise errors.ResolutionTimeoutError(self.key, timeout)
+                    return task.result()
+                except Exception as e:
+                    if retry is None or not retry.should_retry(e):
+                        raise
+                    delay = next(delays, None)
+                    if delay is None or (deadline is not None and time.monotonic() + delay >= deadline):
+                        raise
+                    if __debug__:
+                        log.debug("Retrying the resolution of %r in %.3f seconds after %r...", self.key, delay, e)
+                    await asyncio.sleep(delay)
+
+    class Field(Factory):
+        """
+        The :class:`.Factory` of a proxy created via :meth:`.Configuration.field`, whose resolver is a :class:`~cfig.converters.Converter` shared with all the other fields of the same type.
+        """
+
+        __slots__ = ("default",)
+
+        NO_DEFAULT = object()
+        """
+        Sentinel value of :attr:`.default` for the fields without a default value, which are required.
+        """
+
+        def __init__(self, configuration: "Configuration", key: str, converter: Converter, default: t.Any = NO_DEFAULT):
+            super().__init__(configuration, key, converter, required=default is self.NO_DEFAULT)
+
+            self.default: t.Any = default
+            """
+            The value used if no source has a value for the key.
+            """
+
+        def resolve(self, processes: t.Optional[concurrent.futures.Executor] = None) -> t.Any:
+            value = super().resolve(processes)
+            return self.default if self.raw is None else value
+
+    class ResolverReference:
+        """
+        A picklable reference to a resolver, which can be called from another process to run the resolver there.
 
-            if errors_dict:
-                raise errors.BatchResolutionFailure(errors=errors_dict)
+        Since the decorated resolvers are replaced by their proxies, they cannot be pickled directly: instead, the reference imports again the module containing the proxy, and calls the resolver of its factory.
+        """
 
-            return result_dict
+        __slots__ = ("module", "qualname")
 
-        def resolve_failfast(self) -> dict[str, t.Any]:
+        def __init__(self, resolver: ct.ResolverAny):
+            self.module: str = resolver.__module__
+            """
+            The name of the module the resolver is defined in.
             """
-            Resolve all values of the proxies inside this dictionary, failing immediately if an error occurs during a resolution, and raising the error itself.
 
-            :raises Exception: The error occurred during the resolution.
-            :returns: A :class:`dict` containing all the resolved, unproxied, values.
+            self.qualname: str = resolver.__qualname__
+            """
+            The qualified name of the resolver inside :attr:`.module`.
             """
 
-            result_dict = {}
+        def __repr__(self):
+            return f"<{self.__class__.__qualname__} to {self.module}.{self.qualname}>"
 
-            log.debug("Resolving and caching all proxied values in failfast mode...")
-            for key, proxy in self.items():
-                log.debug(f"Resolving: {proxy!r}")
-                value = proxy.__wrapped__
-                result_dict[key] = value
+        def __getstate__(self):
+            return self.module, self.qualname
 
-            return result_dict
+        def __setstate__(self, state):
+            self.module, self.qualname = state
 
-        def unresolve(self) -> None:
+        def resolve(self) -> ct.ResolverAny:
             """
-            Unresolve all values of the proxies inside this dictionary.
+            Find the resolver, importing its module if necessary.
             """
 
-            log.debug("Unresolving all cached values...")
-            for item in self.values():
-                log.debug(f"Unresolving: {item!r}")
-                del item.__wrapped__
+            resolver = importlib.import_module(self.module)
+            for name in self.qualname.split("."):
+                resolver = getattr(resolver, name)
+
+            # Check the type directly, as isinstance would cause the proxy to resolve
+            if issubclass(type(resolver), lazy_object_proxy.Proxy):
+                resolver = resolver.__factory__.resolver
+
+            return resolver
+
+        def __call__(self, val: t.Optional[str]) -> t.Any:
+            return self.resolve()(val)
 
-    def __init__(self, *, sources: t.Optional[list[Source]] = None):
+    def __init__(self, *, sources: t.Optional[list[Source]] = None, compact: bool = False):
         """
         Create a new :class:`Configuration`.
+
+        :param compact: If :data:`True`, store as little as possible for each key, so that configurations with tens of thousands of keys take less memory; see :attr:`.compact`.
         """
 
-        log.debug(f"Initializing a new {self.__class__.__qualname__} object...")
+        log.debug("Initializing a new %s object...", self.__class__.__qualname__)
 
         self.sources: list[Source] = sources or self.DEFAULT_SOURCES
         """
         Collection of sources to use for values of this configuration.
         """
 
+        self.compact: bool = compact
+        """
+        Whether only the :attr:`.proxies` are stored for each key, with :attr:`.docs` read lazily from the resolvers via a :class:`.DocDict`, and :attr:`.dependencies` containing only the keys which have at least one dependency.
+        """
+
         self.proxies: Configuration.ProxyDict = Configuration.ProxyDict()
         """
         Dictionary mapping configuration keys belonging to this :class:`.Configuration` to the proxy caching their values.
@@ -107,14 +1025,72 @@ class Configuration:
         Typed with :class:`typing.Any` so that proxies can be typed as the object they cache.
         """
 
-        self.docs: dict[str, str] = {}
+        self.docs: t.MutableMapping[str, str] = Configuration.DocDict(self.proxies) if compact else {}
         """
         Dictionary mapping configuration keys belonging to this :class:`.Configuration` to a description of what they should contain.
         """
 
+        self.dependencies: dict[str, tuple[str, ...]] = {}
+        """
+        Dictionary mapping configuration keys belonging to this :class:`.Configuration` to the keys whose values their resolvers depend on.
+
+        If :attr:`.compact` is :data:`True`, keys without dependencies are not included.
+        """
+
+        self.callbacks: dict[str, list[t.Callable[[str, t.Any, t.Any], None]]] = {}
+        """
+        Dictionary mapping configuration keys belonging to this :class:`.Configuration` to the functions to call when :meth:`.reload` changes their value.
+        """
+
+        self.timeouts: dict[str, float] = {}
+        """
+        Dictionary mapping configuration keys belonging to this :class:`.Configuration` to the maximum number of seconds their resolution may take, retries included, after which it fails with :exc:`.errors.ResolutionTimeoutError`.
+
+        Synchronous resolvers with a timeout are run in a separate daemon thread, which is abandoned if the timeout expires; asynchronous ones are cancelled.
+
+        Keys without a timeout are not included.
+        """
+
+        self.retries: dict[str, Retry] = {}
+        """
+        Dictionary mapping configuration keys belonging to this :class:`.Configuration` to the :class:`~cfig.retry.Retry` policy to apply if their resolvers fail.
+
+        Keys without a policy are not included.
+        """
+
+        self.hooks: list[Hook] = []
+        """
+        List of :class:`~cfig.instrumentation.Hook` to notify about the resolution of the values of this :class:`.Configuration`.
+        """
+
+        self.timings: dict[str, Timing] = {}
+        """
+        Dictionary mapping configuration keys belonging to this :class:`.Configuration` to the :class:`~cfig.instrumentation.Timing` of their last resolution.
+        """
+
+        self._inflight: dict[Configuration.Factory, list] = {}
+        """
+        Dictionary mapping the factories whose values are being resolved to a :class:`list` containing the :class:`~concurrent.futures.Future` which threads waiting for the value wait on, or :data:`None` if no thread is waiting, and the identifier of the thread resolving it.
+        """
+
+        self._inflight_lock: threading.Lock = threading.Lock()
+        """
+        Lock protecting :attr:`._inflight`.
+        """
+
+        self.contentions: int = 0
+        """
+        The number of times a thread had to wait for the resolution of a value started by another thread.
+        """
+
+        self._prefetched: list[dict[str, tuple[t.Optional[str], t.Optional[Source]]]] = []
+        """
+        List of dictionaries mapping configuration keys to the values retrieved in advance by the :meth:`.prefetch` in progress and the sources they were retrieved from, from the oldest to the newest.
+        """
+
         log.debug("Initialized successfully!")
 
-    def optional(self, key: t.Optional[str] = None, doc: t.Optional[str] = None) -> ct.ProxyOptional:
+    def optional(self, key: t.Optional[str] = None, doc: t.Optional[str] = None, *, depends: t.Iterable[t.Any] = (), executor: str = "thread", timeout: t.Optional[float] = None, retry: t.Optional[Retry] = None) -> ct.ProxyOptional:
         """
         Mark a function as a resolver for a required configuration value.
 
@@ -124,9 +1100,21 @@ class Configuration:
             def MY_KEY(val: str) -> str:
                 return val
 
+        The resolver may also be a coroutine function, in which case the proxy should be resolved via :meth:`.ProxyDict.resolve_async`.
+
         Key can be overridden manually with the ``key`` parameter.
 
         Docstring can be overridden manually with the ``doc`` parameter.
+
+        If the resolver uses the values of other proxies, they should be specified, either as proxies or as keys, in the ``depends`` parameter, so that they are always resolved first::
+
+            @config.required(depends=[MY_KEY])
+            def MY_OTHER_KEY(val: str) -> str:
+                return f"{MY_KEY}/{val}"
+
+        If the resolver performs CPU-intensive work, ``executor="process"`` may be specified, so that it is run in a separate process when resolving in parallel via :meth:`.ProxyDict.resolve`; see :class:`.ResolverReference` for the limitations.
+
+        If the resolver may hang or fail because of transient errors, for example because it opens a connection, a ``timeout`` in seconds and a :class:`~cfig.retry.Retry` policy may be specified; see :attr:`.timeouts` and :attr:`.retries`.
         """
 
         def _decorator(configurable: ct.ResolverOptional) -> ct.TYPE:
@@ -136,14 +1124,16 @@ class Configuration:
             if not key:
                 log.debug("Determining key...")
                 key = self._find_resolver_key(configurable)
-                log.debug(f"Key is: {key!r}")
+                log.debug("Key is: %r", key)
 
             log.debug("Creating optional item...")
-            item: ct.TYPE = self._create_proxy_optional(key, configurable)
+            self._check_executor(configurable, executor)
+            item: ct.TYPE = self._create_proxy_optional(key, configurable, executor=executor)
             log.debug("Item created successfully!")
 
             log.debug("Registering item in the configuration...")
-            self.register(key, item, doc if doc is not None else configurable.__doc__)
+            self.register(key, item, doc if doc is not None else configurable.__doc__, depends=map(self._find_dependency_key, depends))
+            self._set_policies(key, timeout, retry)
             log.debug("Registered successfully!")
 
             # Return the created item, so it will take the place of the decorated function
@@ -151,7 +1141,7 @@ class Configuration:
 
         return _decorator
 
-    def required(self, key: t.Optional[str] = None, doc: t.Optional[str] = None) -> ct.ProxyRequired:
+    def required(self, key: t.Optional[str] = None, doc: t.Optional[str] = None, *, depends: t.Iterable[t.Any] = (), executor: str = "thread", timeout: t.Optional[float] = None, retry: t.Optional[Retry] = None) -> ct.ProxyRequired:
         """
         Mark a function as a resolver for a required configuration value.
 
@@ -161,9 +1151,21 @@ class Configuration:
             def MY_KEY(val: str) -> str:
                 return val
 
+        The resolver may also be a coroutine function, in which case the proxy should be resolved via :meth:`.ProxyDict.resolve_async`.
+
         Key can be overridden manually with the ``key`` parameter.
 
         Docstring can be overridden manually with the ``doc`` parameter.
+
+        If the resolver uses the values of other proxies, they should be specified, either as proxies or as keys, in the ``depends`` parameter, so that they are always resolved first::
+
+            @config.required(depends=[MY_KEY])
+            def MY_OTHER_KEY(val: str) -> str:
+                return f"{MY_KEY}/{val}"
+
+        If the resolver performs CPU-intensive work, ``executor="process"`` may be specified, so that it is run in a separate process when resolving in parallel via :meth:`.ProxyDict.resolve`; see :class:`.ResolverReference` for the limitations.
+
+        If the resolver may hang or fail because of transient errors, for example because it opens a connection, a ``timeout`` in seconds and a :class:`~cfig.retry.Retry` policy may be specified; see :attr:`.timeouts` and :attr:`.retries`.
         """
 
         def _decorator(configurable: ct.ResolverRequired) -> ct.TYPE:
@@ -173,14 +1175,16 @@ class Configuration:
             if not key:
                 log.debug("Determining key...")
                 key = self._find_resolver_key(configurable)
-                log.debug(f"Key is: {key!r}")
+                log.debug("Key is: %r", key)
 
             log.debug("Creating required item...")
-            item: ct.TYPE = self._create_proxy_required(key, configurable)
+            self._check_executor(configurable, executor)
+            item: ct.TYPE = self._create_proxy_required(key, configurable, executor=executor)
             log.debug("Item created successfully!")
 
             log.debug("Registering item in the configuration...")
-            self.register(key, item, doc if doc is not None else configurable.__doc__)
+            self.register(key, item, doc if doc is not None else configurable.__doc__, depends=map(self._find_dependency_key, depends))
+            self._set_policies(key, timeout, retry)
             log.debug("Registered successfully!")
 
             # Return the created item, so it will take the place of the decorated function
@@ -188,6 +1192,35 @@ class Configuration:
 
         return _decorator
 
+    def field(self, key: str, type_: t.Any, default: t.Any = Field.NO_DEFAULT, doc: t.Optional[str] = None) -> t.Any:
+        """
+        Define a configuration value converted into the given type, without writing a resolver::
+
+            WORKERS = config.field("WORKERS", int, default=4, doc="The number of workers to start.")
+
+        The raw value is converted by the :class:`~cfig.converters.Converter` of the type, which is built only once and shared by all fields of the same type; the resolution methods of :class:`.ProxyDict` convert the values of all these fields with a single call to it.
+
+        If ``default`` is not given, the value is required; invalid values cause :exc:`.errors.InvalidValueError` to be raised.
+
+        :raises .errors.UnsupportedTypeError: If the type is not supported by :class:`~cfig.converters.Converter`.
+        :returns: The proxy of the value.
+        """
+
+        converter = Converter.for_type(type_)
+        proxy = self._create_proxy(Configuration.Field(self, key, converter, default))
+        self.register(key, proxy, doc)
+        return proxy
+
+    def _set_policies(self, key: str, timeout: t.Optional[float], retry: t.Optional[Retry]) -> None:
+        """
+        Store the given policies of the value with the given key in :attr:`.timeouts` and :attr:`.retries`, if they are specified.
+        """
+
+        if timeout is not None:
+            self.timeouts[key] = timeout
+        if retry is not None:
+            self.retries[key] = retry
+
     # noinspection PyMethodMayBeStatic
     def _find_resolver_key(self, resolver: ct.ResolverAny) -> str:
         """
@@ -199,40 +1232,208 @@ class Configuration:
         try:
             return resolver.__name__
         except AttributeError:
-            log.error(f"Could not determine key of: {resolver!r}")
+            log.error("Could not determine key of: %r", resolver)
             raise errors.UnknownResolverNameError()
 
-    def _retrieve_value_optional(self, key: str) -> t.Optional[str]:
+    # noinspection PyMethodMayBeStatic
+    def _check_executor(self, resolver: ct.ResolverAny, executor: str) -> None:
         """
-        Try to retrieve a value from all :attr:`.sources` of this :class:`.Configuration`, returning :data:`None` if the value is not found anywhere.
+        Check that the resolver can be run by the given executor.
+
+        :raises .errors.InvalidExecutorError: If the executor is unknown, or if it is ``"process"`` and the resolver is asynchronous or not defined at the top level of a module.
+        """
+
+        if executor == "thread":
+            return
+        elif executor != "process":
+            log.error("Unknown executor: %r", executor)
+            raise errors.InvalidExecutorError(executor)
+
+        if inspect.iscoroutinefunction(resolver):
+            log.error("Asynchronous resolvers cannot run in a separate process: %r", resolver)
+            raise errors.InvalidExecutorError(executor, resolver)
+
+        if "<locals>" in getattr(resolver, "__qualname__", "<locals>"):
+            log.error("Resolvers running in a separate process must be defined at the top level of a module: %r", resolver)
+            raise errors.InvalidExecutorError(executor, resolver)
+
+    # noinspection PyMethodMayBeStatic
+    def _find_dependency_key(self, dependency: t.Any) -> str:
+        """
+        Find the key of a dependency, which can be either a proxy created by a :class:`.Configuration` or a key.
+
+        :raises .errors.UnknownDependencyError: If the dependency is neither a proxy created by a :class:`.Configuration` nor a :class:`str`.
+        """
+
+        # Check the type directly, as isinstance would cause the proxy to resolve
+        if issubclass(type(dependency), lazy_object_proxy.Proxy):
+            factory = dependency.__factory__
+            if isinstance(factory, Configuration.Factory):
+                return factory.key
+        elif isinstance(dependency, str):
+            return dependency
+
+        log.error("Could not determine key of dependency: %r", dependency)
+        raise errors.UnknownDependencyError(dependency)
+
+    def _find_dependency_path(self, start: str, end: str) -> t.Optional[list[str]]:
+        """
+        Find a path between two keys in the graph of :attr:`.dependencies`, returning :data:`None` if there is none.
+        """
+
+        stack = [[start]]
+        visited = set()
+
+        while stack:
+            path = stack.pop()
+            key = path[-1]
+
+            if key == end:
+                return path
+            if key in visited:
+                continue
+            visited.add(key)
+
+            for dependency in self.dependencies.get(key, ()):
+                stack.append([*path, dependency])
+
+        return None
+
+    def _retrieve_values_and_sources(self, keys: t.Iterable[str]) -> dict[str, tuple[t.Optional[str], t.Optional[Source]]]:
+        """
+        Try to retrieve multiple values from all :attr:`.sources` of this :class:`.Configuration` via :meth:`.Source.get_many`, along with the sources they were retrieved from, using :data:`None` for the values not found anywhere.
+
+        Each source is queried only once, and only for the keys which the previous sources had no value for.
+        """
+
+        result = dict.fromkeys(keys, (None, None))
+        pending = list(result.keys())
+
+        for source in self.sources:
+            if not pending:
+                break
+
+            if __debug__:
+                log.debug("Trying to retrieve %s values from %r...", len(pending), source)
+            values = source.get_many(pending)
+
+            remaining = []
+            for key in pending:
+                if value := values.get(key):
+                    result[key] = (value, source)
+                else:
+                    remaining.append(key)
+            pending = remaining
+
+        log.debug("No values found for %s keys.", len(pending))
+        return result
+
+    def _retrieve_values_optional(self, keys: t.Iterable[str]) -> dict[str, t.Optional[str]]:
+        """
+        Like :meth:`._retrieve_values_and_sources`, but without returning the sources.
         """
 
+        return {key: value for key, (value, _source) in self._retrieve_values_and_sources(keys).items()}
+
+    @contextlib.contextmanager
+    def prefetch(self, keys: t.Iterable[str]) -> t.Iterator[None]:
+        """
+        Retrieve the values with the given keys from all :attr:`.sources` in a single pass, and use them instead of querying the sources again until the context is exited.
+
+        It is used by :class:`.ProxyDict` to reduce the calls made to the sources during a resolution::
+
+            with config.prefetch(["MY_KEY", "MY_OTHER_KEY"]):
+                config.proxies.resolve()
+        """
+
+        log.debug("Prefetching values...")
+        prefetched = self._retrieve_values_and_sources(keys)
+        # Multiple threads may be prefetching at once, so each one adds and removes only its own values
+        self._prefetched.append(prefetched)
+
+        try:
+            yield
+        finally:
+            log.debug("Discarding prefetched values...")
+            self._prefetched.remove(prefetched)
+
+    def _retrieve_value_and_source(self, key: str) -> tuple[t.Optional[str], t.Optional[Source]]:
+        """
+        Try to retrieve a value from all :attr:`.sources` of this :class:`.Configuration`, along with the source it was retrieved from, returning :data:`None` for both if the value is not found anywhere.
+
+        If the value has been prefetched via :meth:`.prefetch`, the sources are not queried at all.
+        """
+
+        for prefetched in reversed(self._prefetched):
+            if key in prefetched:
+                if __debug__:
+                    log.debug("Using prefetched value for %r.", key)
+                return prefetched[key]
+
         for source in self.sources:
-            log.debug(f"Trying to retrieve {key!r} from {source!r}...")
+            if __debug__:
+                log.debug("Trying to retrieve %r from %r...", key, source)
             if value := source.get(key):
-                log.debug(f"Retrieved {key!r} from {source!r}: {value!r}")
-                return value
+                if __debug__:
+                    log.debug("Retrieved %r from %r: %r", key, source, value)
+                return value, source
         else:
-            log.debug(f"No values found for {key!r}, returning None.")
-            return None
+            if __debug__:
+                log.debug("No values found for %r, returning None.", key)
+            return None, None
 
-    def _create_proxy_optional(self, key: str, resolver: ct.ResolverOptional) -> ct.TYPE:
+    def _retrieve_value_optional(self, key: str) -> t.Optional[str]:
         """
-        Create, from a resolver, a proxy tolerating non-specified values.
+        Try to retrieve a value from all :attr:`.sources` of this :class:`.Configuration`, returning :data:`None` if the value is not found anywhere.
+
+        If the value has been prefetched via :meth:`.prefetch`, the sources are not queried at all.
         """
 
-        @lazy_object_proxy.Proxy
-        def _decorated():
-            log.debug(f"Retrieving value with key: {key!r}")
-            val = self._retrieve_value_optional(key)
-            log.debug("Retrieved value successfully!")
+        value, _source = self._retrieve_value_and_source(key)
+        return value
 
-            log.debug("Running user-defined configurable function...")
-            val = resolver(val)
+    def _start_timing(self, key: str) -> Timing:
+        """
+        Create a :class:`~cfig.instrumentation.Timing` for the resolution of the value with the given key, and notify the :attr:`.hooks` about the start of the resolution.
+        """
 
-            return val
+        for hook in self.hooks:
+            try:
+                hook.on_resolve_start(key)
+            except Exception as e:
+                log.exception("Error in %r at the start of the resolution of %r: %r", hook, key, e)
+
+        return Timing(key)
+
+    def _end_timing(self, timing: Timing) -> None:
+        """
+        Store the given :class:`~cfig.instrumentation.Timing` in :attr:`.timings`, and notify the :attr:`.hooks` about the end of the resolution.
+        """
+
+        self.timings[timing.key] = timing
+
+        for hook in self.hooks:
+            try:
+                hook.on_resolve_end(timing.key, timing)
+            except Exception as e:
+                log.exception("Error in %r at the end of the resolution of %r: %r", hook, timing.key, e)
+
+    # noinspection PyMethodMayBeStatic
+    def _create_proxy(self, factory: "Configuration.Factory") -> ct.TYPE:
+        """
+        Create a proxy using the given factory, and link the factory to it.
+        """
+
+        proxy = lazy_object_proxy.Proxy(factory)
+        factory.proxy = proxy
+        return proxy
+
+    def _create_proxy_optional(self, key: str, resolver: ct.ResolverOptional, executor: str = "thread") -> ct.TYPE:
+        """
+        Create, from a resolver, a proxy tolerating non-specified values.
+        """
 
-        return _decorated
+        return self._create_proxy(Configuration.Factory(self, key, resolver, required=False, executor=executor))
 
     def _retrieve_value_required(self, key: str) -> str:
         """
@@ -246,32 +1447,23 @@ class Configuration:
         else:
             raise errors.MissingValueError(key)
 
-    def _create_proxy_required(self, key: str, resolver: ct.ResolverRequired) -> ct.TYPE:
+    def _create_proxy_required(self, key: str, resolver: ct.ResolverRequired, executor: str = "thread") -> ct.TYPE:
         """
         Create, from a resolver, a proxy intolerant about non-specified values.
         """
 
-        @lazy_object_proxy.Proxy
-        def _decorated():
-            log.debug(f"Retrieving value with key: {key!r}")
-            val = self._retrieve_value_required(key)
-            log.debug("Retrieved val successfully!")
+        return self._create_proxy(Configuration.Factory(self, key, resolver, required=True, executor=executor))
 
-            log.debug("Running user-defined configurable function...")
-            val = resolver(val)
-
-            return val
-
-        return _decorated
-
-    def register(self, key, proxy, doc):
+    def register(self, key, proxy, doc, depends=()):
         """
         Register a new proxy in this Configuration.
 
         :param key: The configuration key to register the proxy to.
         :param proxy: The proxy to register in :attr:`.proxies`.
         :param doc: The docstring to register in :attr:`.docs`.
+        :param depends: The keys of the proxies the proxy depends on, to register in :attr:`.dependencies`.
         :raises .errors.DuplicateProxyNameError`: if the key already exists in either :attr:`.proxies` or :attr:`.docs`.
+        :raises .errors.DependencyCycleError`: if registering the dependencies would create a dependency cycle.
         """
 
         if key in self.proxies:
@@ -279,10 +1471,296 @@ class Configuration:
         if key in self.docs:
             raise errors.DuplicateProxyNameError(key)
 
-        log.debug(f"Registering proxy {proxy!r} in {key!r}")
+        depends = tuple(depends)
+        for dependency in depends:
+            if path := self._find_dependency_path(dependency, key):
+                raise errors.DependencyCycleError(key, *path)
+
+        log.debug("Registering proxy %r in %r", proxy, key)
         self.proxies[key] = proxy
-        log.debug(f"Registering doc {doc!r} in {key!r}")
+        log.debug("Registering doc %r in %r", doc, key)
         self.docs[key] = doc
+        if depends or not self.compact:
+            log.debug("Registering dependencies %r in %r", depends, key)
+            self.dependencies[key] = depends
+
+    def register_many(self, specs: t.Union[t.Mapping[str, ct.ResolverSpec], t.Iterable[tuple[str, ct.ResolverSpec]]]) -> dict[str, t.Any]:
+        """
+        Create and register in a single batch the proxies of many resolvers, for example for configurations generated from a schema::
+
+            config.register_many({
+                "WORKERS": (parse_int, True, "The number of workers to start."),
+                "DEBUG": (parse_bool, False, None),
+            })
+
+        Each spec is a :class:`tuple` containing the resolver, whether the value is required, and the docstring, or :data:`None` to use the one of the resolver.
+
+        All keys are validated in a single pass before registering anything, so that if one of them is invalid the configuration is left untouched.
+
+        The registered proxies have no dependencies, and run their resolvers in a thread; use :meth:`.required` and :meth:`.optional` for the values which need different options.
+
+        :param specs: A mapping, or an iterable of pairs, associating configuration keys to specs.
+        :raises .errors.DuplicateProxyNameError: If a key is already registered, or is specified multiple times.
+        :returns: A :class:`dict` mapping the configuration keys to the created proxies, in the same order as ``specs``.
+        """
+
+        if isinstance(specs, t.Mapping):
+            specs = specs.items()
+
+        created = {}
+        docs = {}
+        for key, (resolver, required, doc) in specs:
+            if key in created or key in self.proxies or key in self.docs:
+                log.error("Cannot register %r, as it is already registered.", key)
+                raise errors.DuplicateProxyNameError(key)
+
+            created[key] = self._create_proxy(Configuration.Factory(self, key, resolver, required))
+            docs[key] = doc if doc is not None else resolver.__doc__
+
+        log.debug("Registering %s proxies...", len(created))
+        # Update the underlying dict directly, avoiding a call to ProxyDict.__setitem__ for each key
+        self.proxies.data.update(created)
+        self.docs.update(docs)
+        if not self.compact:
+            self.dependencies.update(dict.fromkeys(created, ()))
+
+        return created
+
+    def dependents(self, keys: t.Iterable[str]) -> list[str]:
+        """
+        Find all the keys whose resolvers depend, directly or indirectly, on at least one of the given keys.
+
+        :returns: A :class:`list` of the found keys, in the same order as :attr:`.proxies`, not including the given keys.
+        """
+
+        keys = set(keys)
+        found = set()
+
+        changed = True
+        while changed:
+            changed = False
+            for key, dependencies in self.dependencies.items():
+                if key not in found and key not in keys and not (keys | found).isdisjoint(dependencies):
+                    found.add(key)
+                    changed = True
+
+        return [key for key in self.proxies.keys() if key in found]
+
+    def subscribe(self, key: str, callback: t.Callable[[str, t.Any, t.Any], None]) -> None:
+        """
+        Call the given function every time :meth:`.reload` changes the value with the given key.
+
+        The function is called with the key, the previous value and the new value as positional arguments.
+        """
+
+        self.callbacks.setdefault(key, []).append(callback)
+
+    def unsubscribe(self, key: str, callback: t.Callable[[str, t.Any, t.Any], None]) -> None:
+        """
+        Stop calling a function previously passed to :meth:`.subscribe`.
+        """
+
+        self.callbacks[key].remove(callback)
+
+    def reload(self, keys: t.Optional[t.Iterable[str]] = None) -> dict[str, t.Any]:
+        """
+        Retrieve again the values of the resolved proxies with the given keys, or of all of them, and resolve again only the ones whose raw value has changed, plus the ones depending on them.
+
+        Unresolved proxies are ignored, as they will retrieve the current value when they are resolved.
+
+        The index of the :class:`~cfig.sources.layered.LayeredSources` among the :attr:`.sources` is built again, and the values of the :class:`~cfig.sources.httpkv.HttpKVSource` are fetched again, before retrieving the values.
+
+        If a proxy fails to resolve again, it keeps its previous value and raw value, so that the next reload tries to resolve it again, and the error is raised after the other proxies have been reloaded.
+
+        :param keys: The keys of the values to check, or :data:`None` to check all of them.
+        :raises .errors.BatchResolutionFailure: If it was not possible to resolve again at least one value.
+        :returns: A :class:`dict` containing the new values of the proxies which have been resolved again.
+        """
+
+        if keys is None:
+            keys = self.proxies.keys()
+
+        resolved = [key for key in keys if self.proxies[key].__resolved__]
+
+        for source in self.sources:
+            if isinstance(source, (LayeredSources, HttpKVSource)):
+                source.refresh()
+
+        log.debug("Checking %s values for changes...", len(resolved))
+        raws = self._retrieve_values_optional(resolved)
+        changed = [key for key in resolved if raws[key] != self.proxies[key].__factory__.raw]
+
+        if not changed:
+            log.debug("No values have changed.")
+            return {}
+
+        affected = [*changed, *(key for key in self.dependents(changed) if self.proxies[key].__resolved__)]
+        log.debug("Reloading %s values...", len(affected))
+
+        proxies = Configuration.ProxyDict({key: proxy for key, proxy in self.proxies.items() if key in affected})
+        previous = {key: proxy.__wrapped__ for key, proxy in proxies.items()}
+        previous_raws = {key: (proxy.__factory__.raw, proxy.__factory__.source) for key, proxy in proxies.items()}
+        proxies.unresolve()
+
+        failure = None
+        try:
+            result_dict = proxies.resolve()
+        except errors.BatchResolutionFailure as fail:
+            failure = fail
+            for key in fail.errors:
+                log.debug("Restoring the previous value of %r...", key)
+                proxies[key].__wrapped__ = previous[key]
+                # Keep the raw value the previous value was resolved from, so that the next reload retries the resolution
+                factory = proxies[key].__factory__
+                factory.raw, factory.source = previous_raws[key]
+            result_dict = {key: proxy.__wrapped__ for key, proxy in proxies.items() if key not in fail.errors}
+
+        for key, value in result_dict.items():
+            for callback in self.callbacks.get(key, ()):
+                log.debug("Calling %r for %r...", callback, key)
+                callback(key, previous[key], value)
+
+        if failure:
+            raise failure
+
+        return result_dict
+
+    def prewarm(self, keys: t.Optional[t.Iterable[str]] = None, *, priority: t.Iterable[str] = ()) -> t.Union[concurrent.futures.Future, asyncio.Task]:
+        """
+        Start resolving in the background the values with the given keys, or all of them, so that the first accesses to their proxies do not have to wait for their resolvers::
+
+            config.prewarm(priority=["DATABASE_URI"])
+
+        If an event loop is running in the current thread, the values are resolved there via :meth:`.ProxyDict.resolve_async`; otherwise, they are resolved via :meth:`.ProxyDict.resolve` in a background daemon thread.
+
+        Proxies accessed while they are being resolved wait for the resolution in progress, instead of running their resolvers again.
+
+        :param keys: The keys of the values to resolve, or :data:`None` to resolve all of them.
+        :param priority: The keys of the values to resolve before all the others, together with the values they depend on.
+        :returns: An :class:`asyncio.Task` if an event loop is running, or a :class:`concurrent.futures.Future` otherwise, containing a :class:`dict` of the resolved values, or raising :exc:`.errors.BatchResolutionFailure` if at least one value could not be resolved.
+        """
+
+        batches = self._prewarm_batches(self.proxies.keys() if keys is None else keys, priority)
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            log.debug("Prewarming %s values in the running event loop...", sum(map(len, batches)))
+            return loop.create_task(self._prewarm_async(batches))
+
+        log.debug("Prewarming %s values in a background thread...", sum(map(len, batches)))
+        future = concurrent.futures.Future()
+        threading.Thread(target=self._prewarm_thread, args=(batches, future), name="cfig-prewarm", daemon=True).start()
+        return future
+
+    def _prewarm_batches(self, keys: t.Iterable[str], priority: t.Iterable[str]) -> list["Configuration.ProxyDict"]:
+        """
+        Split the given keys into the :class:`.ProxyDict` to resolve first, containing the ones with priority and their dependencies, and the one to resolve afterwards, containing the others.
+        """
+
+        first = set()
+        stack = list(priority)
+        while stack:
+            key = stack.pop()
+            if key not in first:
+                first.add(key)
+                stack.extend(self.dependencies.get(key, ()))
+
+        return [
+            Configuration.ProxyDict({key: proxy for key, proxy in self.proxies.items() if key in first}),
+            Configuration.ProxyDict({key: self.proxies[key] for key in keys if key not in first}),
+        ]
+
+    def _prewarm_thread(self, batches: list["Configuration.ProxyDict"], future: concurrent.futures.Future) -> None:
+        """
+        Resolve the given batches in order for :meth:`.prewarm` in a background thread, storing the result in the given future.
+        """
+
+        if not future.set_running_or_notify_cancel():
+            return
+
+        result_dict = {}
+        errors_dict = {}
+        try:
+            for batch in batches:
+                try:
+                    result_dict.update(batch.resolve())
+                except errors.BatchResolutionFailure as fail:
+                    errors_dict.update(fail.errors)
+                    result_dict.update({key: proxy.__wrapped__ for key, proxy in batch.items() if key not in fail.errors})
+        except BaseException as e:
+            log.exception("Could not prewarm values: %r", e)
+            future.set_exception(e)
+            return
+
+        if errors_dict:
+            log.warning("Could not prewarm %s values.", len(errors_dict))
+            future.set_exception(errors.BatchResolutionFailure(errors=errors_dict))
+        else:
+            log.debug("Prewarmed %s values.", len(result_dict))
+            future.set_result(result_dict)
+
+    async def _prewarm_async(self, batches: list["Configuration.ProxyDict"]) -> dict[str, t.Any]:
+        """
+        Resolve the given batches in order for :meth:`.prewarm` inside the running event loop.
+        """
+
+        result_dict = {}
+        errors_dict = {}
+        for batch in batches:
+            try:
+                result_dict.update(await batch.resolve_async())
+            except errors.BatchResolutionFailure as fail:
+                errors_dict.update(fail.errors)
+                result_dict.update({key: proxy.__wrapped__ for key, proxy in batch.items() if key not in fail.errors})
+
+        if errors_dict:
+            log.warning("Could not prewarm %s values.", len(errors_dict))
+            raise errors.BatchResolutionFailure(errors=errors_dict)
+
+        log.debug("Prewarmed %s values.", len(result_dict))
+        return result_dict
+
+    def freeze(self, *, module: t.Union[types.ModuleType, str, None] = None) -> tuple:
+        """
+        Resolve all values, and return them in an immutable, slotted namespace, so that code accessing them very often can avoid the overhead of the proxies.
+
+        The namespace is an instance of a :func:`~collections.namedtuple` whose fields are the keys of this :class:`.Configuration`, which therefore must be valid identifiers::
+
+            frozen = config.freeze()
+            frozen.MY_KEY
+
+        The namespace does not change after a :meth:`.reload`.
+
+        :param module: A module, or the name of a module, whose global variables containing proxies of this :class:`.Configuration` should be replaced with the resolved values; modules which imported the proxies with ``from ... import ...`` will keep using the proxies.
+        :raises .errors.UnfreezableKeyError: If some keys are not valid identifiers, or start with an underscore; it is raised before resolving any value.
+        :raises .errors.BatchResolutionFailure: If it was not possible to resolve at least one value.
+        :returns: The namespace containing the resolved values.
+        """
+
+        invalid = [key for key in self.proxies.keys() if not key.isidentifier() or keyword.iskeyword(key) or key.startswith("_")]
+        if invalid:
+            log.error("Cannot freeze keys which are not valid field names: %r", invalid)
+            raise errors.UnfreezableKeyError(*invalid)
+
+        log.debug("Freezing all values...")
+        values = self.proxies.resolve()
+        namespace = collections.namedtuple("FrozenConfiguration", values.keys())(**values)
+
+        if module is not None:
+            if isinstance(module, str):
+                module = sys.modules[module]
+
+            # Compare identities, as comparing proxies would compare the values they contain
+            keys_by_id = {id(proxy): key for key, proxy in self.proxies.items()}
+            for name, obj in list(vars(module).items()):
+                if (key := keys_by_id.get(id(obj))) is not None:
+                    log.debug("Replacing %s.%s with the value of %r...", module.__name__, name, key)
+                    setattr(module, name, values[key])
+
+        return namespace
 
     def _click_root(self):
         """
@@ -295,7 +1773,8 @@ class Configuration:
             raise errors.MissingDependencyError(f"To use {self.__class__.__qualname__}.cli, the `cli` optional dependency is needed.")
 
         @click.command()
-        def root():
+        @click.option("-t", "--timings", is_flag=True, help="Display the time taken to resolve each value.")
+        def root(timings: bool):
             click.secho(f"===== Configuration =====", fg="bright_white", bold=True)
             click.secho()
 
@@ -319,6 +1798,8 @@ class Configuration:
                         click.secho(f"{key_text} → Required, but not set.", fg="red")
                     elif isinstance(error, errors.InvalidValueError):
                         click.secho(f"{key_text} → {' '.join(error.args)}", fg="red")
+                    elif isinstance(error, errors.FailedDependencyError):
+                        click.secho(f"{key_text} → Depends on {error.args[0]}, which could not be resolved.", fg="red")
                     else:
                         click.secho(f"{key_text} → {error!r}", fg="white", bg="bright_red")
                 else:
@@ -333,10 +1814,37 @@ class Configuration:
                 click.secho(f"{doc}", fg="white")
                 click.secho()
 
+            if timings:
+                self._click_timings(key_padding)
+
             click.secho(f"===== End =====", fg="bright_white", bold=True)
 
         return root
 
+    def _click_timings(self, key_padding: int):
+        """
+        Display via :mod:`click` a table summarizing the :attr:`.timings` of this :class:`.Configuration`, from the slowest to the fastest.
+        """
+
+        import click
+
+        click.secho(f"===== Timings =====", fg="bright_white", bold=True)
+        click.secho()
+
+        # Weird padding hack, part 3
+        # noinspection PyStringFormat
+        click.secho(f"{{key:{key_padding}}} {'Retrieval':>10} {'Resolution':>10} {'Attempts':>8} Source".format(key="Key"), bold=True)
+
+        for timing in sorted(self.timings.values(), key=lambda t: t.total, reverse=True):
+            # noinspection PyStringFormat
+            key_text = f"{{key:{key_padding}}}".format(key=timing.key)
+            click.secho(
+                f"{key_text} {timing.retrieval * 1000:8.3f}ms {timing.resolution * 1000:8.3f}ms {timing.attempts:8} {timing.source!r}",
+                fg="red" if timing.error else "white",
+            )
+
+        click.secho()
+
     def cli(self):
         """
         Run the command-line interface.
@@ -0,0 +1,180 @@
+"""
+This module defines the :class:`.Converter` class, used by :meth:`cfig.config.Configuration.field` to convert raw values into typed ones.
+"""
+
+import logging
+import typing as t
+from . import errors
+
+log = logging.getLogger(__name__)
+
+
+class Converter:
+    """
+    A resolver converting raw values into a given type, built once per type via :meth:`.for_type` and shared by all the fields of that type.
+
+    Like any other resolver, it can be called with a single raw value; additionally, it can convert many raw values at once via :meth:`.convert_many`, which :class:`~cfig.config.Configuration.ProxyDict` uses to resolve all the fields of the same type with a single call.
+
+    The supported types are:
+
+    - :class:`str`, which keeps the raw value as it is;
+    - :class:`bool`, which accepts ``true``, ``yes``, ``on`` and ``1``, or ``false``, ``no``, ``off`` and ``0``, ignoring case;
+    - :class:`list`, :class:`tuple`, :class:`set` and :class:`frozenset`, optionally parameterized with the type of their items, which split the raw value on commas, like ``list[int]``;
+    - :data:`typing.Optional` of any supported type, which is converted like the type itself;
+    - any other class or callable accepting a single :class:`str`, such as :class:`int`, :class:`float`, :class:`pathlib.Path` or an :class:`enum.Enum`.
+    """
+
+    __slots__ = ("type", "function")
+
+    BOOLEANS: dict[str, bool] = {
+        "true": True,
+        "yes": True,
+        "on": True,
+        "1": True,
+        "false": False,
+        "no": False,
+        "off": False,
+        "0": False,
+    }
+    """
+    Dictionary mapping the lowercase raw values accepted by the :class:`bool` converter to their meaning.
+    """
+
+    COLLECTIONS: tuple[type, ...] = (list, tuple, set, frozenset)
+    """
+    The collection types whose raw values are split on commas.
+    """
+
+    _cache: dict[t.Any, "Converter"] = {}
+    """
+    Dictionary mapping types to the converters built for them by :meth:`.for_type`.
+    """
+
+    def __init__(self, type_: t.Any, function: t.Callable[[str], t.Any]):
+        self.type: t.Any = type_
+        """
+        The type the raw values are converted into.
+        """
+
+        self.function: t.Callable[[str], t.Any] = function
+        """
+        The function converting a single raw value, raising :exc:`ValueError` or :exc:`TypeError` if it is invalid.
+        """
+
+    def __repr__(self):
+        return f"<{self.__class__.__qualname__} to {self.name}>"
+
+    @property
+    def name(self) -> str:
+        """
+        The name of :attr:`.type`, as displayed to the user in errors.
+        """
+
+        return self.type.__name__ if isinstance(self.type, type) else repr(self.type)
+
+    @classmethod
+    def for_type(cls, type_: t.Any) -> "Converter":
+        """
+        Get the converter for the given type, building it the first time it is requested.
+
+        :raises .errors.UnsupportedTypeError: If the type is not supported.
+        """
+
+        try:
+            return cls._cache[type_]
+        except KeyError:
+            pass
+
+        converter = cls._cache[type_] = cls(type_, cls._build(type_))
+        if __debug__:
+            log.debug("Built %r.", converter)
+        return converter
+
+    @classmethod
+    def _build(cls, type_: t.Any) -> t.Callable[[str], t.Any]:
+        """
+        Build the function converting a single raw value into the given type.
+        """
+
+        if type_ is str:
+            return str
+
+        if type_ is bool:
+            booleans = cls.BOOLEANS
+
+            def parse_bool(raw: str) -> bool:
+                try:
+                    return booleans[raw.strip().lower()]
+                except KeyError:
+                    raise ValueError(raw) from None
+
+            return parse_bool
+
+        origin = t.get_origin(type_)
+        arguments = t.get_args(type_)
+
+        if origin is t.Union:
+            types = [argument for argument in arguments if argument is not type(None)]
+            if len(types) == 1 and len(arguments) == 2:
+                return cls.for_type(types[0]).function
+            raise errors.UnsupportedTypeError(type_)
+
+        if type_ in cls.COLLECTIONS or origin in cls.COLLECTIONS:
+            collection = origin or type_
+            if len(arguments) > 1 and arguments[1] is not Ellipsis:
+                raise errors.UnsupportedTypeError(type_)
+            item = cls.for_type(arguments[0] if arguments else str).function
+
+            def parse_collection(raw: str) -> t.Any:
+                return collection(map(item, (part.strip() for part in raw.split(",") if part.strip())))
+
+            return parse_collection
+
+        if origin is not None or not callable(type_):
+            raise errors.UnsupportedTypeError(type_)
+
+        return type_
+
+    def __call__(self, raw: t.Optional[str]) -> t.Any:
+        """
+        Convert a single raw value, or return :data:`None` if it is :data:`None`.
+
+        :raises .errors.InvalidValueError: If the raw value is not valid for :attr:`.type`.
+        """
+
+        if raw is None:
+            return None
+
+        try:
+            return self.function(raw)
+        except (ValueError, TypeError) as e:
+            raise errors.InvalidValueError(f"Not a valid {self.name}.") from e
+
+    def convert_many(self, raws: t.Sequence[str]) -> tuple[list[t.Any], dict[int, Exception]]:
+        """
+        Convert many raw values at once.
+
+        All values are first converted with a single :func:`map` call, which for builtin types such as :class:`int` runs without calling any Python function; only if one of them is invalid, they are converted again one by one, to find out which ones.
+
+        :returns: A :class:`tuple` containing the :class:`list` of the converted values, with :data:`None` in place of the invalid ones, and a :class:`dict` mapping the indexes of the invalid values to the errors they caused.
+        """
+
+        try:
+            return list(map(self.function, raws)), {}
+        except Exception:
+            pass
+
+        values = []
+        failures = {}
+        for index, raw in enumerate(raws):
+            try:
+                values.append(self(raw))
+            except Exception as e:
+                values.append(None)
+                failures[index] = e
+        return values, failures
+
+
+__all__ = (
+    "Converter",
+)
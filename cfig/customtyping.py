@@ -15,6 +15,7 @@ ResolverOptional = t.Callable[[t.Optional[str]], TYPE]
 ProxyAny = t.Callable[[t.Callable[[t.Any], TYPE]], TYPE]
 ProxyRequired = t.Callable[[t.Callable[[str], TYPE]], TYPE]
 ProxyOptional = t.Callable[[t.Callable[[t.Optional[str]], TYPE]], TYPE]
+ResolverSpec = t.Tuple[ResolverAny, bool, t.Optional[str]]
 
 
 __all__ = (
@@ -25,4 +26,5 @@ __all__ = (
     "ProxyAny",
     "ProxyRequired",
     "ProxyOptional",
+    "ResolverSpec",
 )
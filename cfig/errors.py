@@ -41,6 +41,53 @@ class DuplicateProxyNameError(ProxyRegistrationError):
     """
 
 
+class UnknownDependencyError(DefinitionError):
+    """
+    A dependency was neither a proxy created by a :class:`cfig.Configuration` nor a configuration key.
+    """
+
+
+class DependencyCycleError(ProxyRegistrationError):
+    """
+    The dependencies between proxies form a cycle, so it is not possible to determine which one should be resolved first.
+
+    Its arguments are the keys forming the cycle.
+    """
+
+    def __str__(self):
+        return " → ".join(self.args)
+
+
+class UnfreezableKeyError(DefinitionError):
+    """
+    :meth:`cfig.config.Configuration.freeze` was called on a configuration containing keys which are not valid field names.
+
+    Its arguments are the invalid keys.
+    """
+
+
+class InvalidExecutorError(DefinitionError):
+    """
+    The executor requested for a resolver does not exist, or is unable to run it.
+
+    Resolvers run in a separate process must be synchronous, and defined at the top level of a module, so that they can be imported again there.
+    """
+
+
+class UnsupportedTypeError(DefinitionError):
+    """
+    :meth:`cfig.config.Configuration.field` was called with a type which no :class:`cfig.converters.Converter` can be built for.
+    """
+
+
+class SynchronousAccessError(DeveloperError):
+    """
+    A proxy with an asynchronous resolver was accessed synchronously while an event loop was running in the same thread.
+
+    Such proxies should be resolved in advance via :meth:`cfig.config.Configuration.ProxyDict.resolve_async`.
+    """
+
+
 class UserError(CfigError):
     """
     A user-side error: the developer of the application has no way to fix it.
@@ -76,6 +123,22 @@ class InvalidValueError(ConfigurationError):
     """
 
 
+class ResolutionTimeoutError(ConfigurationError):
+    """
+    A resolver did not complete in the number of seconds allowed by the ``timeout`` of its key.
+
+    Its arguments are the key and the timeout.
+    """
+
+
+class FailedDependencyError(ConfigurationError):
+    """
+    A configuration key was not resolved because one of the keys it depends on could not be resolved.
+
+    Its only argument is the key of the failed dependency.
+    """
+
+
 class BatchResolutionFailure(BaseException):
     """
     A cumulative error which sums the errors occurred while resolving proxied configuration values.
@@ -133,10 +196,18 @@ __all__ = (
     "UnknownResolverNameError",
     "ProxyRegistrationError",
     "DuplicateProxyNameError",
+    "UnknownDependencyError",
+    "DependencyCycleError",
+    "UnfreezableKeyError",
+    "InvalidExecutorError",
+    "UnsupportedTypeError",
+    "SynchronousAccessError",
     "UserError",
     "ConfigurationError",
     "MissingValueError",
     "InvalidValueError",
+    "ResolutionTimeoutError",
+    "FailedDependencyError",
     "BatchResolutionFailure",
     "MissingDependencyError",
 )
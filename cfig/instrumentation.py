@@ -0,0 +1,90 @@
+"""
+This module defines the classes used to measure and observe the resolution of the values of a :class:`cfig.config.Configuration`.
+"""
+
+import typing as t
+
+if t.TYPE_CHECKING:
+    from cfig.sources.base import Source
+
+
+class Timing:
+    """
+    The measurements taken during the resolution of a single value.
+    """
+
+    __slots__ = ("key", "source", "retrieval", "resolution", "attempts", "error")
+
+    def __init__(self, key: str):
+        self.key: str = key
+        """
+        The configuration key of the value.
+        """
+
+        self.source: t.Optional["Source"] = None
+        """
+        The source the raw value was retrieved from, or :data:`None` if no source had a value for the key.
+        """
+
+        self.retrieval: float = 0.0
+        """
+        The number of seconds spent retrieving the raw value from the sources.
+        """
+
+        self.resolution: float = 0.0
+        """
+        The number of seconds spent running the resolver.
+        """
+
+        self.attempts: int = 0
+        """
+        The number of times the resolver has been run.
+        """
+
+        self.error: t.Optional[Exception] = None
+        """
+        The error which caused the resolution to fail, or :data:`None` if it succeeded.
+        """
+
+    def __repr__(self):
+        return f"<{self.__class__.__qualname__} for {self.key!r}: {self.total:.6f}s>"
+
+    @property
+    def total(self) -> float:
+        """
+        The total number of seconds spent resolving the value.
+        """
+
+        return self.retrieval + self.resolution
+
+
+class Hook:
+    """
+    An object notified about the resolution of values, for example to export their :class:`.Timing` to a metrics backend.
+
+    Hooks are added to the :attr:`cfig.config.Configuration.hooks` list, and should override the methods they are interested in::
+
+        class LoggingHook(cfig.Hook):
+            def on_resolve_end(self, key, timing):
+                print(f"{key} took {timing.total} seconds")
+
+        config.hooks.append(LoggingHook())
+
+    Errors raised by hooks are logged and ignored.
+    """
+
+    def on_resolve_start(self, key: str) -> None:
+        """
+        Called before the value with the given key starts being resolved.
+        """
+
+    def on_resolve_end(self, key: str, timing: Timing) -> None:
+        """
+        Called after the value with the given key has been resolved, or has failed to resolve.
+        """
+
+
+__all__ = (
+    "Timing",
+    "Hook",
+)
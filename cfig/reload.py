@@ -0,0 +1,298 @@
+"""
+This module defines the :class:`.Reloader` and :class:`.Watcher` classes.
+"""
+
+import logging
+import os
+import threading
+import typing as t
+from . import errors
+from .config import Configuration
+from cfig.sources.cached import CachedSource
+from cfig.sources.directory import DirectorySource
+from cfig.sources.envfile import EnvironmentFileSource
+from cfig.sources.layered import LayeredSources
+from cfig.sources.parsedfile import ParsedFileSource
+
+log = logging.getLogger(__name__)
+
+
+class Reloader:
+    """
+    A background thread periodically checking whether the files containing the values of a :class:`.Configuration` have changed, and reloading only the affected values via :meth:`.Configuration.reload` if they did.
+
+    Files are considered changed if their path, inode, modification time or size change, so that files replaced atomically, such as Docker and Kubernetes secrets, are detected as well.
+
+    Currently, only the files of :class:`~cfig.sources.envfile.EnvironmentFileSource`, :class:`~cfig.sources.directory.DirectorySource` and :class:`~cfig.sources.parsedfile.ParsedFileSource` sources are checked, including the ones wrapped in a :class:`~cfig.sources.cached.CachedSource` or in a :class:`~cfig.sources.layered.LayeredSources`; the cached values are invalidated when the files change.
+    """
+
+    def __init__(self, configuration: Configuration, *, interval: float = 1.0):
+        self.configuration: Configuration = configuration
+        """
+        The :class:`.Configuration` to reload.
+        """
+
+        self.interval: float = interval
+        """
+        The number of seconds to wait between checks.
+        """
+
+        self._signatures: dict[str, tuple] = {}
+        """
+        Dictionary mapping configuration keys to the signature of their files at the time of the last check.
+        """
+
+        self._thread: t.Optional[threading.Thread] = None
+        """
+        The thread performing the checks, or :data:`None` if it is not running.
+        """
+
+        self._stopping: threading.Event = threading.Event()
+        """
+        Event set to stop :attr:`._thread`.
+        """
+
+    def __repr__(self):
+        return f"<{self.__class__.__qualname__} of {self.configuration!r} every {self.interval!r}s>"
+
+    def _sources(self) -> t.Iterator:
+        """
+        Iterate over the sources of the configuration, including the ones wrapped in a :class:`~cfig.sources.cached.CachedSource` or in a :class:`~cfig.sources.layered.LayeredSources`, which are yielded after the wrapping source.
+        """
+
+        stack = list(reversed(self.configuration.sources))
+        while stack:
+            source = stack.pop()
+            yield source
+
+            if isinstance(source, CachedSource):
+                stack.append(source.source)
+            elif isinstance(source, LayeredSources):
+                stack.extend(reversed(source.layers))
+
+    def _signature(self, key: str) -> tuple:
+        """
+        Compute the signature of the files containing the value with the given key.
+        """
+
+        signature = []
+
+        for source in self._sources():
+            if isinstance(source, EnvironmentFileSource):
+                path = source.path(key)
+            elif isinstance(source, DirectorySource):
+                path = source.path_of(key)
+            elif isinstance(source, ParsedFileSource):
+                path = source.path
+            else:
+                continue
+
+            if path is None:
+                signature.append(None)
+                continue
+
+            try:
+                stat = os.stat(path)
+            except OSError:
+                signature.append((path, None))
+            else:
+                signature.append((path, stat.st_ino, stat.st_mtime_ns, stat.st_size))
+
+        return tuple(signature)
+
+    def _invalidate(self, keys: t.Iterable[str]) -> None:
+        """
+        Invalidate the values with the given keys in all the :class:`~cfig.sources.cached.CachedSource` and :class:`~cfig.sources.directory.DirectorySource` sources of the configuration.
+        """
+
+        for source in self._sources():
+            if isinstance(source, (CachedSource, DirectorySource)):
+                for key in keys:
+                    source.invalidate(key)
+
+    def check(self) -> dict[str, t.Any]:
+        """
+        Check once whether the files have changed since the last check, reloading the affected values if they did.
+
+        The first check of a key only records the signature of its files.
+
+        :raises .errors.BatchResolutionFailure: If it was not possible to resolve again at least one value.
+        :returns: A :class:`dict` containing the new values of the proxies which have been resolved again.
+        """
+
+        changed = []
+
+        for key in self.configuration.proxies.keys():
+            signature = self._signature(key)
+            previous = self._signatures.get(key)
+            self._signatures[key] = signature
+
+            if previous is not None and previous != signature:
+                if __debug__:
+                    log.debug("Files of %r have changed.", key)
+                changed.append(key)
+
+        if not changed:
+            return {}
+
+        self._invalidate(changed)
+        return self.configuration.reload(changed)
+
+    def _run(self) -> None:
+        """
+        Call :meth:`.check` every :attr:`.interval` seconds until :meth:`.stop` is called.
+        """
+
+        while not self._stopping.wait(self.interval):
+            try:
+                self.check()
+            except errors.BatchResolutionFailure as fail:
+                log.error("Could not reload the configuration: %s", fail)
+            except Exception as e:
+                log.exception("Unexpected error while reloading the configuration: %r", e)
+
+    def start(self) -> None:
+        """
+        Record the current signatures of the files, and start checking them in a background thread.
+        """
+
+        if self._thread is not None:
+            raise RuntimeError(f"{self!r} is already running.")
+
+        self.check()
+
+        log.debug("Starting %r...", self)
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="cfig-reloader", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop checking the files, waiting for the background thread to terminate.
+        """
+
+        if self._thread is None:
+            return
+
+        log.debug("Stopping %r...", self)
+        self._stopping.set()
+        self._thread.join()
+        self._thread = None
+
+    def __enter__(self) -> "Reloader":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+class Watcher:
+    """
+    Background threads consuming the changes reported by :meth:`.Source.watch` for each of the :attr:`~.Configuration.sources` of a :class:`.Configuration`, and reloading via :meth:`.Configuration.reload` only the values which changed, calling the functions passed to :meth:`.Configuration.subscribe`.
+
+    Unlike :class:`.Reloader`, which checks the files of all values at once, each change is handled as soon as its source reports it, and only the sources able to watch their values, such as :class:`~cfig.sources.envfile.EnvironmentFileSource`, :class:`~cfig.sources.directory.DirectorySource` and :class:`~cfig.sources.parsedfile.ParsedFileSource`, are watched; the others are ignored.
+    """
+
+    def __init__(self, configuration: Configuration, *, interval: float = 1.0):
+        self.configuration: Configuration = configuration
+        """
+        The :class:`.Configuration` to reload.
+        """
+
+        self.interval: float = interval
+        """
+        The number of seconds the sources should wait between checks.
+        """
+
+        self._threads: list[threading.Thread] = []
+        """
+        The threads consuming the changes, one for each watched source.
+        """
+
+        self._stopping: threading.Event = threading.Event()
+        """
+        Event set to stop watching the sources.
+        """
+
+    def __repr__(self):
+        return f"<{self.__class__.__qualname__} of {self.configuration!r} every {self.interval!r}s>"
+
+    def handle(self, key: str, value: t.Optional[str]) -> dict[str, t.Any]:
+        """
+        Handle the change of the value with the given key, reloading it if it is resolved.
+
+        :raises .errors.BatchResolutionFailure: If it was not possible to resolve again the value or the values depending on it.
+        :returns: A :class:`dict` containing the new values of the proxies which have been resolved again.
+        """
+
+        if key not in self.configuration.proxies:
+            return {}
+
+        if __debug__:
+            log.debug("Value of %r has changed.", key)
+        # Another source may take precedence over the one reporting the change, so retrieve the value again
+        return self.configuration.reload([key])
+
+    def _run(self, changes: t.Iterator[tuple[str, t.Optional[str]]]) -> None:
+        """
+        Call :meth:`.handle` for each of the given changes, until :meth:`.stop` is called.
+        """
+
+        for key, value in changes:
+            try:
+                self.handle(key, value)
+            except errors.BatchResolutionFailure as fail:
+                log.error("Could not reload the configuration: %s", fail)
+            except Exception as e:
+                log.exception("Unexpected error while reloading the configuration: %r", e)
+
+    def start(self) -> None:
+        """
+        Start watching the sources of the configuration in background threads.
+        """
+
+        if self._threads:
+            raise RuntimeError(f"{self!r} is already running.")
+
+        log.debug("Starting %r...", self)
+        self._stopping.clear()
+        keys = list(self.configuration.proxies.keys())
+
+        for source in self.configuration.sources:
+            changes = source.watch(keys, interval=self.interval, stopping=self._stopping)
+            if changes is None:
+                if __debug__:
+                    log.debug("%r cannot be watched, ignoring it.", source)
+                continue
+
+            thread = threading.Thread(target=self._run, args=(changes,), name="cfig-watcher", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self) -> None:
+        """
+        Stop watching the sources, waiting for the background threads to terminate.
+        """
+
+        if not self._threads:
+            return
+
+        log.debug("Stopping %r...", self)
+        self._stopping.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def __enter__(self) -> "Watcher":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+__all__ = (
+    "Reloader",
+    "Watcher",
+)
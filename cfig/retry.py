@@ -0,0 +1,93 @@
+"""
+This module defines the :class:`.Retry` policy.
+"""
+
+import random
+import typing as t
+
+
+class Retry:
+    """
+    A policy to run again a resolver which failed because of a transient error, such as a network error, waiting an exponentially increasing delay between each attempt::
+
+        @config.required(retry=cfig.Retry(attempts=5, exceptions=(ConnectionError,)))
+        def DATABASE_ENGINE(val: str):
+            return create_engine(uri=val)
+
+    The delay before the n-th retry is ``delay * multiplier ** (n - 1)``, capped at ``max_delay``, and then reduced by a random fraction of itself up to ``jitter``, so that multiple processes failing at the same time do not all retry at the same time.
+    """
+
+    __slots__ = ("attempts", "exceptions", "delay", "multiplier", "max_delay", "jitter")
+
+    def __init__(
+            self,
+            attempts: int = 3,
+            *,
+            exceptions: tuple[type[BaseException], ...] = (OSError,),
+            delay: float = 0.1,
+            multiplier: float = 2.0,
+            max_delay: float = 10.0,
+            jitter: float = 0.5,
+    ):
+        if attempts < 1:
+            raise ValueError("attempts must be at least 1")
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+
+        self.attempts: int = attempts
+        """
+        The maximum number of times the resolver is run, including the first one.
+        """
+
+        self.exceptions: tuple[type[BaseException], ...] = exceptions
+        """
+        The classes of the errors which cause the resolver to be run again; other errors are raised immediately.
+
+        By default, only :exc:`OSError`, which includes connection errors, causes a retry, as the errors raised for invalid values would be raised again.
+        """
+
+        self.delay: float = delay
+        """
+        The number of seconds to wait before the first retry.
+        """
+
+        self.multiplier: float = multiplier
+        """
+        The factor the delay is multiplied by after each retry.
+        """
+
+        self.max_delay: float = max_delay
+        """
+        The maximum number of seconds to wait before a retry.
+        """
+
+        self.jitter: float = jitter
+        """
+        The maximum fraction of each delay which is randomly subtracted from it.
+        """
+
+    def __repr__(self):
+        return f"<{self.__class__.__qualname__} up to {self.attempts} attempts on {', '.join(e.__qualname__ for e in self.exceptions)}>"
+
+    def should_retry(self, error: BaseException) -> bool:
+        """
+        Check whether the given error should cause the resolver to be run again.
+        """
+
+        return isinstance(error, self.exceptions)
+
+    def delays(self) -> t.Iterator[float]:
+        """
+        Generate the number of seconds to wait before each retry.
+        """
+
+        delay = self.delay
+        for _ in range(self.attempts - 1):
+            capped = min(delay, self.max_delay)
+            yield capped - capped * self.jitter * random.random()
+            delay *= self.multiplier
+
+
+__all__ = (
+    "Retry",
+)
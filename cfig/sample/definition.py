@@ -58,6 +58,11 @@ def EXAMPLE_NUMBER(val: t.Optional[str]) -> int:
         raise cfig.InvalidValueError("Not an int.")
 
 
+# Values which only need to be converted into a type can be defined without writing a resolver at all
+# The following one behaves like EXAMPLE_NUMBER, but it is required to be an int, and defaults to 4
+EXAMPLE_WORKERS = config.field("EXAMPLE_WORKERS", int, default=4, doc="An example number of workers to start.")
+
+
 # And that's it!
 # Let's make some more proxies as examples with no comments inbetween
 # So you can have an easier idea of how cfig configs are made
@@ -0,0 +1,209 @@
+"""
+This module defines the :class:`.SharedSnapshot` class.
+"""
+
+import logging
+import mmap
+import os
+import struct
+import threading
+import time
+import typing as t
+from .config import Configuration
+from .snapshot import Snapshot
+
+log = logging.getLogger(__name__)
+
+
+class SharedSnapshot:
+    """
+    A :class:`.Snapshot` published in a memory-mapped file, so that multiple processes, such as the workers of a pre-fork server, can use the values resolved by a single one of them.
+
+    The publishing process creates the file via :meth:`.create`, and calls :meth:`.publish` every time the values change; the other processes attach to it via :meth:`.attach`, and call :meth:`.sync` to use the last published values::
+
+        # In the master process, before forking
+        shared = cfig.SharedSnapshot.create("/dev/shm/myapp.cfig")
+        shared.publish(cfig.Snapshot.take(config))
+
+        # In each worker process
+        shared = cfig.SharedSnapshot.attach("/dev/shm/myapp.cfig")
+        shared.sync(config)
+
+    The file starts with a generation counter, incremented before and after each publication, which allows :meth:`.sync` to check cheaply whether there is anything new, and :meth:`.read` to detect and retry reads overlapping a publication.
+
+    Only a single process should publish to the file.
+    """
+
+    HEADER: struct.Struct = struct.Struct("<4s4xQQ")
+    """
+    The structure of the header of the file: a magic string, the generation counter, and the length of the serialized snapshot following the header.
+    """
+
+    MAGIC: bytes = b"CFIG"
+    """
+    The magic string identifying the file.
+    """
+
+    DEFAULT_SIZE: int = 1024 * 1024
+    """
+    The default size in bytes of the files created via :meth:`.create`, which limits the size of the snapshots which can be published.
+    """
+
+    def __init__(self, path: t.Union[str, os.PathLike], data: mmap.mmap):
+        self.path: t.Union[str, os.PathLike] = path
+        """
+        The path of the memory-mapped file.
+        """
+
+        self._data: mmap.mmap = data
+        """
+        The memory-mapped contents of the file.
+        """
+
+        self._synced: t.Optional[int] = None
+        """
+        The generation applied by the last call to :meth:`.sync`, or :data:`None` if it wasn't called yet.
+        """
+
+        self._lock: threading.Lock = threading.Lock()
+        """
+        Lock preventing multiple threads of the same process from publishing at once.
+        """
+
+    def __repr__(self):
+        return f"<{self.__class__.__qualname__} of {os.fspath(self.path)!r}>"
+
+    @classmethod
+    def create(cls, path: t.Union[str, os.PathLike], *, size: int = DEFAULT_SIZE) -> "SharedSnapshot":
+        """
+        Create the file at the given path with the given size, replacing its contents if it already exists, and memory-map it.
+        """
+
+        if size <= cls.HEADER.size:
+            raise ValueError(f"size must be larger than {cls.HEADER.size} bytes")
+
+        with open(path, "w+b") as file:
+            file.truncate(size)
+            data = mmap.mmap(file.fileno(), size)
+
+        cls.HEADER.pack_into(data, 0, cls.MAGIC, 0, 0)
+        return cls(path, data)
+
+    @classmethod
+    def attach(cls, path: t.Union[str, os.PathLike]) -> "SharedSnapshot":
+        """
+        Memory-map, in read-only mode, the file at the given path, previously created via :meth:`.create`.
+
+        :raises ValueError: If the file was not created via :meth:`.create`.
+        """
+
+        with open(path, "rb") as file:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, _generation, _length = cls.HEADER.unpack_from(data, 0)
+        if magic != cls.MAGIC:
+            data.close()
+            raise ValueError(f"{os.fspath(path)!r} does not contain a shared snapshot")
+
+        return cls(path, data)
+
+    @property
+    def generation(self) -> int:
+        """
+        The current value of the generation counter: it is odd while a publication is in progress, and even otherwise.
+        """
+
+        _magic, generation, _length = self.HEADER.unpack_from(self._data, 0)
+        return generation
+
+    def publish(self, snapshot: Snapshot) -> int:
+        """
+        Publish the given snapshot in the file.
+
+        :raises ValueError: If the serialized snapshot does not fit in the file.
+        :returns: The generation of the published snapshot.
+        """
+
+        payload = snapshot.dumps()
+        if self.HEADER.size + len(payload) > len(self._data):
+            raise ValueError(f"{snapshot!r} takes {len(payload)} bytes, which do not fit in {self!r}")
+
+        with self._lock:
+            _magic, generation, length = self.HEADER.unpack_from(self._data, 0)
+
+            self.HEADER.pack_into(self._data, 0, self.MAGIC, generation + 1, length)
+            self._data[self.HEADER.size:self.HEADER.size + len(payload)] = payload
+            self.HEADER.pack_into(self._data, 0, self.MAGIC, generation + 2, len(payload))
+
+        if __debug__:
+            log.debug("Published %r as generation %r.", snapshot, generation + 2)
+        return generation + 2
+
+    def read(self) -> tuple[int, t.Optional[Snapshot]]:
+        """
+        Read the last published snapshot, waiting for the publication in progress to complete, if any.
+
+        :returns: A :class:`tuple` containing the generation of the snapshot, and the snapshot itself, or :data:`None` if nothing has been published yet.
+        """
+
+        while True:
+            _magic, generation, length = self.HEADER.unpack_from(self._data, 0)
+            if generation % 2:
+                time.sleep(0)
+                continue
+
+            payload = self._data[self.HEADER.size:self.HEADER.size + length]
+
+            # A publication might have started while the payload was being copied
+            if self.generation != generation:
+                continue
+
+            if not generation:
+                return generation, None
+            return generation, Snapshot.loads(payload)
+
+    def sync(self, configuration: Configuration) -> bool:
+        """
+        Apply the last published snapshot to the given :class:`.Configuration` via :meth:`.Snapshot.apply`, trusting the raw values it contains, unless it was already applied by a previous call.
+
+        Values which could not be published are resolved again, the next time they are accessed, if their raw value has changed.
+
+        :returns: :data:`True` if a new snapshot has been applied, :data:`False` otherwise.
+        """
+
+        if self.generation == self._synced:
+            return False
+
+        generation, snapshot = self.read()
+        if snapshot is None:
+            return False
+
+        for key, raw in snapshot.raws.items():
+            proxy = configuration.proxies.get(key)
+            if proxy is None or key in snapshot.values or not proxy.__resolved__:
+                continue
+            factory = proxy.__factory__
+            if isinstance(factory, Configuration.Factory) and factory.raw != raw:
+                del proxy.__wrapped__
+
+        snapshot.apply(configuration, verify=False)
+        self._synced = generation
+        return True
+
+    def close(self) -> None:
+        """
+        Unmap the file.
+        """
+
+        self._data.close()
+
+    def __enter__(self) -> "SharedSnapshot":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+__all__ = (
+    "SharedSnapshot",
+)
@@ -0,0 +1,187 @@
+"""
+This module defines the :class:`.Snapshot` class.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+import typing as t
+from .config import Configuration
+
+log = logging.getLogger(__name__)
+
+
+class Snapshot:
+    """
+    The resolved values of a :class:`.Configuration`, along with a fingerprint of the raw values they were resolved from, which can be saved to a file and restored in another process without running the resolvers again.
+
+    Useful for example for short-lived processes, which would otherwise resolve the whole configuration every time they are started::
+
+        snapshot = cfig.Snapshot.load("config.snapshot")
+        if snapshot is None or not snapshot.apply(config):
+            cfig.Snapshot.take(config).save("config.snapshot")
+
+    Values which cannot be pickled are not included, and are resolved normally when accessed.
+
+    .. warning::
+
+        Snapshots are serialized via :mod:`pickle`, so they should only be loaded from trusted locations!
+    """
+
+    __slots__ = ("fingerprint", "raws", "values")
+
+    VERSION: int = 2
+    """
+    The version of the serialization format; snapshots with a different version are ignored by :meth:`.loads`.
+    """
+
+    def __init__(self, fingerprint: str, raws: dict[str, t.Optional[str]], values: dict[str, t.Any]):
+        self.fingerprint: str = fingerprint
+        """
+        The fingerprint of :attr:`.raws`, computed via :meth:`.compute_fingerprint`.
+        """
+
+        self.raws: dict[str, t.Optional[str]] = raws
+        """
+        Dictionary mapping all the configuration keys to the raw values :attr:`.values` were resolved from.
+        """
+
+        self.values: dict[str, t.Any] = values
+        """
+        Dictionary mapping configuration keys to their resolved values.
+        """
+
+    def __repr__(self):
+        return f"<{self.__class__.__qualname__} {self.fingerprint[:12]} with {len(self.values)} values>"
+
+    @staticmethod
+    def compute_fingerprint(raws: t.Mapping[str, t.Optional[str]]) -> str:
+        """
+        Compute the SHA-256 fingerprint of the given raw values, which changes if any key is added, removed, or has a different raw value.
+        """
+
+        data = json.dumps(sorted(raws.items()), ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    @classmethod
+    def take(cls, configuration: Configuration) -> "Snapshot":
+        """
+        Resolve all the values of the given :class:`.Configuration`, and take a snapshot of them.
+
+        :raises .errors.BatchResolutionFailure: If it was not possible to resolve at least one value.
+        """
+
+        resolved = configuration.proxies.resolve()
+
+        raws = {}
+        for key, proxy in configuration.proxies.items():
+            factory = proxy.__factory__
+            if isinstance(factory, Configuration.Factory):
+                raws[key] = factory.raw
+
+        values = {}
+        for key, value in resolved.items():
+            try:
+                pickle.dumps(value)
+            except Exception as e:
+                if __debug__:
+                    log.debug("Not including %r in the snapshot, as it cannot be pickled: %r", key, e)
+                continue
+            values[key] = value
+
+        return cls(cls.compute_fingerprint(raws), raws, values)
+
+    def apply(self, configuration: Configuration, *, verify: bool = True) -> bool:
+        """
+        Use the values of this snapshot for the unresolved proxies of the given :class:`.Configuration`, if the fingerprint of its current raw values matches :attr:`.fingerprint`.
+
+        The raw values are retrieved from the sources in a single pass, but no resolver is run.
+
+        :param verify: If :data:`False`, do not retrieve the raw values from the sources, trusting the ones in :attr:`.raws`, and replace the values of the proxies which are already resolved as well.
+        :returns: :data:`True` if the snapshot has been applied, :data:`False` if the fingerprint did not match.
+        """
+
+        if verify:
+            retrieved = configuration._retrieve_values_and_sources(configuration.proxies.keys())
+            fingerprint = self.compute_fingerprint({key: raw for key, (raw, _source) in retrieved.items()})
+
+            if fingerprint != self.fingerprint:
+                log.debug("Not applying %r, as the raw values have changed.", self)
+                return False
+        else:
+            retrieved = {key: (raw, None) for key, raw in self.raws.items()}
+
+        log.debug("Applying %r...", self)
+        for key, value in self.values.items():
+            proxy = configuration.proxies.get(key)
+            if proxy is None or (verify and proxy.__resolved__):
+                continue
+
+            factory = proxy.__factory__
+            if isinstance(factory, Configuration.Factory):
+                factory.raw, factory.source = retrieved[key]
+            proxy.__wrapped__ = value
+
+        return True
+
+    def dumps(self) -> bytes:
+        """
+        Serialize this snapshot into :class:`bytes`.
+        """
+
+        return pickle.dumps((self.VERSION, self.fingerprint, self.raws, self.values), protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def loads(cls, data: bytes) -> t.Optional["Snapshot"]:
+        """
+        Deserialize a snapshot serialized via :meth:`.dumps`, returning :data:`None` if it has been serialized by a different version.
+        """
+
+        version, *fields = pickle.loads(data)
+        if version != cls.VERSION:
+            log.debug("Ignoring snapshot with version %r.", version)
+            return None
+
+        return cls(*fields)
+
+    def save(self, path: t.Union[str, os.PathLike]) -> None:
+        """
+        Save this snapshot to the file at the given path, replacing it atomically if it already exists.
+        """
+
+        directory = os.path.dirname(os.fspath(path)) or "."
+        descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=".cfig-snapshot-")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(self.dumps())
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    @classmethod
+    def load(cls, path: t.Union[str, os.PathLike]) -> t.Optional["Snapshot"]:
+        """
+        Load a snapshot from the file at the given path in a single read, returning :data:`None` if it does not exist or cannot be deserialized.
+        """
+
+        try:
+            with open(path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            log.debug("No snapshot found at %r.", path)
+            return None
+
+        try:
+            return cls.loads(data)
+        except Exception as e:
+            log.warning("Could not load the snapshot at %r: %r", path, e)
+            return None
+
+
+__all__ = (
+    "Snapshot",
+)
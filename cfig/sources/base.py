@@ -3,8 +3,12 @@ This module defines the :class:`.Source` abstract class.
 """
 
 import abc
+import logging
+import threading
 import typing as t
 
+log = logging.getLogger(__name__)
+
 
 class Source(metaclass=abc.ABCMeta):
     """
@@ -21,6 +25,79 @@ class Source(metaclass=abc.ABCMeta):
         Get the value with the given key from the source.
         """
 
+    def get_many(self, keys: t.Iterable[str]) -> t.Mapping[str, t.Optional[str]]:
+        """
+        Get the values with the given keys from the source, all at once.
+
+        By default, it calls :meth:`.get` once for each key, but sources which can retrieve multiple values more efficiently should override it.
+
+        Keys missing from the returned mapping are considered to have no value.
+        """
+
+        return {key: self.get(key) for key in keys}
+
+    def keys(self) -> t.Optional[t.Collection[str]]:
+        """
+        Get the keys of all the values contained in the source, or :data:`None` if the source is unable to enumerate them.
+
+        By default, it returns :data:`None`, but sources which know in advance which values they contain should override it, allowing :class:`~cfig.sources.layered.LayeredSources` to index them.
+        """
+
+        return None
+
+    def signature(self) -> t.Optional[t.Hashable]:
+        """
+        Get a value which changes every time the keys returned by :meth:`.keys` change, without enumerating them, or :data:`None` if the source is unable to determine it cheaply.
+
+        By default, it returns :data:`None`, but sources able to enumerate their keys should override it if they can detect cheaply whether they have changed, allowing :class:`~cfig.sources.layered.LayeredSources` to rebuild its index.
+        """
+
+        return None
+
+    def watch(self, keys: t.Iterable[str], *, interval: float = 1.0, stopping: t.Optional[threading.Event] = None) -> t.Optional[t.Iterator[tuple[str, t.Optional[str]]]]:
+        """
+        Start watching the values with the given keys for changes, returning an iterator which blocks until some of them change, and then yields a ``(key, value)`` tuple for each of them, or :data:`None` if the source is unable to watch them.
+
+        The source is checked every ``interval`` seconds, and the iterator is exhausted once ``stopping`` is set.
+
+        By default, it returns :data:`None`, but sources able to detect cheaply whether their values have changed, such as the ones reading files, should override it, allowing :class:`~cfig.reload.Watcher` to reload only the changed values.
+        """
+
+        return None
+
+    def _poll(self, keys: t.Iterable[str], interval: float, stopping: t.Optional[threading.Event], signature: t.Callable[[], t.Hashable], retrieve: t.Callable[[list[str]], t.Mapping[str, t.Optional[str]]]) -> t.Iterator[tuple[str, t.Optional[str]]]:
+        """
+        Implement :meth:`.watch` by calling ``signature`` every ``interval`` seconds, and calling ``retrieve`` with the watched keys only when its result changes, yielding the values which differ from the previous ones.
+
+        The current values are retrieved immediately, so that the changes happening after this method returns are not missed.
+        """
+
+        keys = list(keys)
+        stopping = stopping if stopping is not None else threading.Event()
+        current = signature()
+        values = dict(retrieve(keys))
+
+        def changes() -> t.Iterator[tuple[str, t.Optional[str]]]:
+            nonlocal current
+
+            while not stopping.wait(interval):
+                if (new := signature()) == current:
+                    continue
+                current = new
+
+                try:
+                    retrieved = retrieve(keys)
+                except Exception as e:
+                    log.warning("Could not retrieve the changed values from %r: %r", self, e)
+                    continue
+
+                for key in keys:
+                    if (value := retrieved.get(key)) != values.get(key):
+                        values[key] = value
+                        yield key, value
+
+        return changes()
+
 
 __all__ = (
     "Source",
@@ -0,0 +1,175 @@
+"""
+This module defines the :class:`.CachedSource` :class:`~cfig.sources.base.Source`.
+"""
+
+import collections
+import threading
+import time
+import typing as t
+from cfig.sources.base import Source
+
+
+class CachedSource(Source):
+    """
+    A source which caches the values retrieved from another source, so that it is queried again only after they expire.
+
+    Useful for example to avoid reading the same files again every time the configuration is reloaded.
+    """
+
+    _MISSING = object()
+    """
+    Sentinel used to distinguish cache misses from cached :data:`None` values.
+    """
+
+    def __init__(self, source: Source, *, ttl: t.Optional[float] = None, max_entries: t.Optional[int] = None, cache_missing: bool = True, clock: t.Callable[[], float] = time.monotonic):
+        self.source: Source = source
+        """
+        The source to cache the values of.
+        """
+
+        self.ttl: t.Optional[float] = ttl
+        """
+        The number of seconds after which a cached value expires, or :data:`None` if cached values never expire.
+        """
+
+        self.max_entries: t.Optional[int] = max_entries
+        """
+        The maximum number of values to keep cached, or :data:`None` for no limit.
+
+        When the limit is exceeded, the least recently used values are evicted.
+        """
+
+        self.cache_missing: bool = cache_missing
+        """
+        Whether the absence of a value should be cached as well.
+        """
+
+        self.clock: t.Callable[[], float] = clock
+        """
+        The function used to determine the current time in seconds.
+
+        Defaults to :func:`time.monotonic`.
+        """
+
+        self._entries: collections.OrderedDict[str, tuple[t.Optional[str], t.Optional[float]]] = collections.OrderedDict()
+        """
+        Ordered dictionary mapping keys to their cached value and expiration time, from the least to the most recently used.
+        """
+
+        self._lock: threading.Lock = threading.Lock()
+        """
+        Lock protecting :attr:`._entries`, as values may be retrieved from multiple threads at once.
+        """
+
+    def __repr__(self):
+        return f"<{self.__class__.__qualname__} of {self.source!r}>"
+
+    def _lookup(self, key: str) -> t.Any:
+        """
+        Get the cached value with the given key, or :attr:`._MISSING` if it isn't cached or has expired.
+
+        Must be called while holding :attr:`._lock`.
+        """
+
+        try:
+            value, expiration = self._entries[key]
+        except KeyError:
+            return self._MISSING
+
+        if expiration is not None and expiration <= self.clock():
+            del self._entries[key]
+            return self._MISSING
+
+        self._entries.move_to_end(key)
+        return value
+
+    def _store(self, key: str, value: t.Optional[str]) -> None:
+        """
+        Cache the given value, evicting the least recently used ones if :attr:`.max_entries` is exceeded.
+
+        Must be called while holding :attr:`._lock`.
+        """
+
+        if value is None and not self.cache_missing:
+            return
+
+        expiration = self.clock() + self.ttl if self.ttl is not None else None
+        self._entries[key] = (value, expiration)
+        self._entries.move_to_end(key)
+
+        if self.max_entries is not None:
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key: str) -> t.Optional[str]:
+        with self._lock:
+            value = self._lookup(key)
+        if value is not self._MISSING:
+            return value
+
+        # Do not hold the lock while querying the source, as it may be slow
+        value = self.source.get(key)
+
+        with self._lock:
+            self._store(key, value)
+        return value
+
+    def get_many(self, keys: t.Iterable[str]) -> t.Mapping[str, t.Optional[str]]:
+        result = {}
+        misses = []
+
+        with self._lock:
+            for key in keys:
+                value = self._lookup(key)
+                if value is self._MISSING:
+                    misses.append(key)
+                else:
+                    result[key] = value
+
+        if misses:
+            values = self.source.get_many(misses)
+            with self._lock:
+                for key in misses:
+                    value = values.get(key)
+                    self._store(key, value)
+                    result[key] = value
+
+        return result
+
+    def keys(self) -> t.Optional[t.Collection[str]]:
+        return self.source.keys()
+
+    def signature(self) -> t.Optional[t.Hashable]:
+        return self.source.signature()
+
+    def watch(self, keys: t.Iterable[str], *, interval: float = 1.0, stopping: t.Optional[threading.Event] = None) -> t.Optional[t.Iterator[tuple[str, t.Optional[str]]]]:
+        """
+        Watch the values with the given keys in the wrapped :attr:`.source`, if it is able to, invalidating the cached values which change.
+        """
+
+        changes = self.source.watch(keys, interval=interval, stopping=stopping)
+        if changes is None:
+            return None
+
+        def invalidating() -> t.Iterator[tuple[str, t.Optional[str]]]:
+            for key, value in changes:
+                self.invalidate(key)
+                yield key, value
+
+        return invalidating()
+
+    def invalidate(self, key: t.Optional[str] = None) -> None:
+        """
+        Discard the cached value with the given key, or all cached values if no key is given.
+        """
+
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+
+__all__ = (
+    "CachedSource",
+)
@@ -0,0 +1,189 @@
+"""
+This module defines the :class:`.DirectorySource` :class:`~cfig.sources.base.Source`.
+"""
+
+import os
+import threading
+import typing as t
+from cfig.sources.base import Source
+
+
+class DirectorySource(Source):
+    """
+    A source which gets values from the files contained in a directory, each named after the key of the value it contains.
+
+    Useful for example with Docker Secrets or Kubernetes Secrets mounted as a volume.
+
+    The directory is scanned once, and then again only if its inode or modification time change; the files are read only the first time their value is requested.
+
+    Hidden files, such as the ``..data`` symlink created by Kubernetes, are ignored.
+    """
+
+    def __init__(self, path: t.Union[str, os.PathLike] = "/run/secrets", *, prefix: str = "", suffix: str = ""):
+        self.path: t.Union[str, os.PathLike] = path
+        """
+        The path of the directory containing the files.
+        """
+
+        self.prefix: str = prefix
+        """
+        The prefix of the names of the files, stripped to obtain the key.
+        """
+
+        self.suffix: str = suffix
+        """
+        The suffix of the names of the files, stripped to obtain the key.
+
+        For example, ``.txt`` for text files.
+        """
+
+        self._paths: dict[str, str] = {}
+        """
+        Dictionary mapping keys to the paths of the files containing their values.
+        """
+
+        self._values: dict[str, t.Optional[str]] = {}
+        """
+        Dictionary mapping keys to the contents of the files which have already been read.
+        """
+
+        self._signature: t.Optional[tuple] = None
+        """
+        The inode and modification time of the directory when :attr:`._paths` was built, or :data:`None` if it wasn't built yet.
+        """
+
+        self._lock: threading.Lock = threading.Lock()
+        """
+        Lock preventing the directory from being scanned multiple times at once.
+        """
+
+    def __repr__(self):
+        return f"<{self.__class__.__qualname__} of {os.fspath(self.path)!r}>"
+
+    def _scan(self) -> dict[str, str]:
+        """
+        Scan the directory, mapping the names of the files it contains to their paths.
+        """
+
+        paths = {}
+
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("."):
+                    continue
+                if not (name.startswith(self.prefix) and name.endswith(self.suffix)):
+                    continue
+                if not entry.is_file():
+                    continue
+                key = name[len(self.prefix):len(name) - len(self.suffix)]
+                paths[key] = entry.path
+
+        return paths
+
+    def index(self) -> t.Mapping[str, str]:
+        """
+        Get the :class:`dict` mapping keys to the paths of the files containing their values, scanning the directory again if it has changed since the last time.
+        """
+
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            signature = None
+        else:
+            signature = (stat.st_ino, stat.st_mtime_ns)
+
+        if signature != self._signature:
+            with self._lock:
+                # Another thread might have scanned the directory while this one was waiting for the lock
+                if signature != self._signature:
+                    try:
+                        self._paths = self._scan() if signature is not None else {}
+                    except FileNotFoundError:
+                        self._paths, signature = {}, None
+                    self._values = {}
+                    self._signature = signature
+
+        return self._paths
+
+    def path_of(self, key: str) -> t.Optional[str]:
+        """
+        Get the path of the file containing the value with the given key, or :data:`None` if there is no such file.
+        """
+
+        return self.index().get(key)
+
+    def get(self, key: str) -> t.Optional[str]:
+        path = self.path_of(key)
+        if path is None:
+            return None
+
+        values = self._values
+        try:
+            return values[key]
+        except KeyError:
+            pass
+
+        try:
+            with open(path, "r") as file:
+                value = file.read()
+        except FileNotFoundError:
+            value = None
+
+        values[key] = value
+        return value
+
+    def keys(self) -> t.Optional[t.Collection[str]]:
+        return list(self.index().keys())
+
+    def signature(self) -> t.Optional[t.Hashable]:
+        self.index()
+        return self._signature
+
+    def _stat(self, keys: t.Iterable[str]) -> tuple:
+        """
+        Get the signature of the directory, along with the inode, modification time and size of the files containing the values with the given keys.
+        """
+
+        signature = [self.signature()]
+        for key in keys:
+            path = self.path_of(key)
+            try:
+                stat = os.stat(path) if path is not None else None
+            except FileNotFoundError:
+                stat = None
+            signature.append((stat.st_ino, stat.st_mtime_ns, stat.st_size) if stat is not None else None)
+        return tuple(signature)
+
+    def _read_again(self, keys: t.Iterable[str]) -> t.Mapping[str, t.Optional[str]]:
+        """
+        Read again the files containing the values with the given keys.
+        """
+
+        for key in keys:
+            self.invalidate(key)
+        return self.get_many(keys)
+
+    def watch(self, keys: t.Iterable[str], *, interval: float = 1.0, stopping: t.Optional[threading.Event] = None) -> t.Optional[t.Iterator[tuple[str, t.Optional[str]]]]:
+        """
+        Watch the values with the given keys, checking only whether the directory or their files have changed every ``interval`` seconds, and reading the files again only if they did.
+        """
+
+        keys = list(keys)
+        return self._poll(keys, interval, stopping, lambda: self._stat(keys), self._read_again)
+
+    def invalidate(self, key: t.Optional[str] = None) -> None:
+        """
+        Discard the contents read from the file with the given key, or from all files if no key is given, so that they are read again.
+        """
+
+        with self._lock:
+            if key is None:
+                self._values = {}
+            else:
+                self._values.pop(key, None)
+
+
+__all__ = (
+    "DirectorySource",
+)
@@ -0,0 +1,131 @@
+"""
+This module defines the :class:`.DotenvSource` :class:`~cfig.sources.base.Source`.
+"""
+
+import mmap
+import os
+import re
+import typing as t
+from cfig.sources.parsedfile import ParsedFileSource
+
+
+class DotenvSource(ParsedFileSource):
+    """
+    A source which gets values from a ``.env`` file, parsed in a single pass.
+
+    The following syntax is supported:
+
+    .. code-block:: bash
+
+        # Comments and empty lines are ignored
+        UNQUOTED=value  # Inline comments must be preceded by whitespace
+        export EXPORTED=value
+        SINGLE='Single-quoted values are taken literally: $UNQUOTED \\n'
+        DOUBLE="Double-quoted values support escapes\\nand can span
+        multiple lines"
+        INTERPOLATED="${UNQUOTED}, $EXPORTED and ${MISSING:-default}"
+
+    Unquoted and double-quoted values are interpolated with the values defined previously in the file or, if not defined there, with the ones in :attr:`.environment`.
+    """
+
+    MMAP_THRESHOLD = 1024 * 1024
+
+    _ENTRY = re.compile(rb"""
+        ^[ \t]*
+        (?:export[ \t]+)?
+        (?P<key>[A-Za-z_][A-Za-z0-9_.]*)
+        [ \t]*=[ \t]*
+        (?:
+            '(?P<single>[^']*)'[ \t]*(?:\#[^\r\n]*)?\r?$
+          | "(?P<double>(?:\\.|[^"\\])*)"[ \t]*(?:\#[^\r\n]*)?\r?$
+          | (?P<bare>[^\r\n]*)\r?$
+        )
+    """, re.VERBOSE | re.MULTILINE)
+    """
+    Regular expression matching a single entry of the file, which may end with either ``\\n`` or ``\\r\\n``.
+    """
+
+    _INLINE_COMMENT = re.compile(r"[ \t]+#.*$")
+    """
+    Regular expression matching a comment at the end of an unquoted value.
+    """
+
+    _SUBSTITUTION = re.compile(r"""
+        \\(?P<escape>.)
+      | \$\{(?P<braced>[A-Za-z_][A-Za-z0-9_.]*)(?::-(?P<default>[^}]*))?\}
+      | \$(?P<simple>[A-Za-z_][A-Za-z0-9_]*)
+    """, re.VERBOSE | re.DOTALL)
+    """
+    Regular expression matching escapes and interpolations in a value.
+    """
+
+    _ESCAPES = {
+        "n": "\n",
+        "r": "\r",
+        "t": "\t",
+    }
+    """
+    Dictionary mapping the characters following a backslash in double-quoted values to the character they represent.
+    """
+
+    def __init__(self, path: t.Union[str, os.PathLike] = ".env", *, environment=None, interpolate: bool = True):
+        super().__init__(path)
+
+        self.environment = environment if environment is not None else os.environ
+        """
+        The environment to retrieve the values of interpolated variables from, if they are not defined in the file.
+
+        Defaults to :data:`os.environ`.
+        """
+
+        self.interpolate: bool = interpolate
+        """
+        Whether ``$VARIABLE`` and ``${VARIABLE}`` in unquoted and double-quoted values should be replaced with the value of the variable.
+        """
+
+    def _substitute(self, value: str, index: dict[str, str], escapes: bool) -> str:
+        """
+        Process the escapes, if ``escapes`` is :data:`True`, and the interpolations of the given value.
+        """
+
+        def _replace(match: re.Match) -> str:
+            if (escape := match.group("escape")) is not None:
+                if not escapes:
+                    return match.group(0)
+                return self._ESCAPES.get(escape, escape)
+
+            if not self.interpolate:
+                return match.group(0)
+
+            name = match.group("braced") or match.group("simple")
+            if (variable := index.get(name)) is None:
+                variable = self.environment.get(name)
+            if not variable and (default := match.group("default")) is not None:
+                return default
+            return variable or ""
+
+        return self._SUBSTITUTION.sub(_replace, value)
+
+    def _parse(self, data: t.Union[bytes, mmap.mmap]) -> dict[str, str]:
+        index = {}
+
+        for match in self._ENTRY.finditer(data):
+            key = match.group("key").decode("utf-8")
+
+            if (single := match.group("single")) is not None:
+                value = single.decode("utf-8")
+            elif (double := match.group("double")) is not None:
+                value = self._substitute(double.decode("utf-8"), index, escapes=True)
+            else:
+                value = match.group("bare").decode("utf-8")
+                value = self._INLINE_COMMENT.sub("", value).strip()
+                value = self._substitute(value, index, escapes=False)
+
+            index[key] = value
+
+        return index
+
+
+__all__ = (
+    "DotenvSource",
+)
@@ -40,3 +40,12 @@ class EnvironmentSource(Source):
     def get(self, key: str) -> t.Optional[str]:
         key = self._process_key(key)
         return self.environment.get(key)
+
+    def keys(self) -> t.Optional[t.Collection[str]]:
+        prefix, suffix = self.prefix, self.suffix
+        minimum = len(prefix) + len(suffix)
+        return [
+            name[len(prefix):len(name) - len(suffix)]
+            for name in list(self.environment.keys())
+            if len(name) > minimum and name.startswith(prefix) and name.endswith(suffix)
+        ]
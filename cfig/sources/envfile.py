@@ -2,6 +2,8 @@
 This module defines the :class:`.EnvironmentFileSource` :class:`~cfig.sources.base.Source`.
 """
 
+import os
+import threading
 import typing as t
 from cfig.sources.env import EnvironmentSource
 
@@ -16,8 +18,15 @@ class EnvironmentFileSource(EnvironmentSource):
     def __init__(self, *, prefix: str = "", suffix: str = "_FILE", environment=None):
         super().__init__(prefix=prefix, suffix=suffix, environment=environment)
 
+    def path(self, key: str) -> t.Optional[str]:
+        """
+        Get the path of the file containing the value with the given key, or :data:`None` if it is not specified.
+        """
+
+        return super().get(key)
+
     def get(self, key: str) -> t.Optional[str]:
-        path = super().get(key)
+        path = self.path(key)
         if path is None:
             return None
         try:
@@ -26,6 +35,29 @@ class EnvironmentFileSource(EnvironmentSource):
         except FileNotFoundError:
             return None
 
+    def _stat(self, keys: t.Iterable[str]) -> tuple:
+        """
+        Get the path, inode, modification time and size of the files containing the values with the given keys.
+        """
+
+        signature = []
+        for key in keys:
+            path = self.path(key)
+            try:
+                stat = os.stat(path) if path is not None else None
+            except FileNotFoundError:
+                stat = None
+            signature.append((path, stat.st_ino, stat.st_mtime_ns, stat.st_size) if stat is not None else (path,))
+        return tuple(signature)
+
+    def watch(self, keys: t.Iterable[str], *, interval: float = 1.0, stopping: t.Optional[threading.Event] = None) -> t.Optional[t.Iterator[tuple[str, t.Optional[str]]]]:
+        """
+        Watch the values with the given keys, checking only whether their paths or files have changed every ``interval`` seconds, and reading the files again only if they did.
+        """
+
+        keys = list(keys)
+        return self._poll(keys, interval, stopping, lambda: self._stat(keys), self.get_many)
+
 
 __all__ = (
     "EnvironmentFileSource",
@@ -0,0 +1,321 @@
+"""
+This module defines the :class:`.HttpKVSource` :class:`~cfig.sources.base.Source`.
+"""
+
+import base64
+import http.client
+import json
+import logging
+import threading
+import time
+import typing as t
+import urllib.parse
+from cfig.sources.base import Source
+
+log = logging.getLogger(__name__)
+
+
+class HttpKVSource(Source):
+    """
+    A source which gets values from a remote key-value store over HTTP, such as Consul or an etcd gateway.
+
+    All the values whose keys start with :attr:`.prefix` are fetched at once with a single request, and then served from memory, so that resolving any number of values costs a single round-trip; they are fetched again only by :meth:`.refresh`, which is also called by :meth:`.Configuration.reload`, or after :attr:`.ttl` seconds.
+
+    Refreshes are conditional: the ``ETag`` of the previous response is sent back via ``If-None-Match``, so that the store may reply with ``304 Not Modified`` instead of sending all the values again, and responses with the same :attr:`.index_header` as the previous one are not parsed again.
+
+    Requests are performed over a single keep-alive connection, which is opened again if the store closes it.
+
+    If the store cannot be reached, the error is raised by the lookups until the values have been fetched successfully at least once; after that, the previous values are kept, and the error is only logged.
+    """
+
+    def __init__(
+            self,
+            url: str,
+            *,
+            prefix: str = "",
+            query: str = "recurse",
+            index_header: t.Optional[str] = "X-Consul-Index",
+            headers: t.Optional[t.Mapping[str, str]] = None,
+            timeout: float = 10.0,
+            ttl: t.Optional[float] = None,
+            clock: t.Callable[[], float] = time.monotonic,
+    ):
+        parsed = urllib.parse.urlsplit(url)
+        if parsed.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported URL scheme: {parsed.scheme!r}")
+
+        self.url: str = url
+        """
+        The URL of the key-value store, to which the :attr:`.prefix` is appended, for example ``http://127.0.0.1:8500/v1/kv/``.
+        """
+
+        self.prefix: str = prefix
+        """
+        The prefix of the keys to fetch from the store, stripped to obtain the keys of the values.
+        """
+
+        self.query: str = query
+        """
+        The query string to send with the request, for example ``recurse`` to have Consul return all the keys starting with the prefix.
+        """
+
+        self.index_header: t.Optional[str] = index_header
+        """
+        The name of the response header containing the modification index of the store, or :data:`None` if the store does not provide one.
+        """
+
+        self.headers: dict[str, str] = dict(headers) if headers is not None else {}
+        """
+        Additional headers to send with each request, for example to authenticate.
+        """
+
+        self.timeout: float = timeout
+        """
+        The number of seconds to wait for the store to respond.
+        """
+
+        self.ttl: t.Optional[float] = ttl
+        """
+        The number of seconds after which the fetched values are fetched again when accessed, or :data:`None` if they are fetched again only by :meth:`.refresh`.
+        """
+
+        self.clock: t.Callable[[], float] = clock
+        """
+        The function used to determine the current time in seconds.
+
+        Defaults to :func:`time.monotonic`.
+        """
+
+        self._host: str = parsed.netloc
+        """
+        The host and port of the store.
+        """
+
+        self._https: bool = parsed.scheme == "https"
+        """
+        Whether the store should be connected to via HTTPS.
+        """
+
+        self._path: str = urllib.parse.quote(parsed.path + prefix, safe="/")
+        """
+        The path of the request fetching the values.
+        """
+
+        self._connection: t.Optional[http.client.HTTPConnection] = None
+        """
+        The keep-alive connection to the store, or :data:`None` if it isn't open.
+        """
+
+        self._values: t.Optional[dict[str, str]] = None
+        """
+        Dictionary mapping keys to the values fetched from the store, or :data:`None` if they weren't fetched yet.
+        """
+
+        self._etag: t.Optional[str] = None
+        """
+        The ``ETag`` of the response :attr:`._values` were fetched from.
+        """
+
+        self._index: t.Optional[str] = None
+        """
+        The :attr:`.index_header` of the response :attr:`._values` were fetched from.
+        """
+
+        self._generation: int = 0
+        """
+        Number incremented every time :attr:`._values` change.
+        """
+
+        self._expiration: t.Optional[float] = None
+        """
+        The time after which :attr:`._values` should be fetched again, or :data:`None` if they never expire.
+        """
+
+        self._lock: threading.Lock = threading.Lock()
+        """
+        Lock preventing the values from being fetched multiple times at once, and protecting :attr:`._connection`.
+        """
+
+    def __repr__(self):
+        return f"<{self.__class__.__qualname__} of {self.url + self.prefix!r}>"
+
+    def _connect(self) -> http.client.HTTPConnection:
+        """
+        Get the keep-alive connection to the store, opening it if it isn't open.
+
+        Must be called while holding :attr:`._lock`.
+        """
+
+        if self._connection is None:
+            cls = http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+            self._connection = cls(self._host, timeout=self.timeout)
+        return self._connection
+
+    def close(self) -> None:
+        """
+        Close the connection to the store, if it is open; it is opened again by the next request.
+        """
+
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _request(self) -> tuple[int, http.client.HTTPMessage, bytes]:
+        """
+        Send a conditional request for the values to the store, returning the status, the headers and the body of the response.
+
+        If the connection was opened by a previous request, and the store has closed it in the meantime, the request is sent again over a new connection.
+
+        Must be called while holding :attr:`._lock`.
+        """
+
+        headers = {**self.headers, "Accept": "application/json"}
+        if self._etag is not None:
+            headers["If-None-Match"] = self._etag
+        path = f"{self._path}?{self.query}" if self.query else self._path
+
+        reused = self._connection is not None
+        while True:
+            connection = self._connect()
+            try:
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+                # The body must be read completely for the connection to be reused
+                body = response.read()
+            except (http.client.HTTPException, OSError) as e:
+                connection.close()
+                self._connection = None
+                if not reused:
+                    raise
+                if __debug__:
+                    log.debug("Connection to %r was closed (%r), reconnecting...", self, e)
+                reused = False
+                continue
+
+            if response.will_close:
+                connection.close()
+                self._connection = None
+            return response.status, response.headers, body
+
+    # noinspection PyMethodMayBeStatic
+    def _parse(self, body: bytes) -> dict[str, str]:
+        """
+        Parse the body of a response into a :class:`dict` mapping the full keys of the store to their values.
+
+        Both JSON objects mapping keys to values, and lists of Consul entries with base64-encoded ``Value`` are supported; other sources may override this method to support different formats.
+        """
+
+        data = json.loads(body) if body else {}
+
+        if isinstance(data, list):
+            result = {}
+            for entry in data:
+                if (value := entry.get("Value")) is not None:
+                    result[entry["Key"]] = base64.b64decode(value).decode("utf-8")
+            return result
+
+        return {key: value if isinstance(value, str) else json.dumps(value) for key, value in data.items() if value is not None}
+
+    def _fetch(self) -> None:
+        """
+        Fetch the values from the store, if they have changed since the last time.
+
+        Must be called while holding :attr:`._lock`.
+
+        :raises OSError: If the store cannot be reached, or responds with an error status.
+        """
+
+        log.debug("Fetching values from %r...", self)
+        status, headers, body = self._request()
+
+        if status == 404:
+            # Nothing is stored with the prefix
+            values = {}
+        elif status == 304 and self._values is not None:
+            log.debug("Values of %r have not changed.", self)
+            return
+        elif status != 200:
+            raise ConnectionError(f"{self!r} responded with status {status}")
+        elif self.index_header is not None and self._values is not None and (index := headers.get(self.index_header)) is not None and index == self._index:
+            log.debug("Index of %r has not changed.", self)
+            return
+        else:
+            prefix = self.prefix
+            values = {key[len(prefix):]: value for key, value in self._parse(body).items() if key.startswith(prefix) and key != prefix}
+
+        self._etag = headers.get("ETag")
+        self._index = headers.get(self.index_header) if self.index_header is not None else None
+        if values != self._values:
+            self._generation += 1
+        self._values = values
+        log.debug("Fetched %s values from %r.", len(values), self)
+
+    def refresh(self) -> None:
+        """
+        Fetch the values from the store again, if they have changed.
+
+        If the store cannot be reached, the previous values are kept, if any.
+        """
+
+        with self._lock:
+            self._refresh()
+
+    def _refresh(self) -> dict[str, str]:
+        """
+        Like :meth:`.refresh`, but returning the values.
+
+        Must be called while holding :attr:`._lock`.
+        """
+
+        if self.ttl is not None:
+            self._expiration = self.clock() + self.ttl
+
+        try:
+            self._fetch()
+        except (http.client.HTTPException, OSError, ValueError) as e:
+            if self._values is None:
+                raise
+            log.warning("Could not refresh %r, keeping the previous values: %r", self, e)
+
+        return self._values
+
+    def values(self) -> t.Mapping[str, str]:
+        """
+        Get the :class:`dict` mapping keys to the values fetched from the store, fetching them if they weren't fetched yet, or if they have expired.
+
+        :raises OSError: If the values were never fetched successfully, and the store cannot be reached.
+        """
+
+        values = self._values
+        if values is None or (self._expiration is not None and self._expiration <= self.clock()):
+            with self._lock:
+                # Another thread might have fetched the values while this one was waiting for the lock
+                values = self._values
+                if values is None or (self._expiration is not None and self._expiration <= self.clock()):
+                    values = self._refresh()
+
+        return values
+
+    def get(self, key: str) -> t.Optional[str]:
+        return self.values().get(key)
+
+    def get_many(self, keys: t.Iterable[str]) -> t.Mapping[str, t.Optional[str]]:
+        values = self.values()
+        return {key: values.get(key) for key in keys}
+
+    def keys(self) -> t.Optional[t.Collection[str]]:
+        return list(self.values().keys())
+
+    def signature(self) -> t.Optional[t.Hashable]:
+        try:
+            self.values()
+        except (http.client.HTTPException, OSError, ValueError):
+            # The error will be raised by the lookups
+            return None
+        return self._generation
+
+
+__all__ = (
+    "HttpKVSource",
+)
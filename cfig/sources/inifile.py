@@ -0,0 +1,32 @@
+"""
+This module defines the :class:`.IniSource` :class:`~cfig.sources.base.Source`.
+"""
+
+import configparser
+import mmap
+import typing as t
+from cfig.sources.structured import StructuredFileSource
+
+
+class IniSource(StructuredFileSource):
+    """
+    A source which gets values from an INI file, flattening sections like :class:`~cfig.sources.structured.StructuredFileSource`.
+
+    Values in the ``[DEFAULT]`` section are available both without a prefix and in every other section; ``%`` interpolation is disabled.
+    """
+
+    def _load(self, data: t.Union[bytes, mmap.mmap]) -> t.Mapping[str, t.Any]:
+        parser = configparser.ConfigParser(interpolation=None)
+        # Preserve the case of the options
+        parser.optionxform = str
+        parser.read_string(bytes(data).decode("utf-8"))
+
+        tree = dict(parser.defaults())
+        for section in parser.sections():
+            tree[section] = dict(parser.items(section))
+        return tree
+
+
+__all__ = (
+    "IniSource",
+)
@@ -0,0 +1,25 @@
+"""
+This module defines the :class:`.JsonSource` :class:`~cfig.sources.base.Source`.
+"""
+
+import json
+import mmap
+import typing as t
+from cfig.sources.structured import StructuredFileSource
+
+
+class JsonSource(StructuredFileSource):
+    """
+    A source which gets values from a JSON file containing an object, flattening nested objects like :class:`~cfig.sources.structured.StructuredFileSource`.
+    """
+
+    def _load(self, data: t.Union[bytes, mmap.mmap]) -> t.Mapping[str, t.Any]:
+        tree = json.loads(data)
+        if not isinstance(tree, dict):
+            raise ValueError(f"{self.path!r} does not contain a JSON object.")
+        return tree
+
+
+__all__ = (
+    "JsonSource",
+)
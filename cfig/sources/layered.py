@@ -0,0 +1,164 @@
+"""
+This module defines the :class:`.LayeredSources` :class:`~cfig.sources.base.Source`.
+"""
+
+import threading
+import typing as t
+from cfig.sources.base import Source
+from cfig.sources.httpkv import HttpKVSource
+
+
+class LayeredSources(Source):
+    """
+    A source which gets values from multiple layers of sources, in order, like the :attr:`~cfig.config.Configuration.sources` of a configuration.
+
+    The keys of the layers able to enumerate them via :meth:`~cfig.sources.base.Source.keys` are merged into an index, so that for each key only the layers which contain it, plus the ones unable to enumerate their keys, are queried; keys missing from the index are looked up in all layers.
+
+    The index is built the first time it is needed, and is built again whenever the :meth:`~cfig.sources.base.Source.signature` of a layer changes, for example because a file has been modified; layers which cannot determine their signature, such as the environment, are only indexed again by :meth:`.refresh`, which is also called by :meth:`.Configuration.reload`.
+
+    As with the sources of a configuration, a layer containing an empty value for a key is skipped in favour of the following ones.
+    """
+
+    def __init__(self, layers: t.Sequence[Source]):
+        self.layers: tuple[Source, ...] = tuple(layers)
+        """
+        The sources to get values from, in order of precedence.
+        """
+
+        self._candidates: t.Optional[dict[str, tuple[Source, ...]]] = None
+        """
+        Dictionary mapping keys to the layers which may contain their value, in order, or :data:`None` if the index wasn't built yet.
+        """
+
+        self._signatures: tuple = ()
+        """
+        The :meth:`~cfig.sources.base.Source.signature` of each layer when :attr:`._candidates` was built.
+        """
+
+        self._lock: threading.Lock = threading.Lock()
+        """
+        Lock preventing the index from being built multiple times at once.
+        """
+
+    def __repr__(self):
+        return f"<{self.__class__.__qualname__} of {len(self.layers)} layers>"
+
+    def refresh(self) -> None:
+        """
+        Build again the index of the keys contained in the layers, after fetching again the values of the :class:`~cfig.sources.httpkv.HttpKVSource` layers.
+        """
+
+        for layer in self.layers:
+            if isinstance(layer, HttpKVSource):
+                layer.refresh()
+
+        with self._lock:
+            self._build(self._current_signatures())
+
+    def _current_signatures(self) -> tuple:
+        """
+        Get the current :meth:`~cfig.sources.base.Source.signature` of each layer.
+        """
+
+        return tuple(layer.signature() for layer in self.layers)
+
+    def _build(self, signatures: tuple) -> dict[str, tuple[Source, ...]]:
+        """
+        Build the index of the keys contained in the layers, whose signatures are the given ones.
+
+        Must be called while holding :attr:`._lock`.
+        """
+
+        keys = []
+        for layer in self.layers:
+            layer_keys = layer.keys()
+            keys.append(frozenset(layer_keys) if layer_keys is not None else None)
+
+        candidates = {}
+        for key in set().union(*(layer_keys for layer_keys in keys if layer_keys is not None)):
+            candidates[key] = tuple(layer for layer, layer_keys in zip(self.layers, keys) if layer_keys is None or key in layer_keys)
+
+        self._candidates = candidates
+        self._signatures = signatures
+        return candidates
+
+    def _index(self) -> dict[str, tuple[Source, ...]]:
+        """
+        Get the index of the keys contained in the layers, building it if it wasn't built yet, or if the signature of a layer has changed.
+        """
+
+        signatures = self._current_signatures()
+        if (candidates := self._candidates) is None or signatures != self._signatures:
+            with self._lock:
+                # Another thread might have built the index while this one was waiting for the lock
+                if (candidates := self._candidates) is None or signatures != self._signatures:
+                    candidates = self._build(signatures)
+
+        return candidates
+
+    def candidates(self, key: str) -> tuple[Source, ...]:
+        """
+        Get the layers which may contain the value with the given key, in order of precedence.
+        """
+
+        return self._index().get(key, self.layers)
+
+    def get_with_layer(self, key: str) -> tuple[t.Optional[str], t.Optional[Source]]:
+        """
+        Get the value with the given key, along with the layer it was retrieved from, returning :data:`None` for both if no layer contains it.
+        """
+
+        for layer in self.candidates(key):
+            if value := layer.get(key):
+                return value, layer
+        return None, None
+
+    def layer_of(self, key: str) -> t.Optional[Source]:
+        """
+        Get the layer which the value with the given key is retrieved from, or :data:`None` if no layer contains it.
+        """
+
+        _value, layer = self.get_with_layer(key)
+        return layer
+
+    def get(self, key: str) -> t.Optional[str]:
+        value, _layer = self.get_with_layer(key)
+        return value
+
+    def get_many(self, keys: t.Iterable[str]) -> t.Mapping[str, t.Optional[str]]:
+        result = {}
+        index = self._index()
+        pending = {key: index.get(key, self.layers) for key in keys}
+
+        for layer in self.layers:
+            if not pending:
+                break
+
+            requested = [key for key, candidates in pending.items() if layer in candidates]
+            if not requested:
+                continue
+
+            values = layer.get_many(requested)
+            for key in requested:
+                if value := values.get(key):
+                    result[key] = value
+                    del pending[key]
+
+        return result
+
+    def keys(self) -> t.Optional[t.Collection[str]]:
+        layer_keys = [layer.keys() for layer in self.layers]
+        if any(keys is None for keys in layer_keys):
+            return None
+        return list(set().union(*layer_keys))
+
+    def signature(self) -> t.Optional[t.Hashable]:
+        signatures = self._current_signatures()
+        if any(signature is None for signature in signatures):
+            return None
+        return signatures
+
+
+__all__ = (
+    "LayeredSources",
+)
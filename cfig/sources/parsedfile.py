@@ -0,0 +1,142 @@
+"""
+This module defines the :class:`.ParsedFileSource` abstract class.
+"""
+
+import abc
+import logging
+import mmap
+import os
+import threading
+import typing as t
+from cfig.sources.base import Source
+
+log = logging.getLogger(__name__)
+
+
+class ParsedFileSource(Source, metaclass=abc.ABCMeta):
+    """
+    A source which parses a whole file at once into an index of values, parsing it again only when the file changes.
+
+    The file is considered changed if its inode, modification time or size change; if it does not exist, the source has no values.
+
+    If the file cannot be parsed, the error is raised again by every lookup until the file changes, without parsing it again.
+
+    **Abstract class.** Cannot be instantiated. Should be inherited from other source classes.
+    """
+
+    MMAP_THRESHOLD: t.Optional[int] = None
+    """
+    The size in bytes above which the file is memory-mapped instead of being read wholesale, or :data:`None` if it should never be memory-mapped.
+    """
+
+    def __init__(self, path: t.Union[str, os.PathLike]):
+        self.path: t.Union[str, os.PathLike] = path
+        """
+        The path of the file to parse.
+        """
+
+        self._index: dict[str, str] = {}
+        """
+        Dictionary mapping keys to the values parsed from the file.
+        """
+
+        self._error: t.Optional[Exception] = None
+        """
+        The error raised while parsing the file, or :data:`None` if it was parsed successfully.
+        """
+
+        self._signature: t.Optional[tuple] = None
+        """
+        The inode, modification time and size of the file when :attr:`._index` was parsed, or :data:`None` if it wasn't parsed yet.
+        """
+
+        self._lock: threading.Lock = threading.Lock()
+        """
+        Lock preventing the file from being parsed multiple times at once.
+        """
+
+    def __repr__(self):
+        return f"<{self.__class__.__qualname__} of {os.fspath(self.path)!r}>"
+
+    @abc.abstractmethod
+    def _parse(self, data: t.Union[bytes, mmap.mmap]) -> dict[str, str]:
+        """
+        Parse the contents of the file into a :class:`dict` mapping keys to values.
+
+        ``data`` is a :class:`mmap.mmap` if the file is larger than :attr:`.MMAP_THRESHOLD`, or :class:`bytes` otherwise.
+        """
+
+    def _read(self, size: int) -> dict[str, str]:
+        """
+        Read and :meth:`._parse` the file, memory-mapping it if it is larger than :attr:`.MMAP_THRESHOLD`.
+        """
+
+        with open(self.path, "rb") as file:
+            if size and self.MMAP_THRESHOLD is not None and size > self.MMAP_THRESHOLD:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    return self._parse(data)
+            else:
+                return self._parse(file.read())
+
+    def index(self) -> t.Mapping[str, str]:
+        """
+        Get the index of the values contained in the file, parsing it again if it has changed since the last time.
+
+        :raises Exception: The error raised while parsing the file, if it could not be parsed.
+        """
+
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            signature = None
+        else:
+            signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+        if signature != self._signature:
+            with self._lock:
+                # Another thread might have parsed the file while this one was waiting for the lock
+                if signature != self._signature:
+                    self._error = None
+                    try:
+                        self._index = self._read(stat.st_size) if signature is not None else {}
+                    except FileNotFoundError:
+                        self._index, signature = {}, None
+                    except Exception as e:
+                        log.error("Could not parse %r: %r", self, e)
+                        self._index, self._error = {}, e
+                    self._signature = signature
+
+        if (error := self._error) is not None:
+            raise error
+
+        return self._index
+
+    def get(self, key: str) -> t.Optional[str]:
+        return self.index().get(key)
+
+    def get_many(self, keys: t.Iterable[str]) -> t.Mapping[str, t.Optional[str]]:
+        index = self.index()
+        return {key: index.get(key) for key in keys}
+
+    def keys(self) -> t.Optional[t.Collection[str]]:
+        return list(self.index().keys())
+
+    def signature(self) -> t.Optional[t.Hashable]:
+        try:
+            self.index()
+        except Exception:
+            # The error will be raised by the lookups
+            pass
+        return self._signature
+
+    def watch(self, keys: t.Iterable[str], *, interval: float = 1.0, stopping: t.Optional[threading.Event] = None) -> t.Optional[t.Iterator[tuple[str, t.Optional[str]]]]:
+        """
+        Watch the values with the given keys, checking only whether the file has changed every ``interval`` seconds, and parsing it again only if it did.
+        """
+
+        return self._poll(keys, interval, stopping, self.signature, self.get_many)
+
+
+__all__ = (
+    "ParsedFileSource",
+)
@@ -0,0 +1,72 @@
+"""
+This module defines the :class:`.StructuredFileSource` abstract class.
+"""
+
+import abc
+import json
+import mmap
+import os
+import typing as t
+from cfig.sources.parsedfile import ParsedFileSource
+
+
+class StructuredFileSource(ParsedFileSource, metaclass=abc.ABCMeta):
+    """
+    A source which gets values from a file containing nested tables, flattening them into keys joined by a separator.
+
+    For example, the table ``{"database": {"uri": "..."}}`` is flattened into the ``DATABASE_URI`` key.
+
+    Strings are returned as they are, :data:`None` values are considered missing, booleans become ``true`` or ``false``, lists are encoded as JSON, and all other values are converted via :class:`str`.
+
+    **Abstract class.** Cannot be instantiated. Should be inherited from other source classes.
+    """
+
+    def __init__(self, path: t.Union[str, os.PathLike], *, separator: str = "_", uppercase: bool = True):
+        super().__init__(path)
+
+        self.separator: str = separator
+        """
+        The string joining the names of nested tables and the keys they contain.
+        """
+
+        self.uppercase: bool = uppercase
+        """
+        Whether the flattened keys should be converted to uppercase.
+        """
+
+    @abc.abstractmethod
+    def _load(self, data: t.Union[bytes, mmap.mmap]) -> t.Mapping[str, t.Any]:
+        """
+        Parse the contents of the file into a tree of nested mappings.
+        """
+
+    def _flatten(self, tree: t.Mapping[str, t.Any], prefix: str, index: dict[str, str]) -> None:
+        """
+        Add the values of the given tree to the index, prepending ``prefix`` to their keys.
+        """
+
+        for name, value in tree.items():
+            key = f"{prefix}{name.upper() if self.uppercase else name}"
+
+            if isinstance(value, t.Mapping):
+                self._flatten(value, f"{key}{self.separator}", index)
+            elif value is None:
+                continue
+            elif isinstance(value, str):
+                index[key] = value
+            elif isinstance(value, bool):
+                index[key] = "true" if value else "false"
+            elif isinstance(value, list):
+                index[key] = json.dumps(value, default=str)
+            else:
+                index[key] = str(value)
+
+    def _parse(self, data: t.Union[bytes, mmap.mmap]) -> dict[str, str]:
+        index = {}
+        self._flatten(self._load(data), "", index)
+        return index
+
+
+__all__ = (
+    "StructuredFileSource",
+)
@@ -0,0 +1,41 @@
+"""
+This module defines the :class:`.TomlSource` :class:`~cfig.sources.base.Source`.
+"""
+
+import mmap
+import os
+import typing as t
+from cfig import errors
+from cfig.sources.structured import StructuredFileSource
+
+
+class TomlSource(StructuredFileSource):
+    """
+    A source which gets values from a TOML file, flattening nested tables like :class:`~cfig.sources.structured.StructuredFileSource`.
+
+    Requires Python 3.11 or later, which include :mod:`tomllib` in the standard library, or the ``tomli`` package.
+    """
+
+    def __init__(self, path: t.Union[str, os.PathLike], *, separator: str = "_", uppercase: bool = True):
+        try:
+            import tomllib
+        except ImportError:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                raise errors.MissingDependencyError(f"To use {self.__class__.__qualname__}, Python 3.11 or the `tomli` package are needed.")
+
+        super().__init__(path, separator=separator, uppercase=uppercase)
+
+        self._tomllib = tomllib
+        """
+        The module used to parse TOML.
+        """
+
+    def _load(self, data: t.Union[bytes, mmap.mmap]) -> t.Mapping[str, t.Any]:
+        return self._tomllib.loads(bytes(data).decode("utf-8"))
+
+
+__all__ = (
+    "TomlSource",
+)
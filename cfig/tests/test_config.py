@@ -1,6 +1,16 @@
+import asyncio
+import multiprocessing
 import pytest
 import cfig
+import cfig.sources.base
+import cfig.sources.directory
+import cfig.sources.dotenv
+import cfig.sources.env
+import cfig.sources.layered
 import os
+import threading
+import time
+import types
 import lazy_object_proxy
 import typing as t
 
@@ -11,6 +21,44 @@ except ImportError:
     click = None
 
 
+# Resolvers run in a separate process must be importable, so they cannot be defined inside the tests
+process_config = cfig.Configuration()
+
+
+@process_config.required(executor="process")
+def PROCESS_PID(val: str) -> int:
+    if val == "fail":
+        raise cfig.InvalidValueError("Failing on request.")
+    return os.getpid()
+
+
+@process_config.required()
+def THREAD_PID(val: str) -> int:
+    return os.getpid()
+
+
+# The workers attaching to a shared snapshot must define the same configuration
+shared_config = cfig.Configuration(sources=[cfig.sources.env.EnvironmentSource(environment={"SHARED_NUMBER": "1"})])
+
+
+@shared_config.required()
+def SHARED_NUMBER(val: str) -> int:
+    return int(val)
+
+
+def shared_worker(path, results, published):
+    shared = cfig.SharedSnapshot.attach(path)
+    # Forked workers inherit the timings of the resolutions performed by the parent
+    shared_config.timings.clear()
+
+    for _ in range(2):
+        if not published.wait(timeout=10):
+            return
+        published.clear()
+        shared.sync(shared_config)
+        results.put((shared.generation, int(shared_config.proxies["SHARED_NUMBER"]), list(shared_config.timings.keys())))
+
+
 class TestConfig:
     def test_creation(self):
         config = cfig.Configuration()
@@ -54,6 +102,135 @@ class TestConfig:
         assert basic_config.proxies["SECOND_NUMBER"] is SECOND_NUMBER
         assert basic_config.docs["SECOND_NUMBER"] == """The second number to sum."""
 
+    def test_registration_compact(self):
+        config = cfig.Configuration(sources=[cfig.sources.env.EnvironmentSource(environment={"FIRST_NUMBER": "1"})], compact=True)
+
+        @config.required()
+        def FIRST_NUMBER(val: str) -> int:
+            """The first number to sum."""
+            return int(val)
+
+        @config.optional(doc="The second number to sum.", depends=[FIRST_NUMBER])
+        def SECOND_NUMBER(val: t.Optional[str]) -> int:
+            return FIRST_NUMBER + int(val or 0)
+
+        assert isinstance(config.docs, cfig.Configuration.DocDict)
+        assert config.docs._overrides == {"SECOND_NUMBER": "The second number to sum."}
+        assert dict(config.docs) == {
+            "FIRST_NUMBER": "The first number to sum.",
+            "SECOND_NUMBER": "The second number to sum.",
+        }
+        assert config.dependencies == {"SECOND_NUMBER": ("FIRST_NUMBER",)}
+        assert config.proxies.resolve() == {"FIRST_NUMBER": 1, "SECOND_NUMBER": 1}
+
+        with pytest.raises(cfig.DuplicateProxyNameError):
+            config.required(key="FIRST_NUMBER")(lambda val: val)
+
+        config.docs["FIRST_NUMBER"] = "Overridden."
+        assert config.docs["FIRST_NUMBER"] == "Overridden."
+        del config.docs["FIRST_NUMBER"]
+        assert "FIRST_NUMBER" not in config.docs
+        assert list(config.docs) == ["SECOND_NUMBER"]
+        with pytest.raises(KeyError):
+            del config.docs["FIRST_NUMBER"]
+
+    @pytest.mark.parametrize("compact", [False, True])
+    def test_register_many(self, compact):
+        config = cfig.Configuration(sources=[cfig.sources.env.EnvironmentSource(environment={"FIRST_NUMBER": "1"})], compact=compact)
+
+        def parse_int(val: t.Optional[str]) -> t.Optional[int]:
+            """A number."""
+            return int(val) if val is not None else None
+
+        proxies = config.register_many([
+            ("FIRST_NUMBER", (parse_int, True, "The first number to sum.")),
+            ("SECOND_NUMBER", (parse_int, False, None)),
+        ])
+
+        assert list(proxies) == ["FIRST_NUMBER", "SECOND_NUMBER"]
+        assert config.proxies["FIRST_NUMBER"] is proxies["FIRST_NUMBER"]
+        assert not proxies["FIRST_NUMBER"].__resolved__
+        assert config.docs["FIRST_NUMBER"] == "The first number to sum."
+        assert config.docs["SECOND_NUMBER"] == "A number."
+        assert config.proxies.resolve() == {"FIRST_NUMBER": 1, "SECOND_NUMBER": None}
+
+        with pytest.raises(cfig.DuplicateProxyNameError):
+            config.register_many({"THIRD_NUMBER": (parse_int, False, None), "SECOND_NUMBER": (parse_int, False, None)})
+        with pytest.raises(cfig.DuplicateProxyNameError):
+            config.register_many([("THIRD_NUMBER", (parse_int, False, None)), ("THIRD_NUMBER", (parse_int, False, None))])
+        assert "THIRD_NUMBER" not in config.proxies
+        assert "THIRD_NUMBER" not in config.docs
+
+    @pytest.fixture(scope="function")
+    def fields_config(self):
+        config = cfig.Configuration(sources=[cfig.sources.env.EnvironmentSource(environment={
+            "WORKERS": "8",
+            "PORT": "not a port",
+            "DEBUG": "Yes",
+            "HOSTS": "a, b,c",
+            "RATIOS": "0.5,1",
+        })])
+
+        config.field("WORKERS", int, default=4, doc="The number of workers to start.")
+        config.field("THREADS", int, default=2)
+        config.field("PORT", int)
+        config.field("DEBUG", bool, default=False)
+        config.field("HOSTS", list[str])
+        config.field("RATIOS", tuple[float, ...])
+        config.field("NAME", t.Optional[str], default=None)
+        config.field("SECRET", str)
+
+        yield config
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_field_resolve(self, fields_config, parallel):
+        with pytest.raises(cfig.BatchResolutionFailure) as ei:
+            fields_config.proxies.resolve(parallel=parallel)
+
+        assert list(ei.value.errors) == ["PORT", "SECRET"]
+        assert isinstance(ei.value.errors["PORT"], cfig.InvalidValueError)
+        assert isinstance(ei.value.errors["SECRET"], cfig.MissingValueError)
+
+        values = {key: proxy.__wrapped__ for key, proxy in fields_config.proxies.items() if proxy.__resolved__}
+        assert values == {
+            "WORKERS": 8,
+            "THREADS": 2,
+            "DEBUG": True,
+            "HOSTS": ["a", "b", "c"],
+            "RATIOS": (0.5, 1.0),
+            "NAME": None,
+        }
+
+        assert fields_config.docs["WORKERS"] == "The number of workers to start."
+        assert fields_config.timings["WORKERS"].attempts == 1
+        assert fields_config.timings["WORKERS"].source is fields_config.sources[0]
+        assert isinstance(fields_config.timings["PORT"].error, cfig.InvalidValueError)
+
+    def test_field_resolve_failfast(self, fields_config):
+        with pytest.raises(cfig.InvalidValueError):
+            fields_config.proxies.resolve_failfast()
+
+    def test_field_access(self, fields_config):
+        assert fields_config.proxies["WORKERS"] == 8
+        assert fields_config.proxies["THREADS"] == 2
+        assert fields_config.proxies["HOSTS"] == ["a", "b", "c"]
+
+        with pytest.raises(cfig.InvalidValueError):
+            fields_config.proxies["PORT"].__wrapped__
+
+    def test_field_converters(self, fields_config):
+        workers = fields_config.proxies["WORKERS"].__factory__
+        threads = fields_config.proxies["THREADS"].__factory__
+        assert workers.resolver is threads.resolver is cfig.Converter.for_type(int)
+
+        values, failures = cfig.Converter.for_type(int).convert_many(["1", "x", "3"])
+        assert values == [1, None, 3]
+        assert list(failures) == [1]
+        assert isinstance(failures[1], cfig.InvalidValueError)
+
+        with pytest.raises(cfig.UnsupportedTypeError):
+            fields_config.field("MODE", t.Union[int, str])
+
     @pytest.fixture(scope="function")
     def numbers_config(self, basic_config):
         @basic_config.required()
@@ -293,3 +470,874 @@ class TestConfig:
         assert result.exit_code == 0
         assert "FIRST_NUMBER" in result.output
         assert "SECOND_NUMBER" in result.output
+
+    def test_resolve_parallel(self, numbers_config, monkeypatch):
+        monkeypatch.setenv("FIRST_NUMBER", "1")
+        monkeypatch.setenv("SECOND_NUMBER", "2")
+
+        first_number = numbers_config.proxies["FIRST_NUMBER"]
+        second_number = numbers_config.proxies["SECOND_NUMBER"]
+
+        result_dict = numbers_config.proxies.resolve(parallel=True, max_workers=2)
+
+        assert first_number.__resolved__
+        assert second_number.__resolved__
+
+        assert list(result_dict.keys()) == ["FIRST_NUMBER", "SECOND_NUMBER"]
+        assert result_dict["FIRST_NUMBER"] == 1
+        assert result_dict["SECOND_NUMBER"] == 2
+
+    def test_resolve_parallel_invalid(self, numbers_config, monkeypatch):
+        monkeypatch.setenv("FIRST_NUMBER", "a")
+        monkeypatch.setenv("SECOND_NUMBER", "b")
+
+        with pytest.raises(cfig.BatchResolutionFailure) as ei:
+            numbers_config.proxies.resolve(parallel=True)
+
+        assert isinstance(ei.value.errors["FIRST_NUMBER"], cfig.InvalidValueError)
+        assert isinstance(ei.value.errors["SECOND_NUMBER"], cfig.InvalidValueError)
+
+    def test_resolve_ff_parallel_invalid(self, numbers_config, monkeypatch):
+        monkeypatch.setenv("FIRST_NUMBER", "a")
+        monkeypatch.setenv("SECOND_NUMBER", "")
+
+        with pytest.raises(cfig.InvalidValueError):
+            numbers_config.proxies.resolve_failfast(parallel=True)
+
+    @pytest.fixture(scope="function")
+    def process_proxies(self):
+        yield process_config.proxies
+        for proxy in process_config.proxies.values():
+            if proxy.__resolved__:
+                del proxy.__wrapped__
+
+    def test_resolve_process(self, process_proxies, monkeypatch):
+        monkeypatch.setenv("PROCESS_PID", "1")
+        monkeypatch.setenv("THREAD_PID", "1")
+
+        assert process_proxies.resolve(parallel=True, max_processes=1) == {"PROCESS_PID": process_proxies["PROCESS_PID"], "THREAD_PID": os.getpid()}
+        assert process_proxies["PROCESS_PID"] != os.getpid()
+        assert process_config.timings["PROCESS_PID"].attempts == 1
+
+    def test_resolve_process_serial(self, process_proxies, monkeypatch):
+        monkeypatch.setenv("PROCESS_PID", "1")
+        monkeypatch.setenv("THREAD_PID", "1")
+
+        assert process_proxies.resolve() == {"PROCESS_PID": os.getpid(), "THREAD_PID": os.getpid()}
+
+    def test_resolve_process_invalid(self, process_proxies, monkeypatch):
+        monkeypatch.setenv("PROCESS_PID", "fail")
+        monkeypatch.setenv("THREAD_PID", "1")
+
+        with pytest.raises(cfig.BatchResolutionFailure) as ei:
+            process_proxies.resolve(parallel=True, max_processes=1)
+
+        assert isinstance(ei.value.errors["PROCESS_PID"], cfig.InvalidValueError)
+        assert "THREAD_PID" not in ei.value.errors
+
+    def test_resolve_ff_process_invalid(self, process_proxies, monkeypatch):
+        monkeypatch.setenv("PROCESS_PID", "fail")
+        monkeypatch.setenv("THREAD_PID", "1")
+
+        with pytest.raises(cfig.InvalidValueError):
+            process_proxies.resolve_failfast(parallel=True, max_processes=1)
+
+    def test_process_invalid_executor(self, basic_config):
+        def LOCAL(val: str) -> str:
+            return val
+
+        async def ASYNCHRONOUS(val: str) -> str:
+            return val
+
+        with pytest.raises(cfig.InvalidExecutorError):
+            basic_config.required(executor="fiber")(PROCESS_PID.__factory__.resolver)
+        with pytest.raises(cfig.InvalidExecutorError):
+            basic_config.required(executor="process")(LOCAL)
+        with pytest.raises(cfig.InvalidExecutorError):
+            basic_config.required(executor="process")(ASYNCHRONOUS)
+
+    def test_resolve_ff_parallel_cancel(self, basic_config):
+        started = []
+
+        @basic_config.optional()
+        def FAILING(val):
+            raise cfig.InvalidValueError("Always fails.")
+
+        for index in range(16):
+            @basic_config.optional(key=f"SLOW_{index}")
+            def _slow(val):
+                started.append(True)
+                time.sleep(0.05)
+                return val
+
+        with pytest.raises(cfig.InvalidValueError):
+            basic_config.proxies.resolve_failfast(parallel=True, max_workers=1)
+
+        assert len(started) < 16
+
+    @pytest.fixture(scope="function")
+    def async_events(self):
+        yield []
+
+    @pytest.fixture(scope="function")
+    def async_config(self, basic_config, async_events):
+        @basic_config.required()
+        async def FIRST_NUMBER(val: str) -> int:
+            """The first number to sum, resolved asynchronously."""
+            async_events.append("FIRST_NUMBER started")
+            await asyncio.sleep(0.05)
+            async_events.append("FIRST_NUMBER ended")
+            try:
+                return int(val)
+            except (ValueError, TypeError):
+                raise cfig.InvalidValueError("Not an int.")
+
+        @basic_config.optional()
+        async def SECOND_NUMBER(val: t.Optional[str]) -> t.Optional[int]:
+            """The second number to sum, resolved asynchronously."""
+            async_events.append("SECOND_NUMBER started")
+            await asyncio.sleep(0.05)
+            async_events.append("SECOND_NUMBER ended")
+            if val is None:
+                return None
+            try:
+                return int(val)
+            except (ValueError, TypeError):
+                raise cfig.InvalidValueError("Not an int.")
+
+        @basic_config.optional()
+        def THIRD_NUMBER(val: t.Optional[str]) -> t.Optional[int]:
+            """The third number to sum, resolved synchronously."""
+            if val is None:
+                return None
+            return int(val)
+
+        yield basic_config
+
+    def test_resolve_async(self, async_config, async_events, monkeypatch):
+        monkeypatch.setenv("FIRST_NUMBER", "1")
+        monkeypatch.setenv("SECOND_NUMBER", "2")
+        monkeypatch.setenv("THIRD_NUMBER", "3")
+
+        first_number = async_config.proxies["FIRST_NUMBER"]
+
+        assert not first_number.__resolved__
+
+        result_dict = asyncio.run(async_config.proxies.resolve_async())
+
+        # Both asynchronous resolvers should have been awaited concurrently, so both should start before either ends
+        assert sorted(async_events[:2]) == ["FIRST_NUMBER started", "SECOND_NUMBER started"]
+        assert sorted(async_events[2:]) == ["FIRST_NUMBER ended", "SECOND_NUMBER ended"]
+
+        assert first_number.__resolved__
+        assert first_number == 1
+
+        assert result_dict == {"FIRST_NUMBER": 1, "SECOND_NUMBER": 2, "THIRD_NUMBER": 3}
+
+    def test_resolve_async_invalid(self, async_config, monkeypatch):
+        monkeypatch.setenv("FIRST_NUMBER", "a")
+        monkeypatch.setenv("SECOND_NUMBER", "")
+
+        with pytest.raises(cfig.BatchResolutionFailure) as ei:
+            asyncio.run(async_config.proxies.resolve_async())
+
+        assert isinstance(ei.value.errors["FIRST_NUMBER"], cfig.InvalidValueError)
+        assert "SECOND_NUMBER" not in ei.value.errors
+
+    def test_resolve_async_sync_access(self, async_config, monkeypatch):
+        monkeypatch.setenv("FIRST_NUMBER", "1")
+
+        first_number = async_config.proxies["FIRST_NUMBER"]
+
+        assert first_number == 1
+
+        del first_number.__wrapped__
+
+        async def access():
+            return first_number + 0
+
+        with pytest.raises(cfig.SynchronousAccessError):
+            asyncio.run(access())
+
+    @pytest.fixture(scope="function")
+    def dependent_config(self, numbers_config):
+        first_number = numbers_config.proxies["FIRST_NUMBER"]
+
+        @numbers_config.required(depends=[first_number, "SECOND_NUMBER"])
+        def SUM(val: str) -> int:
+            """The sum of the two numbers, plus this one."""
+            second_number = numbers_config.proxies["SECOND_NUMBER"]
+            return first_number + (second_number or 0) + int(val)
+
+        yield numbers_config
+
+    def test_dependencies(self, dependent_config):
+        assert dependent_config.dependencies["SUM"] == ("FIRST_NUMBER", "SECOND_NUMBER")
+        assert dependent_config.proxies.waves() == [["FIRST_NUMBER", "SECOND_NUMBER"], ["SUM"]]
+
+    def test_dependencies_cycle(self, basic_config):
+        @basic_config.required(depends=["SECOND"])
+        def FIRST(val: str) -> str:
+            return val
+
+        with pytest.raises(cfig.DependencyCycleError) as ei:
+            @basic_config.required(depends=["FIRST"])
+            def SECOND(val: str) -> str:
+                return val
+
+        assert ei.value.args == ("SECOND", "FIRST", "SECOND")
+        assert "SECOND" not in basic_config.proxies
+
+    def test_dependencies_unknown(self, basic_config):
+        with pytest.raises(cfig.UnknownDependencyError):
+            @basic_config.required(depends=[1])
+            def FIRST(val: str) -> str:
+                return val
+
+    @pytest.fixture(scope="function")
+    def slow_config(self):
+        config = cfig.Configuration(sources=[cfig.sources.env.EnvironmentSource(environment={"SLOW": "1"})])
+        config.calls = []
+
+        @config.required()
+        def SLOW(val: str) -> object:
+            config.calls.append(threading.get_ident())
+            time.sleep(0.05)
+            if val == "fail":
+                raise cfig.InvalidValueError("Failed.")
+            return object()
+
+        yield config
+
+    def _access_concurrently(self, proxy, count: int, operation: t.Callable[[t.Any], t.Any] = lambda proxy: proxy.__wrapped__) -> list:
+        barrier = threading.Barrier(count)
+        results = []
+
+        def access():
+            barrier.wait()
+            try:
+                results.append(operation(proxy))
+            except Exception as e:
+                results.append(e)
+
+        threads = [threading.Thread(target=access) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+
+        return results
+
+    def test_single_flight(self, slow_config):
+        results = self._access_concurrently(slow_config.proxies["SLOW"], 300)
+
+        assert len(slow_config.calls) == 1
+        assert len(results) == 300
+        assert all(result is results[0] for result in results)
+        assert slow_config.proxies["SLOW"].__resolved__
+        assert slow_config.contentions > 0
+        assert slow_config._inflight == {}
+
+    def test_single_flight_error(self, slow_config):
+        slow_config.sources[0].environment["SLOW"] = "fail"
+        # Accessing __wrapped__ calls a failing factory twice, so use another operation
+        results = self._access_concurrently(slow_config.proxies["SLOW"], 100, operation=str)
+
+        assert len(slow_config.calls) == 1
+        assert all(isinstance(result, cfig.InvalidValueError) for result in results)
+        assert not slow_config.proxies["SLOW"].__resolved__
+        assert slow_config._inflight == {}
+
+        # The failure is not cached, so the next access tries again
+        slow_config.sources[0].environment["SLOW"] = "1"
+        assert str(slow_config.proxies["SLOW"])
+        assert len(slow_config.calls) == 2
+
+    def test_single_flight_resolve(self, slow_config):
+        thread = threading.Thread(target=slow_config.proxies.resolve, kwargs={"parallel": True})
+        thread.start()
+        results = self._access_concurrently(slow_config.proxies["SLOW"], 50)
+        thread.join(timeout=10)
+
+        assert len(slow_config.calls) == 1
+        assert all(result is results[0] for result in results)
+
+    def test_single_flight_cycle(self, basic_config):
+        @basic_config.optional()
+        def MYSELF(val: t.Optional[str]) -> t.Any:
+            return MYSELF + 1
+
+        with pytest.raises(cfig.BatchResolutionFailure) as ei:
+            basic_config.proxies.resolve()
+        assert isinstance(ei.value.errors["MYSELF"], cfig.DependencyCycleError)
+        assert basic_config._inflight == {}
+
+    def test_prewarm(self, slow_config):
+        future = slow_config.prewarm()
+
+        # Accessing the proxy while it is being prewarmed waits for the resolution in progress
+        value = slow_config.proxies["SLOW"].__wrapped__
+
+        assert future.result(timeout=10) == {"SLOW": value}
+        assert len(slow_config.calls) == 1
+        assert slow_config.calls[0] != threading.get_ident()
+
+    @pytest.fixture(scope="function")
+    def ordered_config(self):
+        config = cfig.Configuration(sources=[cfig.sources.env.EnvironmentSource(environment={"FAILING": "fail"})])
+        config.order = []
+
+        @config.optional()
+        def FIRST(val: t.Optional[str]) -> str:
+            config.order.append("FIRST")
+            return "first"
+
+        @config.optional()
+        def DEPENDENCY(val: t.Optional[str]) -> str:
+            config.order.append("DEPENDENCY")
+            return "dependency"
+
+        @config.optional(depends=[DEPENDENCY])
+        def PRIORITY(val: t.Optional[str]) -> str:
+            config.order.append("PRIORITY")
+            return f"priority {DEPENDENCY}"
+
+        @config.optional()
+        def FAILING(val: t.Optional[str]) -> str:
+            config.order.append("FAILING")
+            raise cfig.InvalidValueError("Failing on request.")
+
+        yield config
+
+    def test_prewarm_priority(self, ordered_config):
+        future = ordered_config.prewarm(priority=["PRIORITY"])
+
+        with pytest.raises(cfig.BatchResolutionFailure) as ei:
+            future.result(timeout=10)
+
+        assert list(ei.value.errors) == ["FAILING"]
+        assert ordered_config.order == ["DEPENDENCY", "PRIORITY", "FIRST", "FAILING"]
+        assert ordered_config.proxies["PRIORITY"] == "priority dependency"
+
+    def test_prewarm_keys(self, ordered_config):
+        assert ordered_config.prewarm(["FIRST"]).result(timeout=10) == {"FIRST": "first"}
+        assert ordered_config.order == ["FIRST"]
+
+    def test_prewarm_async(self, ordered_config):
+        async def run():
+            task = ordered_config.prewarm(["FIRST", "PRIORITY"], priority=["PRIORITY"])
+            assert isinstance(task, asyncio.Task)
+            return await task
+
+        assert asyncio.run(run()) == {"DEPENDENCY": "dependency", "PRIORITY": "priority dependency", "FIRST": "first"}
+        assert ordered_config.order == ["DEPENDENCY", "PRIORITY", "FIRST"]
+
+    @pytest.fixture(scope="function")
+    def flaky_config(self):
+        config = cfig.Configuration(sources=[cfig.sources.env.EnvironmentSource(environment={"FLAKY": "3", "INVALID": "1", "HANGING": "1"})])
+        config.calls = []
+        retry = cfig.Retry(attempts=3, delay=0.001)
+
+        @config.required(retry=retry)
+        def FLAKY(val: str) -> int:
+            config.calls.append("FLAKY")
+            if len(config.calls) < int(val):
+                raise ConnectionResetError("Failing on request.")
+            return len(config.calls)
+
+        @config.required(retry=retry)
+        def INVALID(val: str) -> int:
+            config.calls.append("INVALID")
+            raise cfig.InvalidValueError("Failing on request.")
+
+        @config.required(timeout=0.05)
+        def HANGING(val: str) -> str:
+            time.sleep(float(val))
+            return "hanging"
+
+        @config.optional(timeout=0.05, retry=retry)
+        async def HANGING_ASYNC(val: t.Optional[str]) -> str:
+            await asyncio.sleep(1)
+            return "hanging"
+
+        yield config
+
+    def test_retry(self, flaky_config):
+        assert cfig.Configuration.ProxyDict(FLAKY=flaky_config.proxies["FLAKY"]).resolve() == {"FLAKY": 3}
+        assert flaky_config.timings["FLAKY"].attempts == 3
+
+    def test_retry_exhausted(self, flaky_config):
+        flaky_config.sources[0].environment["FLAKY"] = "4"
+
+        with pytest.raises(cfig.BatchResolutionFailure) as ei:
+            cfig.Configuration.ProxyDict(FLAKY=flaky_config.proxies["FLAKY"]).resolve()
+
+        assert isinstance(ei.value.errors["FLAKY"], ConnectionResetError)
+        assert flaky_config.timings["FLAKY"].attempts == 3
+
+    def test_retry_unexpected_error(self, flaky_config):
+        with pytest.raises(cfig.InvalidValueError):
+            cfig.Configuration.ProxyDict(INVALID=flaky_config.proxies["INVALID"]).resolve_failfast()
+
+        assert flaky_config.calls == ["INVALID"]
+
+    def test_retry_delays(self):
+        retry = cfig.Retry(attempts=5, delay=1, multiplier=3, max_delay=5, jitter=0.5)
+        delays = list(retry.delays())
+
+        assert len(delays) == 4
+        for delay, maximum in zip(delays, [1, 3, 5, 5]):
+            assert maximum / 2 <= delay <= maximum
+
+        with pytest.raises(ValueError):
+            cfig.Retry(attempts=0)
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_timeout(self, flaky_config, parallel):
+        start = time.perf_counter()
+        with pytest.raises(cfig.BatchResolutionFailure) as ei:
+            cfig.Configuration.ProxyDict(HANGING=flaky_config.proxies["HANGING"]).resolve(parallel=parallel)
+
+        assert time.perf_counter() - start < 0.5
+        assert isinstance(ei.value.errors["HANGING"], cfig.ResolutionTimeoutError)
+        assert ei.value.errors["HANGING"].args == ("HANGING", 0.05)
+
+        flaky_config.sources[0].environment["HANGING"] = "0"
+        assert cfig.Configuration.ProxyDict(HANGING=flaky_config.proxies["HANGING"]).resolve(parallel=parallel) == {"HANGING": "hanging"}
+
+    def test_timeout_async(self, flaky_config):
+        with pytest.raises(cfig.BatchResolutionFailure) as ei:
+            asyncio.run(cfig.Configuration.ProxyDict(HANGING_ASYNC=flaky_config.proxies["HANGING_ASYNC"]).resolve_async())
+
+        assert isinstance(ei.value.errors["HANGING_ASYNC"], cfig.ResolutionTimeoutError)
+        assert flaky_config.timings["HANGING_ASYNC"].attempts == 1
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_resolve_dependencies(self, dependent_config, monkeypatch, parallel):
+        monkeypatch.setenv("FIRST_NUMBER", "1")
+        monkeypatch.setenv("SECOND_NUMBER", "2")
+        monkeypatch.setenv("SUM", "3")
+
+        result_dict = dependent_config.proxies.resolve(parallel=parallel)
+
+        assert list(result_dict.keys()) == ["FIRST_NUMBER", "SECOND_NUMBER", "SUM"]
+        assert result_dict["SUM"] == 6
+
+    @pytest.mark.parametrize("parallel", [False, True])
+    def test_resolve_dependencies_failed(self, dependent_config, monkeypatch, parallel):
+        monkeypatch.setenv("FIRST_NUMBER", "a")
+        monkeypatch.setenv("SECOND_NUMBER", "2")
+        monkeypatch.setenv("SUM", "3")
+
+        with pytest.raises(cfig.BatchResolutionFailure) as ei:
+            dependent_config.proxies.resolve(parallel=parallel)
+
+        assert isinstance(ei.value.errors["FIRST_NUMBER"], cfig.InvalidValueError)
+        assert isinstance(ei.value.errors["SUM"], cfig.FailedDependencyError)
+        assert ei.value.errors["SUM"].args == ("FIRST_NUMBER",)
+
+    def test_resolve_prefetch(self):
+        class CountingSource(cfig.sources.base.Source):
+            def __init__(self, values):
+                self.values = values
+                self.get_calls = 0
+                self.get_many_calls = []
+
+            def get(self, key):
+                self.get_calls += 1
+                return self.values.get(key)
+
+            def get_many(self, keys):
+                self.get_many_calls.append(list(keys))
+                return {key: self.values[key] for key in keys if key in self.values}
+
+        first_source = CountingSource({"FIRST_NUMBER": "1"})
+        second_source = CountingSource({"FIRST_NUMBER": "3", "SECOND_NUMBER": "2"})
+        config = cfig.Configuration(sources=[first_source, second_source])
+
+        @config.required()
+        def FIRST_NUMBER(val: str) -> int:
+            return int(val)
+
+        @config.required()
+        def SECOND_NUMBER(val: str) -> int:
+            return int(val)
+
+        result_dict = config.proxies.resolve()
+
+        assert result_dict == {"FIRST_NUMBER": 1, "SECOND_NUMBER": 2}
+        assert first_source.get_calls == 0
+        assert second_source.get_calls == 0
+        assert first_source.get_many_calls == [["FIRST_NUMBER", "SECOND_NUMBER"]]
+        assert second_source.get_many_calls == [["SECOND_NUMBER"]]
+        assert config._prefetched == []
+
+    def test_reload(self, dependent_config, monkeypatch):
+        monkeypatch.setenv("FIRST_NUMBER", "1")
+        monkeypatch.setenv("SECOND_NUMBER", "2")
+        monkeypatch.setenv("SUM", "3")
+
+        calls = []
+
+        def callback(key, previous, value):
+            calls.append((key, previous, value))
+
+        dependent_config.subscribe("SUM", callback)
+        dependent_config.subscribe("SECOND_NUMBER", callback)
+        dependent_config.proxies.resolve()
+
+        assert dependent_config.reload() == {}
+
+        monkeypatch.setenv("FIRST_NUMBER", "4")
+
+        assert dependent_config.reload() == {"FIRST_NUMBER": 4, "SUM": 9}
+        assert calls == [("SUM", 6, 9)]
+        assert dependent_config.proxies["SECOND_NUMBER"] == 2
+
+    def test_reload_invalid(self, numbers_config, monkeypatch):
+        monkeypatch.setenv("FIRST_NUMBER", "1")
+        monkeypatch.setenv("SECOND_NUMBER", "2")
+
+        numbers_config.proxies.resolve()
+
+        monkeypatch.setenv("FIRST_NUMBER", "a")
+        monkeypatch.setenv("SECOND_NUMBER", "3")
+
+        with pytest.raises(cfig.BatchResolutionFailure) as ei:
+            numbers_config.reload()
+
+        assert isinstance(ei.value.errors["FIRST_NUMBER"], cfig.InvalidValueError)
+        assert numbers_config.proxies["FIRST_NUMBER"] == 1
+        assert numbers_config.proxies["FIRST_NUMBER"].__factory__.raw == "1"
+        assert numbers_config.proxies["SECOND_NUMBER"] == 3
+
+        # The failed value should be retried by the next reload
+        with pytest.raises(cfig.BatchResolutionFailure):
+            numbers_config.reload()
+
+    def test_reload_transient_failure(self, basic_config, monkeypatch):
+        failing = True
+
+        @basic_config.required()
+        def NUMBER(val: str) -> int:
+            if failing and val == "2":
+                raise cfig.InvalidValueError("Temporarily failing.")
+            return int(val)
+
+        monkeypatch.setenv("NUMBER", "1")
+        assert basic_config.proxies.resolve() == {"NUMBER": 1}
+
+        monkeypatch.setenv("NUMBER", "2")
+        with pytest.raises(cfig.BatchResolutionFailure):
+            basic_config.reload()
+        assert NUMBER == 1
+
+        failing = False
+        assert basic_config.reload() == {"NUMBER": 2}
+
+    def test_reloader(self, numbers_config, monkeypatch, tmp_path):
+        path = tmp_path / "first_number.txt"
+        path.write_text("1")
+        monkeypatch.setenv("FIRST_NUMBER", "")
+        monkeypatch.setenv("FIRST_NUMBER_FILE", str(path))
+        monkeypatch.setenv("SECOND_NUMBER", "2")
+
+        numbers_config.proxies.resolve()
+
+        reloader = cfig.Reloader(numbers_config)
+        assert reloader.check() == {}
+
+        path.write_text("10")
+        os.utime(path, ns=(0, 0))
+
+        assert reloader.check() == {"FIRST_NUMBER": 10}
+        assert reloader.check() == {}
+
+    def test_reloader_directory(self, monkeypatch, tmp_path):
+        (tmp_path / "FIRST_NUMBER").write_text("1")
+        config = cfig.Configuration(sources=[cfig.sources.directory.DirectorySource(tmp_path)])
+
+        @config.required()
+        def FIRST_NUMBER(val: str) -> int:
+            return int(val)
+
+        config.proxies.resolve()
+
+        reloader = cfig.Reloader(config)
+        assert reloader.check() == {}
+
+        (tmp_path / "FIRST_NUMBER").write_text("10")
+        os.utime(tmp_path / "FIRST_NUMBER", ns=(0, 0))
+
+        assert reloader.check() == {"FIRST_NUMBER": 10}
+
+    def test_watcher(self, tmp_path):
+        (tmp_path / "FIRST_NUMBER").write_text("1")
+        (tmp_path / "SECOND_NUMBER").write_text("2")
+        config = cfig.Configuration(sources=[cfig.sources.env.EnvironmentSource(environment={}), cfig.sources.directory.DirectorySource(tmp_path)])
+
+        @config.required()
+        def FIRST_NUMBER(val: str) -> int:
+            return int(val)
+
+        @config.required()
+        def SECOND_NUMBER(val: str) -> int:
+            return int(val)
+
+        config.proxies.resolve()
+        changed = threading.Event()
+        calls = []
+
+        def callback(key, previous, value):
+            calls.append((key, previous, value))
+            changed.set()
+
+        config.subscribe("FIRST_NUMBER", callback)
+        config.subscribe("SECOND_NUMBER", callback)
+
+        with cfig.Watcher(config, interval=0.01):
+            (tmp_path / "FIRST_NUMBER").write_text("10")
+            os.utime(tmp_path / "FIRST_NUMBER", ns=(0, 0))
+            assert changed.wait(5)
+
+        assert calls == [("FIRST_NUMBER", 1, 10)]
+        assert FIRST_NUMBER == 10
+        assert SECOND_NUMBER == 2
+
+    def test_reload_layered(self):
+        overrides = {}
+        layers = cfig.sources.layered.LayeredSources([
+            cfig.sources.env.EnvironmentSource(environment=overrides),
+            cfig.sources.env.EnvironmentSource(environment={"NUMBER": "1"}),
+        ])
+        config = cfig.Configuration(sources=[layers])
+
+        @config.required()
+        def NUMBER(val: str) -> int:
+            return int(val)
+
+        assert config.proxies.resolve() == {"NUMBER": 1}
+
+        overrides["NUMBER"] = "2"
+        assert config.reload() == {"NUMBER": 2}
+
+    def test_reloader_layered(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_text("FIRST_NUMBER=1\n")
+        layers = cfig.sources.layered.LayeredSources([
+            cfig.sources.dotenv.DotenvSource(path, environment={}),
+            cfig.sources.env.EnvironmentSource(environment={"FIRST_NUMBER": "2"}),
+        ])
+        config = cfig.Configuration(sources=[layers])
+
+        @config.required()
+        def FIRST_NUMBER(val: str) -> int:
+            return int(val)
+
+        config.proxies.resolve()
+
+        reloader = cfig.Reloader(config)
+        assert reloader.check() == {}
+
+        path.write_text("OTHER=1\n")
+        os.utime(path, ns=(0, 0))
+
+        assert reloader.check() == {"FIRST_NUMBER": 2}
+
+    def test_freeze(self, numbers_config, monkeypatch):
+        monkeypatch.setenv("FIRST_NUMBER", "1")
+        monkeypatch.setenv("SECOND_NUMBER", "2")
+
+        frozen = numbers_config.freeze()
+
+        assert type(frozen.FIRST_NUMBER) is int
+        assert frozen.FIRST_NUMBER == 1
+        assert frozen.SECOND_NUMBER == 2
+
+        with pytest.raises(AttributeError):
+            frozen.FIRST_NUMBER = 3
+
+        with pytest.raises(AttributeError):
+            frozen.THIRD_NUMBER = 3
+
+    def test_freeze_invalid_key(self, basic_config):
+        resolved = []
+
+        @basic_config.optional(key="my-key")
+        def MY_KEY(val: t.Optional[str]) -> t.Optional[str]:
+            resolved.append(val)
+            return val
+
+        with pytest.raises(cfig.UnfreezableKeyError):
+            basic_config.freeze()
+        assert resolved == []
+
+    def test_freeze_module(self, numbers_config, monkeypatch):
+        monkeypatch.setenv("FIRST_NUMBER", "1")
+        monkeypatch.setenv("SECOND_NUMBER", "2")
+
+        module = types.ModuleType("numbers_definition")
+        module.FIRST_NUMBER = numbers_config.proxies["FIRST_NUMBER"]
+        module.RENAMED_NUMBER = numbers_config.proxies["SECOND_NUMBER"]
+        module.UNRELATED = "unrelated"
+
+        numbers_config.freeze(module=module)
+
+        assert type(module.FIRST_NUMBER) is int
+        assert module.FIRST_NUMBER == 1
+        assert type(module.RENAMED_NUMBER) is int
+        assert module.RENAMED_NUMBER == 2
+        assert module.UNRELATED == "unrelated"
+
+    def test_snapshot(self, numbers_config, monkeypatch, tmp_path):
+        monkeypatch.setenv("FIRST_NUMBER", "1")
+        monkeypatch.setenv("SECOND_NUMBER", "2")
+        path = tmp_path / "config.snapshot"
+
+        assert cfig.Snapshot.load(path) is None
+        cfig.Snapshot.take(numbers_config).save(path)
+        numbers_config.proxies.unresolve()
+        numbers_config.timings.clear()
+
+        snapshot = cfig.Snapshot.load(path)
+        assert snapshot.values == {"FIRST_NUMBER": 1, "SECOND_NUMBER": 2}
+        assert snapshot.apply(numbers_config)
+        assert numbers_config.proxies["FIRST_NUMBER"].__resolved__
+        assert numbers_config.proxies["FIRST_NUMBER"].__factory__.raw == "1"
+        assert numbers_config.proxies["SECOND_NUMBER"] == 2
+        # No resolver should have been run
+        assert numbers_config.timings.keys() == set()
+
+    def test_snapshot_changed(self, numbers_config, monkeypatch, tmp_path):
+        monkeypatch.setenv("FIRST_NUMBER", "1")
+        monkeypatch.setenv("SECOND_NUMBER", "2")
+        path = tmp_path / "config.snapshot"
+
+        cfig.Snapshot.take(numbers_config).save(path)
+        numbers_config.proxies.unresolve()
+        monkeypatch.setenv("SECOND_NUMBER", "3")
+
+        assert not cfig.Snapshot.load(path).apply(numbers_config)
+        assert not numbers_config.proxies["FIRST_NUMBER"].__resolved__
+        assert numbers_config.proxies["SECOND_NUMBER"] == 3
+
+    def test_snapshot_unpicklable(self, basic_config, monkeypatch):
+        monkeypatch.setenv("LOCK", "1")
+        monkeypatch.setenv("NUMBER", "2")
+
+        @basic_config.required()
+        def LOCK(val: str):
+            return threading.Lock()
+
+        @basic_config.required()
+        def NUMBER(val: str):
+            return int(val)
+
+        snapshot = cfig.Snapshot.loads(cfig.Snapshot.take(basic_config).dumps())
+        assert snapshot.values == {"NUMBER": 2}
+
+    def test_snapshot_corrupted(self, tmp_path):
+        path = tmp_path / "config.snapshot"
+        path.write_bytes(b"not a snapshot")
+
+        assert cfig.Snapshot.load(path) is None
+
+    def test_shared_snapshot(self, tmp_path):
+        path = tmp_path / "shared.cfig"
+        environment = shared_config.sources[0].environment
+        results = multiprocessing.Queue()
+        published = multiprocessing.Event()
+
+        with cfig.SharedSnapshot.create(path, size=4096) as shared:
+            assert shared.read() == (0, None)
+            assert shared.publish(cfig.Snapshot.take(shared_config)) == 2
+
+            worker = multiprocessing.Process(target=shared_worker, args=(path, results, published), daemon=True)
+            worker.start()
+            try:
+                published.set()
+                # The worker should have used the published value, without running the resolver
+                assert results.get(timeout=10) == (2, 1, [])
+
+                environment["SHARED_NUMBER"] = "2"
+                shared_config.proxies.unresolve()
+                assert shared.publish(cfig.Snapshot.take(shared_config)) == 4
+
+                published.set()
+                assert results.get(timeout=10) == (4, 2, [])
+            finally:
+                worker.terminate()
+                worker.join(timeout=10)
+                environment["SHARED_NUMBER"] = "1"
+                shared_config.proxies.unresolve()
+
+    def test_shared_snapshot_sync(self, numbers_config, monkeypatch, tmp_path):
+        monkeypatch.setenv("FIRST_NUMBER", "1")
+        monkeypatch.setenv("SECOND_NUMBER", "2")
+        path = tmp_path / "shared.cfig"
+
+        with cfig.SharedSnapshot.create(path) as shared, cfig.SharedSnapshot.attach(path) as attached:
+            assert not attached.sync(numbers_config)
+
+            shared.publish(cfig.Snapshot.take(numbers_config))
+            numbers_config.proxies.unresolve()
+            numbers_config.timings.clear()
+
+            assert attached.sync(numbers_config)
+            assert not attached.sync(numbers_config)
+            assert numbers_config.proxies["FIRST_NUMBER"] == 1
+            assert numbers_config.timings.keys() == set()
+
+    def test_shared_snapshot_too_large(self, numbers_config, monkeypatch, tmp_path):
+        monkeypatch.setenv("FIRST_NUMBER", "1")
+
+        with cfig.SharedSnapshot.create(tmp_path / "shared.cfig", size=32) as shared:
+            with pytest.raises(ValueError):
+                shared.publish(cfig.Snapshot.take(numbers_config))
+
+    def test_timings(self, numbers_config, monkeypatch):
+        monkeypatch.setenv("FIRST_NUMBER", "1")
+        monkeypatch.setenv("SECOND_NUMBER", "a")
+
+        events = []
+
+        class RecordingHook(cfig.Hook):
+            def on_resolve_start(self, key):
+                events.append(("start", key))
+
+            def on_resolve_end(self, key, timing):
+                events.append(("end", key, timing))
+
+        numbers_config.hooks.append(RecordingHook())
+
+        with pytest.raises(cfig.BatchResolutionFailure):
+            numbers_config.proxies.resolve()
+
+        first_timing = numbers_config.timings["FIRST_NUMBER"]
+        second_timing = numbers_config.timings["SECOND_NUMBER"]
+
+        assert events == [
+            ("start", "FIRST_NUMBER"),
+            ("end", "FIRST_NUMBER", first_timing),
+            ("start", "SECOND_NUMBER"),
+            ("end", "SECOND_NUMBER", second_timing),
+        ]
+
+        assert first_timing.source is numbers_config.sources[0]
+        assert first_timing.attempts == 1
+        assert first_timing.error is None
+        assert first_timing.total >= first_timing.retrieval >= 0
+
+        assert isinstance(second_timing.error, cfig.InvalidValueError)
+
+    @pytest.mark.skipif(click is None, reason="the `cli` extra is not installed")
+    def test_cli_timings(self, numbers_config, monkeypatch, click_runner):
+        monkeypatch.setenv("FIRST_NUMBER", "1")
+        monkeypatch.setenv("SECOND_NUMBER", "")
+
+        root = numbers_config._click_root()
+        result = click_runner.invoke(root, ["--timings"])
+
+        assert result.exit_code == 0
+        assert "Timings" in result.output
+        assert "EnvironmentSource" in result.output
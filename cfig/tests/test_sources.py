@@ -0,0 +1,605 @@
+import base64
+import hashlib
+import http.server
+import json
+import os
+import pytest
+import threading
+import typing as t
+import cfig
+import cfig.sources.base
+import cfig.sources.cached
+import cfig.sources.directory
+import cfig.sources.dotenv
+import cfig.sources.env
+import cfig.sources.envfile
+import cfig.sources.httpkv
+import cfig.sources.inifile
+import cfig.sources.jsonfile
+import cfig.sources.layered
+import cfig.sources.tomlfile
+
+
+class DictSource(cfig.sources.base.Source):
+    def __init__(self, values: dict[str, str]):
+        self.values: dict[str, str] = values
+        self.calls: list[str] = []
+
+    def get(self, key: str) -> t.Optional[str]:
+        self.calls.append(key)
+        return self.values.get(key)
+
+
+class TestCachedSource:
+    @pytest.fixture(scope="function")
+    def clock(self):
+        class Clock:
+            now = 0.0
+
+            def __call__(self):
+                return self.now
+
+        yield Clock()
+
+    @pytest.fixture(scope="function")
+    def inner(self):
+        yield DictSource({"FIRST": "1", "SECOND": "2", "THIRD": "3"})
+
+    def test_get(self, inner, clock):
+        source = cfig.sources.cached.CachedSource(inner, clock=clock)
+
+        assert source.get("FIRST") == "1"
+        assert source.get("FIRST") == "1"
+        assert inner.calls == ["FIRST"]
+
+    def test_ttl(self, inner, clock):
+        source = cfig.sources.cached.CachedSource(inner, ttl=10, clock=clock)
+
+        assert source.get("FIRST") == "1"
+        clock.now = 5
+        assert source.get("FIRST") == "1"
+        assert inner.calls == ["FIRST"]
+
+        inner.values["FIRST"] = "4"
+        clock.now = 10
+        assert source.get("FIRST") == "4"
+        assert inner.calls == ["FIRST", "FIRST"]
+
+    def test_lru(self, inner, clock):
+        source = cfig.sources.cached.CachedSource(inner, max_entries=2, clock=clock)
+
+        source.get("FIRST")
+        source.get("SECOND")
+        source.get("FIRST")
+        source.get("THIRD")
+
+        # SECOND was the least recently used, so it should have been evicted
+        source.get("FIRST")
+        source.get("SECOND")
+        assert inner.calls == ["FIRST", "SECOND", "THIRD", "SECOND"]
+
+    @pytest.mark.parametrize("cache_missing", [False, True])
+    def test_missing(self, inner, clock, cache_missing):
+        source = cfig.sources.cached.CachedSource(inner, cache_missing=cache_missing, clock=clock)
+
+        assert source.get("FOURTH") is None
+        assert source.get("FOURTH") is None
+        assert inner.calls == (["FOURTH"] if cache_missing else ["FOURTH", "FOURTH"])
+
+    def test_get_many(self, inner, clock):
+        source = cfig.sources.cached.CachedSource(inner, clock=clock)
+
+        assert source.get("FIRST") == "1"
+        assert source.get_many(["FIRST", "SECOND", "FOURTH"]) == {"FIRST": "1", "SECOND": "2", "FOURTH": None}
+        assert inner.calls == ["FIRST", "SECOND", "FOURTH"]
+
+    def test_invalidate(self, inner, clock):
+        source = cfig.sources.cached.CachedSource(inner, clock=clock)
+
+        source.get("FIRST")
+        source.get("SECOND")
+        source.invalidate("FIRST")
+        source.get("FIRST")
+        source.get("SECOND")
+        assert inner.calls == ["FIRST", "SECOND", "FIRST"]
+
+        source.invalidate()
+        source.get("SECOND")
+        assert inner.calls == ["FIRST", "SECOND", "FIRST", "SECOND"]
+
+
+class TestDotenvSource:
+    @pytest.fixture(scope="function")
+    def path(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_text(
+            "# A comment\n"
+            "UNQUOTED=value  # An inline comment\n"
+            "export EXPORTED=exported\n"
+            "SINGLE='literal $UNQUOTED \\n'\n"
+            'DOUBLE="first\\nsecond \\"quoted\\" \\$UNQUOTED"\n'
+            'MULTILINE="first\n'
+            'second"\n'
+            'INTERPOLATED="${UNQUOTED}, $EXPORTED, ${MISSING:-default} and $FROM_ENVIRONMENT"\n'
+            "EMPTY=\n"
+            "not an entry\n"
+        )
+        yield path
+
+    def test_parse(self, path):
+        source = cfig.sources.dotenv.DotenvSource(path, environment={"FROM_ENVIRONMENT": "environment"})
+
+        assert source.get("UNQUOTED") == "value"
+        assert source.get("EXPORTED") == "exported"
+        assert source.get("SINGLE") == "literal $UNQUOTED \\n"
+        assert source.get("DOUBLE") == 'first\nsecond "quoted" $UNQUOTED'
+        assert source.get("MULTILINE") == "first\nsecond"
+        assert source.get("INTERPOLATED") == "value, exported, default and environment"
+        assert source.get("EMPTY") == ""
+        assert source.get("MISSING") is None
+
+    def test_no_interpolation(self, path):
+        source = cfig.sources.dotenv.DotenvSource(path, environment={}, interpolate=False)
+
+        assert source.get("INTERPOLATED") == "${UNQUOTED}, $EXPORTED, ${MISSING:-default} and $FROM_ENVIRONMENT"
+
+    def test_mmap(self, path, monkeypatch):
+        monkeypatch.setattr(cfig.sources.dotenv.DotenvSource, "MMAP_THRESHOLD", 1)
+        source = cfig.sources.dotenv.DotenvSource(path, environment={})
+
+        assert source.get("MULTILINE") == "first\nsecond"
+
+    def test_reparse(self, path, monkeypatch):
+        source = cfig.sources.dotenv.DotenvSource(path, environment={})
+        parses = []
+        original = source._parse
+
+        def _parse(data):
+            parses.append(True)
+            return original(data)
+
+        monkeypatch.setattr(source, "_parse", _parse)
+
+        assert source.get_many(["UNQUOTED", "EXPORTED"]) == {"UNQUOTED": "value", "EXPORTED": "exported"}
+        assert source.get("UNQUOTED") == "value"
+        assert len(parses) == 1
+
+        path.write_text("UNQUOTED=changed\n")
+        os.utime(path, ns=(0, 0))
+
+        assert source.get("UNQUOTED") == "changed"
+        assert source.get("EXPORTED") is None
+        assert len(parses) == 2
+
+    def test_crlf(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_bytes(b"A=1\r\nB='two'\r\nC=\"three\" # comment\r\nD=four # comment\r\n")
+        source = cfig.sources.dotenv.DotenvSource(path, environment={})
+
+        assert source.get_many(["A", "B", "C", "D"]) == {"A": "1", "B": "two", "C": "three", "D": "four"}
+
+    def test_missing_file(self, tmp_path):
+        source = cfig.sources.dotenv.DotenvSource(tmp_path / "missing.env")
+
+        assert source.get("UNQUOTED") is None
+
+
+class TestStructuredFileSource:
+    def test_json(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text('{"database": {"uri": "postgres://", "pool": {"size": 5}}, "debug": true, "hosts": ["a", "b"], "null": null}')
+        source = cfig.sources.jsonfile.JsonSource(path)
+
+        assert source.get("DATABASE_URI") == "postgres://"
+        assert source.get("DATABASE_POOL_SIZE") == "5"
+        assert source.get("DEBUG") == "true"
+        assert source.get("HOSTS") == '["a", "b"]'
+        assert source.get("NULL") is None
+
+    def test_invalid(self, tmp_path, monkeypatch):
+        path = tmp_path / "config.json"
+        path.write_text('{"database": ')
+        source = cfig.sources.jsonfile.JsonSource(path)
+        parses = []
+        original = source._parse
+
+        def _parse(data):
+            parses.append(True)
+            return original(data)
+
+        monkeypatch.setattr(source, "_parse", _parse)
+
+        with pytest.raises(ValueError):
+            source.get("DATABASE")
+        with pytest.raises(ValueError):
+            source.get_many(["DATABASE"])
+        assert len(parses) == 1
+
+        path.write_text('{"database": "postgres://"}')
+        os.utime(path, ns=(0, 0))
+        assert source.get("DATABASE") == "postgres://"
+
+    def test_toml(self, tmp_path):
+        pytest.importorskip("tomllib")
+        path = tmp_path / "config.toml"
+        path.write_text('debug = false\n[database]\nuri = "postgres://"\n[database.pool]\nsize = 5\n')
+        source = cfig.sources.tomlfile.TomlSource(path, separator="__")
+
+        assert source.get_many(["DATABASE__URI", "DATABASE__POOL__SIZE", "DEBUG"]) == {"DATABASE__URI": "postgres://", "DATABASE__POOL__SIZE": "5", "DEBUG": "false"}
+
+    def test_ini(self, tmp_path):
+        path = tmp_path / "config.ini"
+        path.write_text("[DEFAULT]\nname = cfig\n[database]\nuri = postgres://%(name)s\nPoolSize = 5\n")
+        source = cfig.sources.inifile.IniSource(path, uppercase=False)
+
+        assert source.get("name") == "cfig"
+        assert source.get("database_uri") == "postgres://%(name)s"
+        assert source.get("database_PoolSize") == "5"
+        assert source.get("database_name") == "cfig"
+
+
+class TestDirectorySource:
+    @pytest.fixture(scope="function")
+    def path(self, tmp_path):
+        (tmp_path / "FIRST").write_text("1")
+        (tmp_path / "SECOND").write_text("2")
+        (tmp_path / ".hidden").write_text("hidden")
+        (tmp_path / "subdirectory").mkdir()
+        yield tmp_path
+
+    def test_get(self, path):
+        source = cfig.sources.directory.DirectorySource(path)
+
+        assert source.get("FIRST") == "1"
+        assert source.get("SECOND") == "2"
+        assert source.get(".hidden") is None
+        assert source.get("subdirectory") is None
+        assert source.get("THIRD") is None
+
+    def test_affixes(self, path):
+        (path / "app_THIRD.txt").write_text("3")
+        source = cfig.sources.directory.DirectorySource(path, prefix="app_", suffix=".txt")
+
+        assert source.get("THIRD") == "3"
+        assert source.get("FIRST") is None
+
+    def test_lazy(self, path):
+        source = cfig.sources.directory.DirectorySource(path)
+
+        assert source.get("FIRST") == "1"
+        (path / "FIRST").write_text("10")
+        assert source.get("FIRST") == "1"
+
+        source.invalidate("FIRST")
+        assert source.get("FIRST") == "10"
+
+    def test_rescan(self, path):
+        source = cfig.sources.directory.DirectorySource(path)
+
+        assert source.get("FIRST") == "1"
+        (path / "THIRD").write_text("3")
+        os.utime(path, ns=(0, 0))
+
+        assert source.get("THIRD") == "3"
+
+    def test_missing_directory(self, tmp_path):
+        source = cfig.sources.directory.DirectorySource(tmp_path / "missing")
+
+        assert source.get("FIRST") is None
+
+
+class KeyedDictSource(DictSource):
+    def keys(self) -> t.Optional[t.Collection[str]]:
+        return list(self.values.keys())
+
+
+class TestLayeredSources:
+    @pytest.fixture(scope="function")
+    def layers(self):
+        yield (
+            KeyedDictSource({"FIRST": "override"}),
+            KeyedDictSource({"FIRST": "", "SECOND": "2"}),
+            DictSource({"THIRD": "3"}),
+            KeyedDictSource({"FIRST": "1", "SECOND": "default", "FOURTH": "4"}),
+        )
+
+    def test_get(self, layers):
+        source = cfig.sources.layered.LayeredSources(layers)
+
+        assert source.get("FIRST") == "override"
+        assert source.get("SECOND") == "2"
+        assert source.get("THIRD") == "3"
+        assert source.get("FOURTH") == "4"
+        assert source.get("FIFTH") is None
+
+        # Only the layers containing a key, and the ones unable to enumerate their keys, should be queried,
+        # unless no layer able to enumerate its keys contains the key
+        assert layers[0].calls == ["FIRST", "THIRD", "FIFTH"]
+        assert layers[1].calls == ["SECOND", "THIRD", "FIFTH"]
+        assert layers[2].calls == ["THIRD", "FOURTH", "FIFTH"]
+        assert layers[3].calls == ["FOURTH", "FIFTH"]
+
+    def test_get_many(self, layers):
+        source = cfig.sources.layered.LayeredSources(layers)
+
+        assert source.get_many(["FIRST", "SECOND", "THIRD", "FOURTH", "FIFTH"]) == {"FIRST": "override", "SECOND": "2", "THIRD": "3", "FOURTH": "4"}
+        assert layers[0].calls == ["FIRST", "THIRD", "FIFTH"]
+        assert layers[3].calls == ["FOURTH", "FIFTH"]
+
+    def test_layer_of(self, layers):
+        source = cfig.sources.layered.LayeredSources(layers)
+
+        assert source.layer_of("FIRST") is layers[0]
+        assert source.layer_of("SECOND") is layers[1]
+        assert source.layer_of("THIRD") is layers[2]
+        assert source.layer_of("FIFTH") is None
+
+    def test_keys(self, layers):
+        assert cfig.sources.layered.LayeredSources(layers).keys() is None
+        assert sorted(cfig.sources.layered.LayeredSources([layers[0], layers[3]]).keys()) == ["FIRST", "FOURTH", "SECOND"]
+
+    def test_refresh(self, layers):
+        source = cfig.sources.layered.LayeredSources(layers)
+
+        # Keys missing from the index are looked up in all layers
+        assert source.get("FIFTH") is None
+        layers[3].values["FIFTH"] = "5"
+        assert source.get("FIFTH") == "5"
+
+        # Layers without a signature are indexed again only when refreshing
+        layers[0].values["FOURTH"] = "override"
+        assert source.get("FOURTH") == "4"
+        source.refresh()
+        assert source.get("FOURTH") == "override"
+
+    def test_signature(self, tmp_path):
+        path = tmp_path / ".env"
+        path.write_text("FIRST=dotenv\n")
+        environment = cfig.sources.env.EnvironmentSource(environment={"FIRST": "environment", "SECOND": "environment"})
+        source = cfig.sources.layered.LayeredSources([cfig.sources.dotenv.DotenvSource(path, environment={}), environment])
+
+        assert source.get("FIRST") == "dotenv"
+        assert source.get("SECOND") == "environment"
+
+        path.write_text("FIRST=dotenv\nSECOND=dotenv\n")
+        os.utime(path, ns=(0, 0))
+
+        assert source.get("SECOND") == "dotenv"
+        assert source.get_many(["SECOND"]) == {"SECOND": "dotenv"}
+
+    def test_environment_keys(self):
+        source = cfig.sources.env.EnvironmentSource(prefix="APP_", suffix="_VAL", environment={"APP_FIRST_VAL": "1", "APP_VAL": "", "OTHER": "2"})
+
+        assert source.keys() == ["FIRST"]
+
+
+class KVStub(http.server.ThreadingHTTPServer):
+    """
+    A local key-value store, serving its values Consul-style on every path.
+    """
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), KVStubHandler)
+        self.values: dict[str, str] = {}
+        self.index: int = 1
+        self.requests: list[tuple[str, int]] = []
+        self.connections: int = 0
+        self.consul: bool = False
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/v1/kv/"
+
+    def body(self, prefix: str) -> bytes:
+        values = {key: value for key, value in self.values.items() if key.startswith(prefix)}
+        if self.consul:
+            return json.dumps([{"Key": key, "Value": base64.b64encode(value.encode()).decode()} for key, value in values.items()]).encode()
+        return json.dumps(values).encode()
+
+
+class KVStubHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: KVStub
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        prefix = self.path.split("?")[0][len("/v1/kv/"):]
+        body = self.server.body(prefix)
+        etag = f'"{hashlib.sha1(body).hexdigest()}"'
+
+        if self.headers.get("If-None-Match") == etag:
+            status, body = 304, b""
+        else:
+            status = 200
+        self.server.requests.append((self.path, status))
+
+        self.send_response(status)
+        self.send_header("ETag", etag)
+        self.send_header("X-Consul-Index", str(self.server.index))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class TestHttpKVSource:
+    @pytest.fixture(scope="function")
+    def stub(self):
+        server = KVStub()
+        server.values = {"app/FIRST": "1", "app/SECOND": "2", "other/THIRD": "3"}
+        thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    def test_get(self, stub):
+        source = cfig.sources.httpkv.HttpKVSource(stub.url, prefix="app/")
+
+        assert source.get("FIRST") == "1"
+        assert source.get("THIRD") is None
+        assert source.get_many(["FIRST", "SECOND", "THIRD"]) == {"FIRST": "1", "SECOND": "2", "THIRD": None}
+        assert sorted(source.keys()) == ["FIRST", "SECOND"]
+        assert stub.requests == [("/v1/kv/app/?recurse", 200)]
+
+    def test_consul(self, stub):
+        stub.consul = True
+        source = cfig.sources.httpkv.HttpKVSource(stub.url, prefix="app/")
+
+        assert source.get_many(["FIRST", "SECOND"]) == {"FIRST": "1", "SECOND": "2"}
+
+    def test_refresh(self, stub):
+        source = cfig.sources.httpkv.HttpKVSource(stub.url, prefix="app/")
+        signature = source.signature()
+
+        source.refresh()
+        assert stub.requests[-1] == ("/v1/kv/app/?recurse", 304)
+        assert source.signature() == signature
+
+        stub.values["app/FIRST"] = "4"
+        stub.index += 1
+        source.refresh()
+        assert source.get("FIRST") == "4"
+        assert source.signature() != signature
+
+        # Responses with the same index are not parsed again
+        stub.values["app/FIRST"] = "5"
+        source.refresh()
+        assert source.get("FIRST") == "4"
+
+        assert stub.connections == 1
+
+    def test_ttl(self, stub):
+        now = [0.0]
+        source = cfig.sources.httpkv.HttpKVSource(stub.url, prefix="app/", ttl=10, clock=lambda: now[0])
+
+        assert source.get("FIRST") == "1"
+        stub.values["app/FIRST"] = "4"
+        stub.index += 1
+        now[0] = 5
+        assert source.get("FIRST") == "1"
+        now[0] = 10
+        assert source.get("FIRST") == "4"
+        assert len(stub.requests) == 2
+
+    def test_reconnect(self, stub):
+        source = cfig.sources.httpkv.HttpKVSource(stub.url, prefix="app/")
+        assert source.get("FIRST") == "1"
+
+        # Simulate the store closing the idle keep-alive connection
+        source._connection.sock.close()
+        stub.index += 1
+        source.refresh()
+
+        assert [status for _path, status in stub.requests] == [200, 304]
+        assert stub.connections == 2
+
+    def test_unreachable(self, stub):
+        source = cfig.sources.httpkv.HttpKVSource(stub.url, prefix="app/", timeout=1)
+        assert source.get("FIRST") == "1"
+
+        source.close()
+        stub.shutdown()
+        stub.server_close()
+
+        source.refresh()
+        assert source.get("FIRST") == "1"
+
+        with pytest.raises(OSError):
+            cfig.sources.httpkv.HttpKVSource(stub.url, prefix="app/", timeout=1).get("FIRST")
+
+    def test_configuration(self, stub):
+        source = cfig.sources.httpkv.HttpKVSource(stub.url, prefix="app/")
+        config = cfig.Configuration(sources=[source])
+
+        @config.required()
+        def FIRST(val: str) -> int:
+            return int(val)
+
+        @config.required()
+        def SECOND(val: str) -> int:
+            return int(val)
+
+        assert config.proxies.resolve() == {"FIRST": 1, "SECOND": 2}
+        assert FIRST == 1
+        assert len(stub.requests) == 1
+
+        stub.values["app/SECOND"] = "4"
+        stub.index += 1
+        assert config.reload() == {"SECOND": 4}
+        assert len(stub.requests) == 2
+
+
+class TestWatch:
+    @pytest.fixture(scope="function")
+    def stopping(self):
+        stopping = threading.Event()
+        # Do not block forever if a change is not detected
+        timer = threading.Timer(5, stopping.set)
+        timer.start()
+        yield stopping
+        stopping.set()
+        timer.cancel()
+
+    def test_unsupported(self, stopping):
+        assert DictSource({}).watch(["FIRST"], stopping=stopping) is None
+
+    def test_dotenv(self, tmp_path, stopping):
+        path = tmp_path / ".env"
+        path.write_text("FIRST=1\nSECOND=2\nTHIRD=3\n")
+        source = cfig.sources.dotenv.DotenvSource(path, environment={})
+        changes = source.watch(["FIRST", "SECOND"], interval=0.01, stopping=stopping)
+
+        path.write_text("FIRST=1\nSECOND=4\nTHIRD=5\n")
+        os.utime(path, ns=(0, 0))
+
+        assert next(changes) == ("SECOND", "4")
+        stopping.set()
+        assert list(changes) == []
+
+    def test_directory(self, tmp_path, stopping):
+        (tmp_path / "FIRST").write_text("1")
+        source = cfig.sources.directory.DirectorySource(tmp_path)
+        changes = source.watch(["FIRST", "SECOND"], interval=0.01, stopping=stopping)
+        assert source.get("FIRST") == "1"
+
+        (tmp_path / "FIRST").write_text("10")
+        os.utime(tmp_path / "FIRST", ns=(0, 0))
+        assert next(changes) == ("FIRST", "10")
+        assert source.get("FIRST") == "10"
+
+        (tmp_path / "SECOND").write_text("2")
+        assert next(changes) == ("SECOND", "2")
+
+    def test_envfile(self, tmp_path, stopping):
+        path = tmp_path / "first.txt"
+        path.write_text("1")
+        environment = {"FIRST_FILE": str(path)}
+        source = cfig.sources.envfile.EnvironmentFileSource(environment=environment)
+        changes = source.watch(["FIRST"], interval=0.01, stopping=stopping)
+
+        path.write_text("10")
+        os.utime(path, ns=(0, 0))
+        assert next(changes) == ("FIRST", "10")
+
+        del environment["FIRST_FILE"]
+        assert next(changes) == ("FIRST", None)
+
+    def test_cached(self, tmp_path, stopping):
+        path = tmp_path / ".env"
+        path.write_text("FIRST=1\n")
+        source = cfig.sources.cached.CachedSource(cfig.sources.dotenv.DotenvSource(path, environment={}))
+        changes = source.watch(["FIRST"], interval=0.01, stopping=stopping)
+        assert source.get("FIRST") == "1"
+
+        path.write_text("FIRST=10\n")
+        os.utime(path, ns=(0, 0))
+        assert next(changes) == ("FIRST", "10")
+        assert source.get("FIRST") == "10"
+
+        assert cfig.sources.cached.CachedSource(DictSource({})).watch(["FIRST"], stopping=stopping) is None